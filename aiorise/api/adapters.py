@@ -0,0 +1,24 @@
+from pydantic import TypeAdapter
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from aiorise.events.event_types import AnyEvent
+
+    event_adapter: TypeAdapter[AnyEvent]
+
+
+# The union is discriminated on `_type`, so validation is a single tag lookup
+# followed by one model build. Building the adapter compiles a core schema
+# for every member of the union, which is why it is created once, on first
+# access, and shared.
+# Responses need no adapter: every client method knows the model it expects
+# and validates into it directly.
+def __getattr__(name: str) -> Any:
+    if name == "event_adapter":
+        from aiorise.events.event_types import AnyEvent
+        adapter = TypeAdapter(AnyEvent)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = adapter
+    return adapter
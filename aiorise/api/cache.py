@@ -0,0 +1,230 @@
+from .client_methods import HighriseWebApiMethods
+from .flight import SingleFlight
+from aiorise.events.event_types import AnyEvent
+
+from collections import Counter, OrderedDict
+from typing import Any, Callable, Mapping
+
+import functools
+import inspect
+import time
+
+
+# Read method -> (ttl in seconds, max entries)
+DEFAULT_POLICIES: dict[str, tuple[float, int]] = {
+    "get_user_outfit": (300, 1024),
+    "get_room_privilege": (120, 1024),
+    "get_wallet": (30, 1),
+    "get_inventory": (120, 1),
+    "check_voice_chat": (10, 1),
+}
+
+# Event -> read methods whose entries it makes stale
+EVENT_INVALIDATES: dict[str, tuple[str, ...]] = {
+    "TipReactionEvent": ("get_wallet",),
+    "VoiceEvent": ("check_voice_chat",),
+}
+
+# Write method -> (read method, argument keying the stale entry or None for all)
+CALL_INVALIDATES: dict[str, tuple[tuple[str, str | None], ...]] = {
+    "change_room_privilege": (("get_room_privilege", "user_id"),),
+    "invite_speaker": (("check_voice_chat", None),),
+    "remove_speaker": (("check_voice_chat", None),),
+    "buy_voice_time": (("get_wallet", None), ("check_voice_chat", None)),
+    "buy_room_boost": (("get_wallet", None),),
+    "tip_user": (("get_wallet", None), ("get_inventory", None)),
+    "buy_item": (("get_wallet", None), ("get_inventory", None)),
+    "set_outfit": (("get_user_outfit", None), ("get_inventory", None)),
+}
+
+
+class ResponseCache:
+    """Per-method TTL + LRU cache for idempotent API reads.
+
+    Entries are dropped once their ttl passes, when a method holds more
+    than its max entries (least recently used first), or when an event or
+    a write call listed in EVENT_INVALIDATES / CALL_INVALIDATES says they
+    are stale (see CachedApiMethods). Cached responses are shared between
+    callers, treat them as read-only.
+    """
+
+    _policies: dict[str, tuple[float, int]]
+    _entries: dict[str, OrderedDict[tuple, tuple[float, Any]]]
+    _clock: Callable[[], float]
+
+    hits: Counter[str]
+    misses: Counter[str]
+    invalidations: Counter[str]
+    generations: Counter[str]
+
+    def __init__(
+        self,
+        policies: Mapping[str, tuple[float, int] | None] | None = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        # None in `policies` turns caching off for that method
+        merged = DEFAULT_POLICIES | dict(policies or {})
+        self._policies = {name: policy for name, policy in merged.items() if policy is not None}
+        self._entries = {name: OrderedDict() for name in self._policies}
+        self._clock = clock
+
+        self.hits = Counter()
+        self.misses = Counter()
+        self.invalidations = Counter()
+        self.generations = Counter()
+
+
+    def get(self, method: str, key: tuple) -> tuple[bool, Any]:
+        if (entries := self._entries.get(method)) is None:
+            return False, None
+
+        if (entry := entries.get(key)) is not None:
+            expires, value = entry
+            if expires > self._clock():
+                entries.move_to_end(key)
+                self.hits[method] += 1
+                return True, value
+            del entries[key]
+
+        self.misses[method] += 1
+        return False, None
+
+
+    def put(self, method: str, key: tuple, value: Any) -> None:
+        if (entries := self._entries.get(method)) is None:
+            return
+
+        ttl, maxsize = self._policies[method]
+        entries[key] = (self._clock() + ttl, value)
+        entries.move_to_end(key)
+        while len(entries) > maxsize:
+            entries.popitem(last=False)
+
+
+    def invalidate(self, method: str, key: tuple | None = None) -> None:
+        # Bumped even when nothing is cached, a response already in flight
+        # must not be stored once it lands
+        self.generations[method] += 1
+        if not (entries := self._entries.get(method)):
+            return
+
+        if key is None:
+            entries.clear()
+        elif entries.pop(key, None) is None:
+            return
+        self.invalidations[method] += 1
+
+
+    def clear(self) -> None:
+        for entries in self._entries.values():
+            entries.clear()
+
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        return {
+            method: {
+                "hits": self.hits[method],
+                "misses": self.misses[method],
+                "invalidations": self.invalidations[method],
+                "size": len(entries),
+            }
+            for method, entries in self._entries.items()
+        }
+
+
+def _arguments(signature: inspect.Signature, args: tuple, kwargs: dict) -> dict[str, Any]:
+    bound = signature.bind(None, *args, **kwargs)
+    bound.apply_defaults()
+    arguments = bound.arguments
+    arguments.pop(next(iter(signature.parameters)))
+    return arguments
+
+
+def _reading(method: Callable) -> Callable:
+    name = method.__name__
+    signature = inspect.signature(method)
+    # Fire-and-forget requests have nothing to share, every caller must send
+    if signature.return_annotation is None:
+        raise TypeError(f"{name} does not await a response")
+
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        cache, flight = self._cache, self._flight
+        if cache is None and flight is None:
+            return await method(self, *args, **kwargs)
+
+        # Keyed by bound arguments, so positional and keyword calls share entries
+        key = tuple(_arguments(signature, args, kwargs).values()) if args or kwargs else ()
+
+        if cache is not None:
+            found, value = cache.get(name, key)
+            if found:
+                return value
+            generation = cache.generations[name]
+
+        if flight is not None:
+            value = await flight.do(name, key, lambda: method(self, *args, **kwargs))
+        else:
+            value = await method(self, *args, **kwargs)
+
+        if cache is not None and cache.generations[name] == generation:
+            cache.put(name, key, value)
+        return value
+
+    return wrapper
+
+
+def _invalidating(method: Callable) -> Callable:
+    name = method.__name__
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        try:
+            return await method(self, *args, **kwargs)
+        finally:
+            # Even a failed write may have been applied server side
+            if self._cache is not None or self._flight is not None:
+                arguments = _arguments(signature, args, kwargs)
+                for target, argument in CALL_INVALIDATES.get(name, ()):
+                    self._invalidate(target, None if argument is None else (arguments[argument],))
+
+    return wrapper
+
+
+class CachedApiMethods(HighriseWebApiMethods):
+    _cache: ResponseCache | None
+    _flight: SingleFlight | None
+
+    get_user_outfit = _reading(HighriseWebApiMethods.get_user_outfit)
+    get_room_privilege = _reading(HighriseWebApiMethods.get_room_privilege)
+    get_wallet = _reading(HighriseWebApiMethods.get_wallet)
+    get_inventory = _reading(HighriseWebApiMethods.get_inventory)
+    check_voice_chat = _reading(HighriseWebApiMethods.check_voice_chat)
+    get_room_users = _reading(HighriseWebApiMethods.get_room_users)
+    get_messages = _reading(HighriseWebApiMethods.get_messages)
+    get_conversations = _reading(HighriseWebApiMethods.get_conversations)
+
+    change_room_privilege = _invalidating(HighriseWebApiMethods.change_room_privilege)
+    invite_speaker = _invalidating(HighriseWebApiMethods.invite_speaker)
+    remove_speaker = _invalidating(HighriseWebApiMethods.remove_speaker)
+    buy_voice_time = _invalidating(HighriseWebApiMethods.buy_voice_time)
+    buy_room_boost = _invalidating(HighriseWebApiMethods.buy_room_boost)
+    tip_user = _invalidating(HighriseWebApiMethods.tip_user)
+    buy_item = _invalidating(HighriseWebApiMethods.buy_item)
+    set_outfit = _invalidating(HighriseWebApiMethods.set_outfit)
+
+
+    def _invalidate(self, method: str, key: tuple | None = None) -> None:
+        if self._cache is not None:
+            self._cache.invalidate(method, key)
+        # A response already in flight predates the change, later callers
+        # must not join it
+        if self._flight is not None:
+            self._flight.forget(method)
+
+
+    def _observe(self, e: AnyEvent) -> None:
+        # By name, so lazy events are not materialized
+        for method in EVENT_INVALIDATES.get(e.__class__.__name__, ()):
+            self._invalidate(method)
@@ -1,21 +1,95 @@
-from .client_methods import HighriseWebApiMethods
+from . import adapters
+from .cache import CachedApiMethods, ResponseCache
+from .flight import SingleFlight
+from .pages import paginate
 from aiorise.connection import BaseApiConnection
 from aiorise.events.event_types import AnyEvent
-from aiorise.events.event_wrapper import EventWrapper
+from aiorise.events.lazy_event import LazyEvent
+from aiorise.objects.object_types import Conversation, Message
 
-from typing import AsyncIterable
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Container, Literal
 
-class HighriseWebApiClient(HighriseWebApiMethods):
+class HighriseWebApiClient(CachedApiMethods):
     _connection: BaseApiConnection
+    _decode_event: Callable[[str | bytes | dict], Any] | None
+    _cache: ResponseCache | None
+    _flight: SingleFlight | None
 
-    def __init__(self, connection: BaseApiConnection):
+    models: Literal["pydantic", "msgspec"]
+
+    def __init__(
+        self,
+        connection: BaseApiConnection,
+        models: Literal["pydantic", "msgspec"] = "pydantic",
+        cache: ResponseCache | None = None,
+        single_flight: bool = False
+    ):
         self._connection = connection
+        self.models = models
+        self._cache = cache
+        self._flight = SingleFlight() if single_flight else None
+
+        if models == "msgspec":
+            # msgspec is optional, only needed when events are decoded into structs
+            from aiorise.structs.adapters import decode_event
+            self._decode_event = decode_event
+        elif models == "pydantic":
+            self._decode_event = None
+        else:
+            raise ValueError(f"Unknown model family {models!r}")
+
+
+    @property
+    def cache(self) -> ResponseCache | None:
+        return self._cache
+
+
+    @property
+    def flight(self) -> SingleFlight | None:
+        return self._flight
 
 
     async def connect(self) -> None:
         await self._connection.connect()
 
-    async def listen(self) -> AsyncIterable[AnyEvent]:
-        async for event in self._connection.listen(): # type: ignore
-            yield EventWrapper.model_validate({'data': event}).data
-            
+    async def close(self) -> None:
+        await self._connection.close()
+
+    async def listen(
+        self,
+        types: Container[str] | None = None,
+        lazy: bool = False
+    ) -> AsyncIterable[AnyEvent]:
+        async for event_type, frame in self._connection.listen_raw(types): # type: ignore
+            if self._decode_event is not None:
+                event = self._decode_event(frame)
+            elif lazy:
+                event = LazyEvent(event_type, frame) # type: ignore
+            elif isinstance(frame, dict):
+                event = adapters.event_adapter.validate_python(frame)
+            else:
+                event = adapters.event_adapter.validate_json(frame)
+
+            if self._cache is not None or self._flight is not None:
+                self._observe(event)
+            yield event
+
+
+    def iter_messages(self, conversation_id: str, lookahead: int = 1) -> AsyncIterator[Message]:
+        """Every message of a conversation, following `last_message_id` across pages."""
+        async def fetch(last_message_id: str | None) -> list[Message]:
+            return (await self.get_messages(conversation_id, last_message_id)).messages
+
+        return paginate(fetch, lambda message: message.message_id, lookahead)
+
+
+    def iter_conversations(
+        self,
+        not_joined: bool | None = None,
+        lookahead: int = 1
+    ) -> AsyncIterator[Conversation]:
+        """Every conversation of the bot, following `last_id` across pages."""
+        async def fetch(last_id: str | None) -> list[Conversation]:
+            return (await self.get_conversations(not_joined, last_id)).conversations
+
+        return paginate(fetch, lambda conversation: conversation.id, lookahead)
@@ -1,6 +1,16 @@
 from aiorise.api.response_types import *
-from aiorise.api.request_types import *
 from aiorise.api.protocols import HaveApiConnection
+from aiorise.connection.scheduler import Priority
+from aiorise.api import debug
+from aiorise.connection.template import FrameTemplate
+
+KEEPALIVE_REQUEST_FRAME = FrameTemplate("KeepaliveRequest")
+FLOOR_HIT_REQUEST_FRAME = FrameTemplate("FloorHitRequest")
+GET_ROOM_USERS_REQUEST_FRAME = FrameTemplate("GetRoomUsersRequest")
+GET_WALLET_REQUEST_FRAME = FrameTemplate("GetWalletRequest")
+ANCHOR_HIT_REQUEST_FRAME = FrameTemplate("AnchorHitRequest")
+CHECK_VOICE_CHAT_REQUEST_FRAME = FrameTemplate("CheckVoiceChatRequest")
+GET_INVENTORY_REQUEST_FRAME = FrameTemplate("GetInventoryRequest")
 
 
 class HighriseWebApiMethods:
@@ -11,14 +21,16 @@ class HighriseWebApiMethods:
 
         The chat message will be broadcast to everyone in the room, or whispered to `whisper_target_id` if provided.
         """
-        request = ChatRequest.model_validate(
-            {
-                "_type": "ChatRequest",
-                "message": message,
-                "whisper_target_id": whisper_target_id,
-            }
-        )
-        await self._connection.send(request.model_dump(), False)
+        request = {
+            "_type": "ChatRequest",
+            "message": message,
+            "whisper_target_id": whisper_target_id,
+        }
+        if debug.validate_requests:
+            from aiorise.api.request_types import ChatRequest
+
+            ChatRequest.model_validate(request)
+        await self._connection.send(request, False, priority=Priority.CHAT)
 
     async def channel(
         self: HaveApiConnection, message: str, tags: list[str] | None = None
@@ -27,11 +39,13 @@ class HighriseWebApiMethods:
 
         This message not be displayed in the chat, so it can be used to
         communicate between bots or client-side scripts."""
-        request = ChannelRequest.model_validate(
-            {"_type": "ChannelRequest", "message": message, "tags": tags}
-        )
+        request = {"_type": "ChannelRequest", "message": message, "tags": tags}
+        if debug.validate_requests:
+            from aiorise.api.request_types import ChannelRequest
+
+            ChannelRequest.model_validate(request)
         return ChannelResponse.model_validate(
-            await self._connection.send(request.model_dump())
+            await self._connection.send(request, priority=Priority.CHAT)
         )
 
     async def emote(
@@ -48,15 +62,17 @@ class HighriseWebApiMethods:
 
         `target_user_id` can be provided if the emote can be directed toward a player.
         """
-        request = EmoteRequest.model_validate(
-            {
-                "_type": "EmoteRequest",
-                "emote_id": emote_id,
-                "target_user_id": target_user_id,
-            }
-        )
+        request = {
+            "_type": "EmoteRequest",
+            "emote_id": emote_id,
+            "target_user_id": target_user_id,
+        }
+        if debug.validate_requests:
+            from aiorise.api.request_types import EmoteRequest
+
+            EmoteRequest.model_validate(request)
         return EmoteResponse.model_validate(
-            await self._connection.send(request.model_dump())
+            await self._connection.send(request, priority=Priority.CHAT)
         )
 
     async def reaction(
@@ -65,15 +81,17 @@ class HighriseWebApiMethods:
         target_user_id: str,
     ) -> ReactionResponse:
         """Send a reaction to a user."""
-        request = ReactionRequest.model_validate(
-            {
-                "_type": "ReactionRequest",
-                "reaction": reaction,
-                "target_user_id": target_user_id,
-            }
-        )
+        request = {
+            "_type": "ReactionRequest",
+            "reaction": reaction,
+            "target_user_id": target_user_id,
+        }
+        if debug.validate_requests:
+            from aiorise.api.request_types import ReactionRequest
+
+            ReactionRequest.model_validate(request)
         return ReactionResponse.model_validate(
-            await self._connection.send(request.model_dump())
+            await self._connection.send(request, priority=Priority.CHAT)
         )
 
     async def keepalive(self: HaveApiConnection) -> KeepaliveResponse:
@@ -81,41 +99,47 @@ class HighriseWebApiMethods:
 
         This must be sent every 15 seconds or the server will terminate the connection.
         """
-        request = KeepaliveRequest.model_validate({"_type": "KeepaliveRequest"})
         return KeepaliveResponse.model_validate(
-            await self._connection.send(request.model_dump())
+            await self._connection.send_template(
+                KEEPALIVE_REQUEST_FRAME, priority=Priority.CONTROL
+            )
         )
 
     async def teleport(self: HaveApiConnection, user_id: str) -> TeleportResponse:
         """Teleport the provided `user_id` to the provided `destination`."""
-        request = TeleportRequest.model_validate(
-            {"_type": "TeleportRequest", "user_id": user_id}
-        )
+        request = {"_type": "TeleportRequest", "user_id": user_id}
+        if debug.validate_requests:
+            from aiorise.api.request_types import TeleportRequest
+
+            TeleportRequest.model_validate(request)
         return TeleportResponse.model_validate(
-            await self._connection.send(request.model_dump())
+            await self._connection.send(request, priority=Priority.REQUEST)
         )
 
     async def floor_hit(self: HaveApiConnection) -> FloorHitResponse:
         """Move the bot to the given `destination`."""
-        request = FloorHitRequest.model_validate({"_type": "FloorHitRequest"})
         return FloorHitResponse.model_validate(
-            await self._connection.send(request.model_dump())
+            await self._connection.send_template(
+                FLOOR_HIT_REQUEST_FRAME, priority=Priority.REQUEST
+            )
         )
 
     async def get_room_users(self: HaveApiConnection) -> GetRoomUsersResponse:
         """Fetch the list of users currently in the room, with their positions."""
-        request = GetRoomUsersRequest.model_validate({"_type": "GetRoomUsersRequest"})
         return GetRoomUsersResponse.model_validate(
-            await self._connection.send(request.model_dump())
+            await self._connection.send_template(
+                GET_ROOM_USERS_REQUEST_FRAME, priority=Priority.REQUEST
+            )
         )
 
     async def get_wallet(self: HaveApiConnection) -> GetWalletResponse:
         """Fetch the bot's wallet.
 
         The wallet contains Highrise currencies."""
-        request = GetWalletRequest.model_validate({"_type": "GetWalletRequest"})
         return GetWalletResponse.model_validate(
-            await self._connection.send(request.model_dump())
+            await self._connection.send_template(
+                GET_WALLET_REQUEST_FRAME, priority=Priority.REQUEST
+            )
         )
 
     async def moderate_room(
@@ -127,27 +151,31 @@ class HighriseWebApiMethods:
         """Moderate the room.
 
         This can be used to kick, ban, unban, or mute a user."""
-        request = ModerateRoomRequest.model_validate(
-            {
-                "_type": "ModerateRoomRequest",
-                "user_id": user_id,
-                "moderation_action": moderation_action,
-                "action_length": action_length,
-            }
-        )
+        request = {
+            "_type": "ModerateRoomRequest",
+            "user_id": user_id,
+            "moderation_action": moderation_action,
+            "action_length": action_length,
+        }
+        if debug.validate_requests:
+            from aiorise.api.request_types import ModerateRoomRequest
+
+            ModerateRoomRequest.model_validate(request)
         return ModerateRoomResponse.model_validate(
-            await self._connection.send(request.model_dump())
+            await self._connection.send(request, priority=Priority.MODERATION)
         )
 
     async def get_room_privilege(
         self: HaveApiConnection, user_id: str
     ) -> GetRoomPrivilegeResponse:
         """Fetch the room privileges for provided `user_id`."""
-        request = GetRoomPrivilegeRequest.model_validate(
-            {"_type": "GetRoomPrivilegeRequest", "user_id": user_id}
-        )
+        request = {"_type": "GetRoomPrivilegeRequest", "user_id": user_id}
+        if debug.validate_requests:
+            from aiorise.api.request_types import GetRoomPrivilegeRequest
+
+            GetRoomPrivilegeRequest.model_validate(request)
         return GetRoomPrivilegeResponse.model_validate(
-            await self._connection.send(request.model_dump())
+            await self._connection.send(request, priority=Priority.REQUEST)
         )
 
     async def change_room_privilege(
@@ -158,71 +186,87 @@ class HighriseWebApiMethods:
 
         Bots have to be in the room to change privileges.
         Bots are using their owner's privileges."""
-        request = ChangeRoomPrivilegeRequest.model_validate(
-            {"_type": "ChangeRoomPrivilegeRequest", "user_id": user_id}
-        )
+        request = {"_type": "ChangeRoomPrivilegeRequest", "user_id": user_id}
+        if debug.validate_requests:
+            from aiorise.api.request_types import ChangeRoomPrivilegeRequest
+
+            ChangeRoomPrivilegeRequest.model_validate(request)
         return ChangeRoomPrivilegeResponse.model_validate(
-            await self._connection.send(request.model_dump())
+            await self._connection.send(request, priority=Priority.MODERATION)
         )
 
     async def move_user_to_room(
         self: HaveApiConnection, user_id: str, room_id: str
     ) -> MoveUserToRoomResponse:
         """Move the provided `user_id` to the provided `room_id`."""
-        request = MoveUserToRoomRequest.model_validate(
-            {"_type": "MoveUserToRoomRequest", "user_id": user_id, "room_id": room_id}
-        )
+        request = {
+            "_type": "MoveUserToRoomRequest",
+            "user_id": user_id,
+            "room_id": room_id,
+        }
+        if debug.validate_requests:
+            from aiorise.api.request_types import MoveUserToRoomRequest
+
+            MoveUserToRoomRequest.model_validate(request)
         return MoveUserToRoomResponse.model_validate(
-            await self._connection.send(request.model_dump())
+            await self._connection.send(request, priority=Priority.MODERATION)
         )
 
     async def anchor_hit(self: HaveApiConnection) -> AnchorHitResponse:
         """Move the bot to the given furniture Anchor Position."""
-        request = AnchorHitRequest.model_validate({"_type": "AnchorHitRequest"})
         return AnchorHitResponse.model_validate(
-            await self._connection.send(request.model_dump())
+            await self._connection.send_template(
+                ANCHOR_HIT_REQUEST_FRAME, priority=Priority.REQUEST
+            )
         )
 
     async def invite_speaker(self: HaveApiConnection, user_id: str) -> None:
         """Invite a user to speak in the room."""
-        request = InviteSpeakerRequest.model_validate(
-            {"_type": "InviteSpeakerRequest", "user_id": user_id}
-        )
-        await self._connection.send(request.model_dump(), False)
+        request = {"_type": "InviteSpeakerRequest", "user_id": user_id}
+        if debug.validate_requests:
+            from aiorise.api.request_types import InviteSpeakerRequest
+
+            InviteSpeakerRequest.model_validate(request)
+        await self._connection.send(request, False, priority=Priority.MODERATION)
 
     async def remove_speaker(self: HaveApiConnection, user_id: str) -> None:
         """Remove a user from speaking in the room."""
-        request = RemoveSpeakerRequest.model_validate(
-            {"_type": "RemoveSpeakerRequest", "user_id": user_id}
-        )
-        await self._connection.send(request.model_dump(), False)
+        request = {"_type": "RemoveSpeakerRequest", "user_id": user_id}
+        if debug.validate_requests:
+            from aiorise.api.request_types import RemoveSpeakerRequest
+
+            RemoveSpeakerRequest.model_validate(request)
+        await self._connection.send(request, False, priority=Priority.MODERATION)
 
     async def check_voice_chat(self: HaveApiConnection) -> CheckVoiceChatResponse:
         """Check the voice chat status in the room."""
-        request = CheckVoiceChatRequest.model_validate(
-            {"_type": "CheckVoiceChatRequest"}
-        )
         return CheckVoiceChatResponse.model_validate(
-            await self._connection.send(request.model_dump())
+            await self._connection.send_template(
+                CHECK_VOICE_CHAT_REQUEST_FRAME, priority=Priority.REQUEST
+            )
         )
 
     async def get_user_outfit(
         self: HaveApiConnection, user_id: str
     ) -> GetUserOutfitResponse:
         """Get the outfit of a user."""
-        request = GetUserOutfitRequest.model_validate(
-            {"_type": "GetUserOutfitRequest", "user_id": user_id}
-        )
+        request = {"_type": "GetUserOutfitRequest", "user_id": user_id}
+        if debug.validate_requests:
+            from aiorise.api.request_types import GetUserOutfitRequest
+
+            GetUserOutfitRequest.model_validate(request)
         return GetUserOutfitResponse.model_validate(
-            await self._connection.send(request.model_dump())
+            await self._connection.send(request, priority=Priority.REQUEST)
         )
 
     async def get_backpack(self: HaveApiConnection, user_id: str) -> None:
         """Fetch a user's world backpack."""
-        request = GetBackpackRequest.model_validate(
-            {"_type": "GetBackpackRequest", "user_id": user_id}
-        )
-        await self._connection.send(request.model_dump(), False)
+        request = {"_type": "GetBackpackRequest", "user_id": user_id}
+        if debug.validate_requests:
+            from aiorise.api.request_types import GetBackpackRequest
+
+            GetBackpackRequest.model_validate(request)
+        await self._connection.send(request, False, priority=Priority.REQUEST)
 
     async def get_messages(
         self: HaveApiConnection,
@@ -232,15 +276,17 @@ class HighriseWebApiMethods:
         """Get the messages of a conversation. 20 messages will be returned at most, if all 20 messages are returned, the
         last_message_id can be used to retrieve the next 20 messages. conversation_id must be provided.
         """
-        request = GetMessagesRequest.model_validate(
-            {
-                "_type": "GetMessagesRequest",
-                "conversation_id": conversation_id,
-                "last_message_id": last_message_id,
-            }
-        )
+        request = {
+            "_type": "GetMessagesRequest",
+            "conversation_id": conversation_id,
+            "last_message_id": last_message_id,
+        }
+        if debug.validate_requests:
+            from aiorise.api.request_types import GetMessagesRequest
+
+            GetMessagesRequest.model_validate(request)
         return GetMessagesResponse.model_validate(
-            await self._connection.send(request.model_dump())
+            await self._connection.send(request, priority=Priority.REQUEST)
         )
 
     async def send_message(
@@ -251,17 +297,15 @@ class HighriseWebApiMethods:
         room_id: str | None = None,
     ) -> SendMessageResponse:
         """Send a message to a conversation. If bot wishes to send room invite, the room_id must be provided."""
-        request = SendMessageRequest.model_validate(
-            {
-                "_type": "SendMessageRequest",
-                "conversation_id": conversation_id,
-                "content": content,
-                "type": type,
-                "room_id": room_id,
-            }
-        )
+        request = {
+            "_type": "SendMessageRequest",
+            "conversation_id": conversation_id,
+            "content": content,
+            "type": type,
+            "room_id": room_id,
+        }
         return SendMessageResponse.model_validate(
-            await self._connection.send(request.model_dump())
+            await self._connection.send(request, priority=Priority.CHAT)
         )
 
     async def get_conversations(
@@ -272,26 +316,33 @@ class HighriseWebApiMethods:
         """Get the conversations of a bat. if not_joined is true, only get the conversations that bot has not joined yet will
         be returned. 20 conversations will be returned at most, if all 20 conversations are returned, the last_id can be used
         to retrieve the next 20 conversations."""
-        request = GetConversationsRequest.model_validate(
-            {
-                "_type": "GetConversationsRequest",
-                "not_joined": not_joined,
-                "last_id": last_id,
-            }
-        )
+        request = {
+            "_type": "GetConversationsRequest",
+            "not_joined": not_joined,
+            "last_id": last_id,
+        }
+        if debug.validate_requests:
+            from aiorise.api.request_types import GetConversationsRequest
+
+            GetConversationsRequest.model_validate(request)
         return GetConversationsResponse.model_validate(
-            await self._connection.send(request.model_dump())
+            await self._connection.send(request, priority=Priority.REQUEST)
         )
 
     async def leave_conversation(
         self: HaveApiConnection, conversation_id: str
     ) -> LeaveConversationResponse:
         """Leave a conversation."""
-        request = LeaveConversationRequest.model_validate(
-            {"_type": "LeaveConversationRequest", "conversation_id": conversation_id}
-        )
+        request = {
+            "_type": "LeaveConversationRequest",
+            "conversation_id": conversation_id,
+        }
+        if debug.validate_requests:
+            from aiorise.api.request_types import LeaveConversationRequest
+
+            LeaveConversationRequest.model_validate(request)
         return LeaveConversationResponse.model_validate(
-            await self._connection.send(request.model_dump())
+            await self._connection.send(request, priority=Priority.REQUEST)
         )
 
     async def buy_voice_time(
@@ -301,11 +352,13 @@ class HighriseWebApiMethods:
         ],
     ) -> BuyVoiceTimeResponse:
         """Buy a voice time for a room."""
-        request = BuyVoiceTimeRequest.model_validate(
-            {"_type": "BuyVoiceTimeRequest", "payment_method": payment_method}
-        )
+        request = {"_type": "BuyVoiceTimeRequest", "payment_method": payment_method}
+        if debug.validate_requests:
+            from aiorise.api.request_types import BuyVoiceTimeRequest
+
+            BuyVoiceTimeRequest.model_validate(request)
         return BuyVoiceTimeResponse.model_validate(
-            await self._connection.send(request.model_dump())
+            await self._connection.send(request, priority=Priority.REQUEST)
         )
 
     async def buy_room_boost(
@@ -316,15 +369,17 @@ class HighriseWebApiMethods:
         amount: int | None = None,
     ) -> BuyRoomBoostResponse:
         """Buy a room boost."""
-        request = BuyRoomBoostRequest.model_validate(
-            {
-                "_type": "BuyRoomBoostRequest",
-                "payment_method": payment_method,
-                "amount": amount,
-            }
-        )
+        request = {
+            "_type": "BuyRoomBoostRequest",
+            "payment_method": payment_method,
+            "amount": amount,
+        }
+        if debug.validate_requests:
+            from aiorise.api.request_types import BuyRoomBoostRequest
+
+            BuyRoomBoostRequest.model_validate(request)
         return BuyRoomBoostResponse.model_validate(
-            await self._connection.send(request.model_dump())
+            await self._connection.send(request, priority=Priority.REQUEST)
         )
 
     async def tip_user(
@@ -343,36 +398,46 @@ class HighriseWebApiMethods:
         ],
     ) -> TipUserResponse:
         """Tip a user."""
-        request = TipUserRequest.model_validate(
-            {"_type": "TipUserRequest", "user_id": user_id, "gold_bar": gold_bar}
-        )
+        request = {"_type": "TipUserRequest", "user_id": user_id, "gold_bar": gold_bar}
+        if debug.validate_requests:
+            from aiorise.api.request_types import TipUserRequest
+
+            TipUserRequest.model_validate(request)
         return TipUserResponse.model_validate(
-            await self._connection.send(request.model_dump())
+            await self._connection.send(request, priority=Priority.REQUEST)
         )
 
     async def set_outfit(
         self: HaveApiConnection, outfit: list[Item]
     ) -> SetOutfitResponse:
         """Set the outfit of a user."""
-        request = SetOutfitRequest.model_validate(
-            {"_type": "SetOutfitRequest", "outfit": outfit}
-        )
+        request = {
+            "_type": "SetOutfitRequest",
+            "outfit": [item.model_dump(by_alias=True) for item in outfit],
+        }
+        if debug.validate_requests:
+            from aiorise.api.request_types import SetOutfitRequest
+
+            SetOutfitRequest.model_validate(request)
         return SetOutfitResponse.model_validate(
-            await self._connection.send(request.model_dump())
+            await self._connection.send(request, priority=Priority.REQUEST)
         )
 
     async def get_inventory(self: HaveApiConnection) -> GetInventoryResponse:
         """Get the inventory of a user."""
-        request = GetInventoryRequest.model_validate({"_type": "GetInventoryRequest"})
         return GetInventoryResponse.model_validate(
-            await self._connection.send(request.model_dump())
+            await self._connection.send_template(
+                GET_INVENTORY_REQUEST_FRAME, priority=Priority.REQUEST
+            )
         )
 
     async def buy_item(self: HaveApiConnection, item_id: str) -> BuyItemResponse:
         """Buy an item."""
-        request = BuyItemRequest.model_validate(
-            {"_type": "BuyItemRequest", "item_id": item_id}
-        )
+        request = {"_type": "BuyItemRequest", "item_id": item_id}
+        if debug.validate_requests:
+            from aiorise.api.request_types import BuyItemRequest
+
+            BuyItemRequest.model_validate(request)
         return BuyItemResponse.model_validate(
-            await self._connection.send(request.model_dump())
+            await self._connection.send(request, priority=Priority.REQUEST)
         )
@@ -0,0 +1,6 @@
+import os
+
+
+# Generated request builders skip pydantic entirely unless this is set, then
+# every outgoing request is validated against its model before it is sent
+validate_requests: bool = os.environ.get("AIORISE_VALIDATE_REQUESTS", "") not in ("", "0")
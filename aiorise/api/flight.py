@@ -0,0 +1,66 @@
+from collections import Counter
+from typing import Any, Awaitable, Callable
+
+import asyncio
+
+
+class SingleFlight:
+    """Collapses identical concurrent calls into one.
+
+    The first caller for a (method, key) pair starts the call, everyone
+    arriving while it is in flight awaits the same result instead of
+    sending another request. The call runs in its own task, so a caller
+    being cancelled does not cancel it for the others.
+    """
+
+    _inflight: dict[tuple[str, tuple], asyncio.Task]
+
+    calls: Counter[str]
+    collapsed: Counter[str]
+
+    def __init__(self):
+        self._inflight = {}
+
+        self.calls = Counter()
+        self.collapsed = Counter()
+
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._inflight)
+
+
+    async def do(self, method: str, key: tuple, call: Callable[[], Awaitable[Any]]) -> Any:
+        flight = (method, key)
+        if (task := self._inflight.get(flight)) is not None:
+            self.collapsed[method] += 1
+            return await asyncio.shield(task)
+
+        task = self._inflight[flight] = asyncio.ensure_future(call())
+        task.add_done_callback(lambda task: self._land(flight, task))
+        self.calls[method] += 1
+        return await asyncio.shield(task)
+
+
+    def _land(self, flight: tuple[str, tuple], task: asyncio.Task) -> None:
+        if self._inflight.get(flight) is task:
+            del self._inflight[flight]
+        # Retrieved here in case every caller was cancelled meanwhile
+        if not task.cancelled():
+            task.exception()
+
+
+    def forget(self, method: str) -> None:
+        """Callers arriving from now on start a fresh call.
+
+        Used when a write or an event makes results already in flight stale.
+        """
+        for flight in [flight for flight in self._inflight if flight[0] == method]:
+            del self._inflight[flight]
+
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        return {
+            method: {"calls": self.calls[method], "collapsed": self.collapsed[method]}
+            for method in self.calls
+        }
@@ -0,0 +1,56 @@
+from typing import AsyncIterator, Awaitable, Callable, TypeVar
+
+import asyncio
+
+
+T = TypeVar("T")
+
+# Cursor-paginated endpoints return at most this many items, a shorter page is the last one
+PAGE_SIZE = 20
+
+
+async def paginate(
+    fetch: Callable[[str | None], Awaitable[list[T]]],
+    cursor: Callable[[T], str],
+    lookahead: int = 1,
+    page_size: int = PAGE_SIZE
+) -> AsyncIterator[T]:
+    """Stream the items of a cursor-paginated endpoint.
+
+    Pages are fetched in a background task, so the next request is already
+    in flight while the consumer handles the current page. At most
+    `lookahead` pages are fetched but not yet consumed, counting the one in
+    flight. Breaking out of the loop cancels the fetch.
+    """
+    if lookahead < 1:
+        raise ValueError("lookahead must be at least 1")
+
+    # A page, the error that ended the crawl, or None once exhausted
+    pages: asyncio.Queue[list[T] | Exception | None] = asyncio.Queue()
+    ahead = asyncio.Semaphore(lookahead)
+
+    async def crawl() -> None:
+        last = None
+        try:
+            while True:
+                await ahead.acquire()
+                page = await fetch(last)
+                pages.put_nowait(page)
+                if len(page) < page_size:
+                    break
+                last = cursor(page[-1])
+        except Exception as e:
+            pages.put_nowait(e)
+            return
+        pages.put_nowait(None)
+
+    task = asyncio.create_task(crawl())
+    try:
+        while (page := await pages.get()) is not None:
+            if isinstance(page, Exception):
+                raise page
+            ahead.release()
+            for item in page:
+                yield item
+    finally:
+        task.cancel()
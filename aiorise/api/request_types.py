@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Literal, Any
 from aiorise.objects.object_types import *
 
@@ -9,6 +9,7 @@ class ChatRequest(BaseModel):
     The chat message will be broadcast to everyone in the room, or whispered to `whisper_target_id` if provided.
     """
 
+    model_config = ConfigDict(defer_build=True)
     type: Literal["ChatRequest"] = Field(alias="_type")
     message: str
     whisper_target_id: str | None = None
@@ -20,6 +21,7 @@ class ChannelRequest(BaseModel):
     This message not be displayed in the chat, so it can be used to
     communicate between bots or client-side scripts."""
 
+    model_config = ConfigDict(defer_build=True)
     type: Literal["ChannelRequest"] = Field(alias="_type")
     message: str
     tags: list[str] | None = None
@@ -37,6 +39,7 @@ class EmoteRequest(BaseModel):
 
     `target_user_id` can be provided if the emote can be directed toward a player."""
 
+    model_config = ConfigDict(defer_build=True)
     type: Literal["EmoteRequest"] = Field(alias="_type")
     emote_id: str
     target_user_id: str | None = None
@@ -45,6 +48,7 @@ class EmoteRequest(BaseModel):
 class ReactionRequest(BaseModel):
     """Send a reaction to a user."""
 
+    model_config = ConfigDict(defer_build=True)
     type: Literal["ReactionRequest"] = Field(alias="_type")
     reaction: Literal["clap", "heart", "thumbs", "wave", "wink"]
     target_user_id: str
@@ -55,12 +59,14 @@ class KeepaliveRequest(BaseModel):
 
     This must be sent every 15 seconds or the server will terminate the connection."""
 
+    model_config = ConfigDict(defer_build=True)
     type: Literal["KeepaliveRequest"] = Field(alias="_type")
 
 
 class TeleportRequest(BaseModel):
     """Teleport the provided `user_id` to the provided `destination`."""
 
+    model_config = ConfigDict(defer_build=True)
     type: Literal["TeleportRequest"] = Field(alias="_type")
     user_id: str
 
@@ -68,12 +74,14 @@ class TeleportRequest(BaseModel):
 class FloorHitRequest(BaseModel):
     """Move the bot to the given `destination`."""
 
+    model_config = ConfigDict(defer_build=True)
     type: Literal["FloorHitRequest"] = Field(alias="_type")
 
 
 class GetRoomUsersRequest(BaseModel):
     """Fetch the list of users currently in the room, with their positions."""
 
+    model_config = ConfigDict(defer_build=True)
     type: Literal["GetRoomUsersRequest"] = Field(alias="_type")
 
 
@@ -82,6 +90,7 @@ class GetWalletRequest(BaseModel):
 
     The wallet contains Highrise currencies."""
 
+    model_config = ConfigDict(defer_build=True)
     type: Literal["GetWalletRequest"] = Field(alias="_type")
 
 
@@ -90,6 +99,7 @@ class ModerateRoomRequest(BaseModel):
 
     This can be used to kick, ban, unban, or mute a user."""
 
+    model_config = ConfigDict(defer_build=True)
     type: Literal["ModerateRoomRequest"] = Field(alias="_type")
     user_id: str
     moderation_action: Literal["kick", "ban", "unban", "mute"]
@@ -99,6 +109,7 @@ class ModerateRoomRequest(BaseModel):
 class GetRoomPrivilegeRequest(BaseModel):
     """Fetch the room privileges for provided `user_id`."""
 
+    model_config = ConfigDict(defer_build=True)
     type: Literal["GetRoomPrivilegeRequest"] = Field(alias="_type")
     user_id: str
 
@@ -110,6 +121,7 @@ class ChangeRoomPrivilegeRequest(BaseModel):
     Bots have to be in the room to change privileges.
     Bots are using their owner's privileges."""
 
+    model_config = ConfigDict(defer_build=True)
     type: Literal["ChangeRoomPrivilegeRequest"] = Field(alias="_type")
     user_id: str
 
@@ -117,6 +129,7 @@ class ChangeRoomPrivilegeRequest(BaseModel):
 class MoveUserToRoomRequest(BaseModel):
     """Move the provided `user_id` to the provided `room_id`."""
 
+    model_config = ConfigDict(defer_build=True)
     type: Literal["MoveUserToRoomRequest"] = Field(alias="_type")
     user_id: str
     room_id: str
@@ -125,12 +138,14 @@ class MoveUserToRoomRequest(BaseModel):
 class AnchorHitRequest(BaseModel):
     """Move the bot to the given furniture Anchor Position."""
 
+    model_config = ConfigDict(defer_build=True)
     type: Literal["AnchorHitRequest"] = Field(alias="_type")
 
 
 class InviteSpeakerRequest(BaseModel):
     """Invite a user to speak in the room."""
 
+    model_config = ConfigDict(defer_build=True)
     type: Literal["InviteSpeakerRequest"] = Field(alias="_type")
     user_id: str
 
@@ -138,6 +153,7 @@ class InviteSpeakerRequest(BaseModel):
 class RemoveSpeakerRequest(BaseModel):
     """Remove a user from speaking in the room."""
 
+    model_config = ConfigDict(defer_build=True)
     type: Literal["RemoveSpeakerRequest"] = Field(alias="_type")
     user_id: str
 
@@ -145,12 +161,14 @@ class RemoveSpeakerRequest(BaseModel):
 class CheckVoiceChatRequest(BaseModel):
     """Check the voice chat status in the room."""
 
+    model_config = ConfigDict(defer_build=True)
     type: Literal["CheckVoiceChatRequest"] = Field(alias="_type")
 
 
 class GetUserOutfitRequest(BaseModel):
     """Get the outfit of a user."""
 
+    model_config = ConfigDict(defer_build=True)
     type: Literal["GetUserOutfitRequest"] = Field(alias="_type")
     user_id: str
 
@@ -158,6 +176,7 @@ class GetUserOutfitRequest(BaseModel):
 class GetBackpackRequest(BaseModel):
     """Fetch a user's world backpack."""
 
+    model_config = ConfigDict(defer_build=True)
     type: Literal["GetBackpackRequest"] = Field(alias="_type")
     user_id: str
 
@@ -167,6 +186,7 @@ class GetMessagesRequest(BaseModel):
     last_message_id can be used to retrieve the next 20 messages. conversation_id must be provided.
     """
 
+    model_config = ConfigDict(defer_build=True)
     type: Literal["GetMessagesRequest"] = Field(alias="_type")
     conversation_id: str
     last_message_id: str | None = None
@@ -175,6 +195,7 @@ class GetMessagesRequest(BaseModel):
 class SendMessageRequest(BaseModel):
     """Send a message to a conversation. If bot wishes to send room invite, the room_id must be provided."""
 
+    model_config = ConfigDict(defer_build=True)
     type: Literal["SendMessageRequest"] = Field(alias="_type")
     conversation_id: str
     content: str
@@ -187,6 +208,7 @@ class GetConversationsRequest(BaseModel):
     be returned. 20 conversations will be returned at most, if all 20 conversations are returned, the last_id can be used
     to retrieve the next 20 conversations."""
 
+    model_config = ConfigDict(defer_build=True)
     type: Literal["GetConversationsRequest"] = Field(alias="_type")
     not_joined: bool | None = None
     last_id: str | None = None
@@ -195,6 +217,7 @@ class GetConversationsRequest(BaseModel):
 class LeaveConversationRequest(BaseModel):
     """Leave a conversation."""
 
+    model_config = ConfigDict(defer_build=True)
     type: Literal["LeaveConversationRequest"] = Field(alias="_type")
     conversation_id: str
 
@@ -202,6 +225,7 @@ class LeaveConversationRequest(BaseModel):
 class BuyVoiceTimeRequest(BaseModel):
     """Buy a voice time for a room."""
 
+    model_config = ConfigDict(defer_build=True)
     type: Literal["BuyVoiceTimeRequest"] = Field(alias="_type")
     payment_method: Literal[
         "bot_wallet_only", "bot_wallet_priority", "user_wallet_only"
@@ -211,6 +235,7 @@ class BuyVoiceTimeRequest(BaseModel):
 class BuyRoomBoostRequest(BaseModel):
     """Buy a room boost."""
 
+    model_config = ConfigDict(defer_build=True)
     type: Literal["BuyRoomBoostRequest"] = Field(alias="_type")
     payment_method: Literal[
         "bot_wallet_only", "bot_wallet_priority", "user_wallet_only"
@@ -221,6 +246,7 @@ class BuyRoomBoostRequest(BaseModel):
 class TipUserRequest(BaseModel):
     """Tip a user."""
 
+    model_config = ConfigDict(defer_build=True)
     type: Literal["TipUserRequest"] = Field(alias="_type")
     user_id: str
     gold_bar: Literal[
@@ -239,6 +265,7 @@ class TipUserRequest(BaseModel):
 class SetOutfitRequest(BaseModel):
     """Set the outfit of a user."""
 
+    model_config = ConfigDict(defer_build=True)
     type: Literal["SetOutfitRequest"] = Field(alias="_type")
     outfit: list[Item]
 
@@ -246,11 +273,13 @@ class SetOutfitRequest(BaseModel):
 class GetInventoryRequest(BaseModel):
     """Get the inventory of a user."""
 
+    model_config = ConfigDict(defer_build=True)
     type: Literal["GetInventoryRequest"] = Field(alias="_type")
 
 
 class BuyItemRequest(BaseModel):
     """Buy an item."""
 
+    model_config = ConfigDict(defer_build=True)
     type: Literal["BuyItemRequest"] = Field(alias="_type")
     item_id: str
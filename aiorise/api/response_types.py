@@ -1,23 +1,26 @@
-from pydantic import BaseModel, Field
-from typing import Literal, Any
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Annotated, Literal, Any
 from aiorise.objects.object_types import *
 
 
 class EmoteResponse(BaseModel):
     """The successful response to a `EmoteRequest`."""
 
+    model_config = ConfigDict(defer_build=True)
     type: Literal["EmoteResponse"] = Field(alias="_type")
 
 
 class ChannelResponse(BaseModel):
     """A channel message has been successfully sent."""
 
+    model_config = ConfigDict(defer_build=True)
     type: Literal["ChannelResponse"] = Field(alias="_type")
 
 
 class GetRoomUsersResponse(BaseModel):
     """The list of users in the room, alongside their positions."""
 
+    model_config = ConfigDict(defer_build=True)
     type: Literal["GetRoomUsersResponse"] = Field(alias="_type")
     content: list[tuple[User, Position | AnchorPosition]]
 
@@ -25,12 +28,14 @@ class GetRoomUsersResponse(BaseModel):
 class ReactionResponse(BaseModel):
     """A response to a successful reaction."""
 
+    model_config = ConfigDict(defer_build=True)
     type: Literal["ReactionResponse"] = Field(alias="_type")
 
 
 class GetWalletResponse(BaseModel):
     """The bot's wallet."""
 
+    model_config = ConfigDict(defer_build=True)
     type: Literal["GetWalletResponse"] = Field(alias="_type")
     content: list[CurrencyItem]
 
@@ -38,48 +43,56 @@ class GetWalletResponse(BaseModel):
 class TeleportResponse(BaseModel):
     """The successful response to a `TeleportRequest`."""
 
+    model_config = ConfigDict(defer_build=True)
     type: Literal["TeleportResponse"] = Field(alias="_type")
 
 
 class FloorHitResponse(BaseModel):
     """The successful response to a `FloorHitRequest`."""
 
+    model_config = ConfigDict(defer_build=True)
     type: Literal["FloorHitResponse"] = Field(alias="_type")
 
 
 class AnchorHitResponse(BaseModel):
     """The successful response to a `AnchorHitRequest`."""
 
+    model_config = ConfigDict(defer_build=True)
     type: Literal["AnchorHitResponse"] = Field(alias="_type")
 
 
 class KeepaliveResponse(BaseModel):
     """The successful response to a `KeepaliveRequest`."""
 
+    model_config = ConfigDict(defer_build=True)
     type: Literal["KeepaliveResponse"] = Field(alias="_type")
 
 
 class ModerateRoomResponse(BaseModel):
     """The successful response to a `ModerateRoomRequest`."""
 
+    model_config = ConfigDict(defer_build=True)
     type: Literal["ModerateRoomResponse"] = Field(alias="_type")
 
 
 class GetRoomPrivilegeResponse(BaseModel):
     """The room privileges for provided `user_id`."""
 
+    model_config = ConfigDict(defer_build=True)
     type: Literal["GetRoomPrivilegeResponse"] = Field(alias="_type")
 
 
 class ChangeRoomPrivilegeResponse(BaseModel):
     """The successful response to a `ChangeRoomPrivilegeRequest`."""
 
+    model_config = ConfigDict(defer_build=True)
     type: Literal["ChangeRoomPrivilegeResponse"] = Field(alias="_type")
 
 
 class MoveUserToRoomResponse(BaseModel):
     """The successful response to a `MoveUserToRoomRequest`."""
 
+    model_config = ConfigDict(defer_build=True)
     type: Literal["MoveUserToRoomResponse"] = Field(alias="_type")
 
 
@@ -90,6 +103,7 @@ class CheckVoiceChatResponse(BaseModel):
     owner.
     users: The list of users that currently have voice chat privileges in the room."""
 
+    model_config = ConfigDict(defer_build=True)
     type: Literal["CheckVoiceChatResponse"] = Field(alias="_type")
     seconds_left: int
 
@@ -97,6 +111,7 @@ class CheckVoiceChatResponse(BaseModel):
 class GetUserOutfitResponse(BaseModel):
     """The outfit of a user. Returns list of items user is currently wearing."""
 
+    model_config = ConfigDict(defer_build=True)
     type: Literal["GetUserOutfitResponse"] = Field(alias="_type")
     outfit: list[Item]
 
@@ -104,6 +119,7 @@ class GetUserOutfitResponse(BaseModel):
 class GetMessagesResponse(BaseModel):
     """The messages of a conversation. This will return list of max 20 messages."""
 
+    model_config = ConfigDict(defer_build=True)
     type: Literal["GetMessagesResponse"] = Field(alias="_type")
     messages: list[Message]
 
@@ -111,6 +127,7 @@ class GetMessagesResponse(BaseModel):
 class SendMessageResponse(BaseModel):
     """The message sent success response."""
 
+    model_config = ConfigDict(defer_build=True)
     type: Literal["SendMessageResponse"] = Field(alias="_type")
 
 
@@ -119,6 +136,7 @@ class GetConversationsResponse(BaseModel):
     not_joined: The number of conversations that bot has not joined yet. Those are not returned in the conversations
     list unless not_joined is true."""
 
+    model_config = ConfigDict(defer_build=True)
     type: Literal["GetConversationsResponse"] = Field(alias="_type")
     conversations: list[Conversation]
     not_joined: int
@@ -127,12 +145,14 @@ class GetConversationsResponse(BaseModel):
 class LeaveConversationResponse(BaseModel):
     """The leave conversation success response."""
 
+    model_config = ConfigDict(defer_build=True)
     type: Literal["LeaveConversationResponse"] = Field(alias="_type")
 
 
 class BuyVoiceTimeResponse(BaseModel):
     """Buy a voice token."""
 
+    model_config = ConfigDict(defer_build=True)
     type: Literal["BuyVoiceTimeResponse"] = Field(alias="_type")
     result: Literal["success", "insufficient_funds", "only_token_bought"]
 
@@ -140,6 +160,7 @@ class BuyVoiceTimeResponse(BaseModel):
 class BuyRoomBoostResponse(BaseModel):
     """Buy a room boost."""
 
+    model_config = ConfigDict(defer_build=True)
     type: Literal["BuyRoomBoostResponse"] = Field(alias="_type")
     result: Literal["success", "insufficient_funds", "only_token_bought"]
 
@@ -147,6 +168,7 @@ class BuyRoomBoostResponse(BaseModel):
 class TipUserResponse(BaseModel):
     """Tip a user."""
 
+    model_config = ConfigDict(defer_build=True)
     type: Literal["TipUserResponse"] = Field(alias="_type")
     result: Literal["success", "insufficient_funds"]
 
@@ -154,12 +176,14 @@ class TipUserResponse(BaseModel):
 class SetOutfitResponse(BaseModel):
     """Set the outfit of a user."""
 
+    model_config = ConfigDict(defer_build=True)
     type: Literal["SetOutfitResponse"] = Field(alias="_type")
 
 
 class GetInventoryResponse(BaseModel):
     """Get the inventory of a user."""
 
+    model_config = ConfigDict(defer_build=True)
     type: Literal["GetInventoryResponse"] = Field(alias="_type")
     items: list[Item]
 
@@ -167,5 +191,36 @@ class GetInventoryResponse(BaseModel):
 class BuyItemResponse(BaseModel):
     """Buy an item."""
 
+    model_config = ConfigDict(defer_build=True)
     type: Literal["BuyItemResponse"] = Field(alias="_type")
     result: Literal["success", "insufficient_funds"]
+
+
+AnyResponse = Annotated[
+    EmoteResponse
+    | ChannelResponse
+    | GetRoomUsersResponse
+    | ReactionResponse
+    | GetWalletResponse
+    | TeleportResponse
+    | FloorHitResponse
+    | AnchorHitResponse
+    | KeepaliveResponse
+    | ModerateRoomResponse
+    | GetRoomPrivilegeResponse
+    | ChangeRoomPrivilegeResponse
+    | MoveUserToRoomResponse
+    | CheckVoiceChatResponse
+    | GetUserOutfitResponse
+    | GetMessagesResponse
+    | SendMessageResponse
+    | GetConversationsResponse
+    | LeaveConversationResponse
+    | BuyVoiceTimeResponse
+    | BuyRoomBoostResponse
+    | TipUserResponse
+    | SetOutfitResponse
+    | GetInventoryResponse
+    | BuyItemResponse,
+    Field(discriminator="type"),
+]
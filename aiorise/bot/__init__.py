@@ -1 +1,16 @@
 from .bot import Bot
+from .pool import BotPool
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .supervisor import HashRing, Supervisor
+
+
+# The supervisor pulls in multiprocessing, which worker processes themselves
+# never need, so it is only imported when asked for
+def __getattr__(name: str) -> Any:
+    if name in ("HashRing", "Supervisor"):
+        from . import supervisor
+        return getattr(supervisor, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
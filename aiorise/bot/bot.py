@@ -1,20 +1,87 @@
 from aiorise.actions.action import ActionFactory
+from aiorise.api.cache import EVENT_INVALIDATES
 from aiorise.api.client import HighriseWebApiClient
+from aiorise.dispatchers.dispatcher import BaseDispatcher, PoolDispatcher
 from aiorise.handlers.handler import Handler
 from aiorise.events.event_context import EventContext
+from aiorise.state.room import RoomState
 
 from typing import NoReturn
 
+import asyncio
+
 class Bot:
     _client: HighriseWebApiClient
     _handler: Handler
+    _dispatcher: BaseDispatcher
+    _lazy: bool
+    _room_id: str | None
+    _room: RoomState | None
 
-    def __init__(self, client: HighriseWebApiClient, handler: Handler):
+    def __init__(
+        self,
+        client: HighriseWebApiClient,
+        handler: Handler,
+        dispatcher: BaseDispatcher | None = None,
+        lazy: bool = False,
+        room_id: str | None = None,
+        room: RoomState | None = None
+    ):
         self._client = client
         self._handler = handler
+        self._dispatcher = dispatcher if dispatcher is not None else PoolDispatcher()
+        self._lazy = lazy
+        self._room_id = room_id
+        self._room = room
 
-    async def start(self) -> NoReturn:
+
+    @property
+    def client(self) -> HighriseWebApiClient:
+        return self._client
+
+
+    @property
+    def room(self) -> RoomState | None:
+        return self._room
+
+
+    async def _read(self) -> None:
+        types = None
+        if self._lazy and (subscriptions := self._handler.compile().subscriptions) is not None:
+            types = {cls.__name__ for cls in subscriptions}
+            if self._room is not None:
+                types |= {"UserJoinedEvent", "UserLeftEvent", "UserMovedEvent"}
+            if self._client.cache is not None:
+                types |= EVENT_INVALIDATES.keys()
+
+        try:
+            async for event in self._client.listen(types, self._lazy):
+                # Applied before dispatch so handlers already see the event
+                # reflected in ctx.room
+                if self._room is not None:
+                    self._room.apply(event)
+                await self._dispatcher.dispatch(
+                    event, EventContext(client=self._client, room_id=self._room_id, room=self._room)
+                )
+        finally:
+            self._dispatcher.close()
+
+
+    async def connect(self) -> None:
         await self._client.connect()
 
-        async for event in self._client.listen():
-            await self._handler.run(event, EventContext(client=self._client))
+
+    async def run(self) -> None:
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(self._dispatcher.run(self._handler))
+            reader = tg.create_task(self._read())
+            if self._room is not None:
+                # Resyncs only make sense while events are read, the loop
+                # never ends on its own and would keep the group open
+                resync = tg.create_task(self._room.run(self._client))
+                reader.add_done_callback(lambda _: resync.cancel())
+
+
+    async def start(self) -> NoReturn:
+        await self.connect()
+        await self.run()
@@ -0,0 +1,177 @@
+from aiorise.api.client import HighriseWebApiClient
+from aiorise.connection.backoff import Backoff
+from aiorise.connection.connection import HighriseWebApiConnection
+from aiorise.dispatchers.dispatcher import BaseDispatcher, PoolDispatcher
+from aiorise.handlers.handler import Handler
+from aiorise.state.room import RoomState
+from .bot import Bot
+
+from collections import Counter
+from typing import Any, Callable
+
+import asyncio
+import logging
+
+
+logger = logging.getLogger(__name__)
+
+
+class BotPool:
+    _handler: Handler
+    _dispatcher: Callable[[], BaseDispatcher]
+    _lazy: bool
+    _connect_concurrency: int
+    _backoff: Backoff
+    _room: Callable[[], RoomState] | None
+    _clients: dict[str, HighriseWebApiClient]
+    _bots: dict[str, Bot]
+    _tasks: dict[str, asyncio.Task]
+    _tg: asyncio.TaskGroup | None
+    _gate: asyncio.Semaphore | None
+
+    crashes: Counter[str]
+
+    def __init__(
+        self,
+        handler: Handler,
+        dispatcher: Callable[[], BaseDispatcher] = PoolDispatcher,
+        lazy: bool = False,
+        connect_concurrency: int = 16,
+        backoff: Backoff | None = None,
+        room: Callable[[], RoomState] | None = None
+    ):
+        self._handler = handler
+        self._dispatcher = dispatcher
+        self._lazy = lazy
+        self._connect_concurrency = connect_concurrency
+        self._backoff = backoff if backoff is not None else Backoff()
+        self._room = room
+        self._clients = {}
+        self._bots = {}
+        self._tasks = {}
+        self._tg = None
+        self._gate = None
+
+        self.crashes = Counter()
+
+
+    @classmethod
+    def from_rooms(
+        cls,
+        uri: str,
+        api_token: str,
+        room_ids: list[str],
+        handler: Handler,
+        connection_options: dict[str, Any] | None = None,
+        **options: Any
+    ) -> "BotPool":
+        pool = cls(handler, **options)
+        for room_id in room_ids:
+            connection = HighriseWebApiConnection(uri, api_token, room_id, **(connection_options or {}))
+            pool.add_room(room_id, HighriseWebApiClient(connection))
+        return pool
+
+
+    @property
+    def rooms(self) -> list[str]:
+        return list(self._clients)
+
+
+    @property
+    def bots(self) -> dict[str, Bot]:
+        return dict(self._bots)
+
+
+    def add_room(self, room_id: str, client: HighriseWebApiClient) -> None:
+        if room_id in self._clients:
+            raise ValueError(f"Room {room_id} is already in the pool")
+
+        self._clients[room_id] = client
+        if self._tg is not None:
+            self._spawn(room_id)
+
+
+    async def remove_room(self, room_id: str) -> None:
+        client = self._clients.pop(room_id)
+        self._bots.pop(room_id, None)
+
+        if (task := self._tasks.pop(room_id, None)) is not None:
+            task.cancel()
+
+        try:
+            await client.close()
+        except Exception:
+            pass
+
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        stats = {}
+        for room_id, client in self._clients.items():
+            connection = client._connection
+            stats[room_id] = {
+                "crashes": self.crashes[room_id],
+                "reconnects": getattr(connection, "reconnects", 0),
+                "downtime": getattr(connection, "downtime", 0),
+            }
+        return stats
+
+
+    def _spawn(self, room_id: str) -> None:
+        self._tasks[room_id] = self._tg.create_task(self._run_room(room_id))
+
+
+    async def _run_room(self, room_id: str) -> None:
+        client = self._clients[room_id]
+        delays = self._backoff.delays()
+
+        while True:
+            bot = self._bots[room_id] = Bot(
+                client, self._handler, self._dispatcher(), self._lazy, room_id,
+                self._room() if self._room is not None else None
+            )
+
+            try:
+                # Bounded so hundreds of rooms do not handshake all at once
+                async with self._gate:
+                    await bot.connect()
+                delays = self._backoff.delays()
+
+                await bot.run()
+                return
+
+            except Exception:
+                self.crashes[room_id] += 1
+
+                if (delay := next(delays, None)) is None:
+                    logger.exception("Bot for room %s crashed, giving up", room_id)
+                    return
+
+                logger.exception("Bot for room %s crashed, restarting", room_id)
+
+                try:
+                    await client.close()
+                except Exception:
+                    pass
+
+                await asyncio.sleep(delay)
+
+
+    async def start(self) -> None:
+        # Built once here so every room shares the same compiled tree
+        self._handler.compile()
+
+        self._gate = asyncio.Semaphore(self._connect_concurrency)
+        try:
+            async with asyncio.TaskGroup() as tg:
+                self._tg = tg
+                for room_id in self._clients:
+                    self._spawn(room_id)
+        finally:
+            self._tg = None
+
+
+    async def close(self) -> None:
+        await asyncio.gather(
+            *(client.close() for client in self._clients.values()),
+            return_exceptions=True
+        )
@@ -0,0 +1,348 @@
+from aiorise.api.client import HighriseWebApiClient
+from aiorise.connection.backoff import Backoff
+from .pool import BotPool
+
+from bisect import bisect
+from collections import Counter
+from multiprocessing.process import BaseProcess
+from multiprocessing.queues import Queue
+from queue import Empty
+from typing import Any, Callable, Iterator
+
+import asyncio
+import hashlib
+import logging
+import multiprocessing
+import os
+import time
+
+
+logger = logging.getLogger(__name__)
+
+
+def _hash(key: str) -> int:
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest())
+
+
+class HashRing:
+    _replicas: int
+    _keys: list[int]
+    _nodes: dict[int, str]
+
+    def __init__(self, nodes: list[str] | None = None, replicas: int = 64):
+        self._replicas = replicas
+        self._keys = []
+        self._nodes = {}
+
+        for node in nodes or []:
+            self.add(node)
+
+
+    def __len__(self) -> int:
+        return len(self._keys) // self._replicas
+
+
+    def add(self, node: str) -> None:
+        for replica in range(self._replicas):
+            key = _hash(f"{node}#{replica}")
+            self._nodes[key] = node
+            self._keys.insert(bisect(self._keys, key), key)
+
+
+    def remove(self, node: str) -> None:
+        for replica in range(self._replicas):
+            key = _hash(f"{node}#{replica}")
+            del self._nodes[key]
+            self._keys.remove(key)
+
+
+    def node_for(self, key: str) -> str:
+        if not self._keys:
+            raise LookupError("Hash ring is empty")
+
+        index = bisect(self._keys, _hash(key)) % len(self._keys)
+        return self._nodes[self._keys[index]]
+
+
+async def _serve(
+    worker_id: int,
+    pool_factory: Callable[[], BotPool],
+    client_factory: Callable[[str], HighriseWebApiClient],
+    rooms: list[str],
+    control: Queue,
+    stats: Queue,
+    stats_interval: float
+) -> None:
+    loop = asyncio.get_running_loop()
+    pool = pool_factory()
+    for room_id in rooms:
+        pool.add_room(room_id, client_factory(room_id))
+
+    runner = asyncio.create_task(pool.start())
+
+    async def report() -> None:
+        while True:
+            await asyncio.sleep(stats_interval)
+            stats.put((worker_id, {"pid": os.getpid(), "time": time.time(), "rooms": pool.stats()}))
+
+    reporter = asyncio.create_task(report())
+
+    while True:
+        command, payload = await loop.run_in_executor(None, control.get)
+
+        if command == "stop":
+            break
+
+        if command == "rooms":
+            for room_id in set(pool.rooms) - set(payload):
+                await pool.remove_room(room_id)
+            for room_id in set(payload) - set(pool.rooms):
+                pool.add_room(room_id, client_factory(room_id))
+
+            # A pool whose rooms all finished has returned, bring it back
+            if runner.done():
+                runner = asyncio.create_task(pool.start())
+
+    reporter.cancel()
+    await pool.close()
+    runner.cancel()
+
+
+def _worker_main(*args: Any) -> None:
+    asyncio.run(_serve(*args))
+
+
+class Supervisor:
+    _pool_factory: Callable[[], BotPool]
+    _client_factory: Callable[[str], HighriseWebApiClient]
+    _rooms: list[str]
+    _ring: HashRing
+    _context: multiprocessing.context.BaseContext
+    _stats_interval: float
+    _poll_interval: float
+    _backoff: Backoff
+
+    _processes: dict[int, BaseProcess]
+    _controls: dict[int, Queue]
+    _assignments: dict[int, list[str]]
+    _delays: dict[int, Iterator[float]]
+    _restart_at: dict[int, float]
+    _stats_queue: Queue
+    _next_worker: int
+    _stopping: bool
+
+    stats: dict[int, dict[str, Any]]
+    restarts: Counter[int]
+    failed: set[int]
+
+    def __init__(
+        self,
+        pool_factory: Callable[[], BotPool],
+        client_factory: Callable[[str], HighriseWebApiClient],
+        rooms: list[str],
+        workers: int | None = None,
+        stats_interval: float = 10,
+        poll_interval: float = 0.5,
+        start_method: str = "spawn",
+        backoff: Backoff | None = None
+    ):
+        self._pool_factory = pool_factory
+        self._client_factory = client_factory
+        self._rooms = list(rooms)
+        self._ring = HashRing()
+        self._context = multiprocessing.get_context(start_method)
+        self._stats_interval = stats_interval
+        self._poll_interval = poll_interval
+        # A worker that keeps dying is given up on rather than respawned forever
+        self._backoff = backoff if backoff is not None else Backoff(initial=1, maximum=60, attempts=10)
+
+        self._processes = {}
+        self._controls = {}
+        self._assignments = {}
+        self._delays = {}
+        self._restart_at = {}
+        self._stats_queue = self._context.Queue()
+        self._next_worker = 0
+        self._stopping = False
+
+        self.stats = {}
+        self.restarts = Counter()
+        self.failed = set()
+
+        for _ in range(workers or os.cpu_count() or 1):
+            self._ring.add(str(self._allocate_worker()))
+
+
+    def _allocate_worker(self) -> int:
+        worker_id = self._next_worker
+        self._next_worker += 1
+        self._assignments[worker_id] = []
+        return worker_id
+
+
+    @property
+    def assignments(self) -> dict[int, list[str]]:
+        return {worker_id: list(rooms) for worker_id, rooms in self._assignments.items()}
+
+
+    def _assign(self) -> dict[int, list[str]]:
+        assignments = {worker_id: [] for worker_id in self._assignments}
+        for room_id in self._rooms:
+            assignments[int(self._ring.node_for(room_id))].append(room_id)
+        return assignments
+
+
+    def _spawn(self, worker_id: int) -> None:
+        control = self._controls[worker_id] = self._context.Queue()
+        process = self._processes[worker_id] = self._context.Process(
+            target=_worker_main,
+            args=(
+                worker_id,
+                self._pool_factory,
+                self._client_factory,
+                self._assignments[worker_id],
+                control,
+                self._stats_queue,
+                self._stats_interval
+            ),
+            name=f"aiorise-worker-{worker_id}",
+            daemon=True
+        )
+        process.start()
+
+
+    def _rebalance(self) -> None:
+        # Consistent hashing moves only the rooms whose ring segment changed
+        # owner; workers keep serving every room they still own
+        for worker_id, rooms in self._assign().items():
+            if rooms == self._assignments.get(worker_id):
+                continue
+
+            self._assignments[worker_id] = rooms
+            if worker_id in self._processes:
+                # A worker waiting to be restarted picks its rooms up on spawn
+                self._controls[worker_id].put(("rooms", rooms))
+            elif not self._stopping and worker_id not in self.failed:
+                self._spawn(worker_id)
+
+
+    def add_worker(self) -> int:
+        worker_id = self._allocate_worker()
+        self._ring.add(str(worker_id))
+        self._rebalance()
+        return worker_id
+
+
+    async def remove_worker(self, worker_id: int) -> None:
+        # A worker given up on has already left the ring
+        if worker_id not in self.failed:
+            self._ring.remove(str(worker_id))
+        self._assignments.pop(worker_id)
+        self._delays.pop(worker_id, None)
+        self._restart_at.pop(worker_id, None)
+        self.failed.discard(worker_id)
+
+        if (process := self._processes.pop(worker_id, None)) is not None:
+            self._controls.pop(worker_id).put(("stop", None))
+            await self._join(process)
+
+        self.stats.pop(worker_id, None)
+        self._rebalance()
+
+
+    async def _join(self, process: BaseProcess) -> None:
+        # join() blocks, it must not stall the loop the other workers are
+        # supervised from
+        await asyncio.to_thread(process.join, self._poll_interval * 10)
+        if process.is_alive():
+            process.kill()
+            await asyncio.to_thread(process.join)
+
+
+    def add_rooms(self, room_ids: list[str]) -> None:
+        self._rooms.extend(room_id for room_id in room_ids if room_id not in self._rooms)
+        self._rebalance()
+
+
+    def remove_rooms(self, room_ids: list[str]) -> None:
+        self._rooms = [room_id for room_id in self._rooms if room_id not in room_ids]
+        self._rebalance()
+
+
+    def _collect_stats(self) -> None:
+        while True:
+            try:
+                worker_id, stats = self._stats_queue.get_nowait()
+            except Empty:
+                return
+
+            if worker_id in self._assignments:
+                self.stats[worker_id] = stats
+                # Reporting means the worker got past start-up, a later
+                # crash starts backing off from the shortest delay again
+                self._delays.pop(worker_id, None)
+
+
+    def _restart_crashed(self) -> None:
+        now = time.monotonic()
+
+        for worker_id, process in list(self._processes.items()):
+            if self._stopping:
+                return
+
+            if (restart_at := self._restart_at.get(worker_id)) is not None:
+                if now >= restart_at:
+                    del self._restart_at[worker_id]
+                    self.restarts[worker_id] += 1
+                    self._spawn(worker_id)
+                continue
+
+            if process.exitcode is None:
+                continue
+
+            delays = self._delays.setdefault(worker_id, self._backoff.delays())
+            if (delay := next(delays, None)) is None:
+                logger.error(
+                    "Worker %s exited with code %s, giving up", worker_id, process.exitcode
+                )
+                del self._processes[worker_id]
+                del self._controls[worker_id]
+                self.failed.add(worker_id)
+                self._ring.remove(str(worker_id))
+                # Its rooms would go unserved, hand them to the live workers
+                if len(self._ring):
+                    self._rebalance()
+                else:
+                    logger.error("No workers left, %s rooms are unserved", len(self._rooms))
+                continue
+
+            logger.error(
+                "Worker %s exited with code %s, restarting in %.1fs",
+                worker_id, process.exitcode, delay
+            )
+            self._restart_at[worker_id] = now + delay
+
+
+    async def run(self) -> None:
+        self._stopping = False
+        self._assignments = self._assign()
+        for worker_id in self._assignments:
+            self._spawn(worker_id)
+
+        while not self._stopping:
+            await asyncio.sleep(self._poll_interval)
+            self._collect_stats()
+            self._restart_crashed()
+
+
+    async def stop(self) -> None:
+        self._stopping = True
+
+        for worker_id, process in self._processes.items():
+            self._controls[worker_id].put(("stop", None))
+
+        await asyncio.gather(*(self._join(process) for process in self._processes.values()))
+
+        self._processes.clear()
+        self._controls.clear()
+        self._restart_at.clear()
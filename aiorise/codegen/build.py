@@ -0,0 +1,173 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+from .codegen import get_by_ref, unroll
+
+import argparse
+import hashlib
+import importlib
+import json
+import os
+import time
+
+import black
+
+
+# Output module -> (generator module, generator options)
+TARGETS: dict[str, tuple[str, dict[str, Any]]] = {
+    'aiorise/objects/object_types.py': ('generate_object_types', {}),
+    'aiorise/events/event_types.py': ('generate_event_types', {}),
+    'aiorise/api/request_types.py': ('generate_request_types', {}),
+    'aiorise/api/response_types.py': ('generate_response_types', {}),
+    'aiorise/api/client_methods.py': ('generate_api_requests', {'builders': True}),
+    'aiorise/structs/object_types.py': ('generate_object_types', {'target': 'msgspec'}),
+    'aiorise/structs/event_types.py': ('generate_event_types', {'target': 'msgspec'}),
+    'aiorise/structs/request_types.py': ('generate_request_types', {'target': 'msgspec'}),
+    'aiorise/structs/response_types.py': ('generate_response_types', {'target': 'msgspec'}),
+}
+
+
+def message_refs(schema: dict, operation: str, suffix: str) -> list[str]:
+    return [
+        obj['$ref']
+        for obj in schema['channels']['/web/webapi'][operation]['message']['payload']['oneOf']
+        if obj['$ref'].endswith(suffix)
+    ]
+
+
+def ref_closure(schema: dict, refs: list[str]) -> dict[str, Any]:
+    found = {}
+    pending = list(refs)
+
+    while pending:
+        ref = pending.pop()
+        if ref in found:
+            continue
+        found[ref] = get_by_ref(schema, ref)
+        pending += [
+            value for key, value in walk(found[ref])
+            if key == '$ref'
+        ]
+
+    return found
+
+
+def walk(node: Any):
+    if isinstance(node, dict):
+        for key, value in node.items():
+            yield key, value
+            yield from walk(value)
+    elif isinstance(node, list):
+        for value in node:
+            yield from walk(value)
+
+
+def schema_slice(schema: dict, generator: str) -> Any:
+    """The part of the schema a generator reads, so unrelated edits skip it."""
+    match generator:
+        case 'generate_object_types':
+            return {
+                'schemas': schema['components']['schemas'],
+                'publish': message_refs(schema, 'publish', ''),
+                'subscribe': message_refs(schema, 'subscribe', ''),
+            }
+        case 'generate_event_types':
+            return ref_closure(schema, message_refs(schema, 'subscribe', 'Event'))
+        case 'generate_response_types':
+            return ref_closure(schema, message_refs(schema, 'subscribe', 'Response'))
+        case 'generate_request_types':
+            return ref_closure(schema, message_refs(schema, 'publish', 'Request'))
+        case 'generate_api_requests':
+            return {
+                'requests': ref_closure(schema, message_refs(schema, 'publish', 'Request')),
+                'responses': message_refs(schema, 'subscribe', 'Response'),
+            }
+        case _:
+            return schema
+
+
+def fingerprint(schema: dict, generator: str, options: dict[str, Any]) -> str:
+    digest = hashlib.sha256()
+    digest.update(json.dumps(schema_slice(schema, generator), sort_keys=True).encode())
+    digest.update(json.dumps(options, sort_keys=True).encode())
+    digest.update(black.__version__.encode())
+
+    # A change to the generator itself invalidates its outputs too
+    for module in ('codegen', generator):
+        path = os.path.join(os.path.dirname(__file__), f'{module}.py')
+        with open(path, 'rb') as file:
+            digest.update(file.read())
+
+    return digest.hexdigest()
+
+
+def render(generator: str, options: dict[str, Any], schema: dict) -> str:
+    module = importlib.import_module(f'{__package__}.{generator}')
+    return black.format_str(unroll(module.gen_source_code(schema, **options)), mode=black.Mode())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Generate every API module from the schema in one pass')
+    parser.add_argument('--schema', default='api.json')
+    parser.add_argument('--cache', default='.codegen-cache.json', help='where output fingerprints are kept')
+    parser.add_argument('--force', action='store_true', help='regenerate even unchanged modules')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count(), help='parallel render processes')
+    parser.add_argument('outputs', nargs='*', help='only these modules (default: all)')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+
+    with open(args.schema, 'r') as file:
+        schema = json.load(file)
+
+    try:
+        with open(args.cache, 'r') as file:
+            cache = json.load(file)
+    except (FileNotFoundError, json.JSONDecodeError):
+        cache = {}
+
+    stale = {}
+    for output in args.outputs or TARGETS:
+        generator, options = TARGETS[output]
+        digest = fingerprint(schema, generator, options)
+        if args.force or cache.get(output) != digest or not os.path.exists(output):
+            stale[output] = digest
+
+    if len(stale) > 1 and args.jobs > 1:
+        with ProcessPoolExecutor(min(args.jobs, len(stale))) as pool:
+            futures = {
+                output: pool.submit(render, *TARGETS[output], schema)
+                for output in stale
+            }
+            sources = {output: future.result() for output, future in futures.items()}
+    else:
+        sources = {output: render(*TARGETS[output], schema) for output in stale}
+
+    written = 0
+    for output, source in sources.items():
+        # Untouched files keep their mtime, so make and editors see no change
+        try:
+            with open(output, 'r') as file:
+                unchanged = file.read() == source
+        except FileNotFoundError:
+            unchanged = False
+
+        if not unchanged:
+            with open(output, 'w') as file:
+                file.write(source)
+            written += 1
+
+        cache[output] = stale[output]
+
+    with open(args.cache, 'w') as file:
+        json.dump(cache, file, indent=2, sort_keys=True)
+
+    print(
+        f'{len(stale)} regenerated ({written} changed), '
+        f'{len(args.outputs or TARGETS) - len(stale)} up to date '
+        f'in {time.perf_counter() - start:.2f}s'
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -1,3 +1,4 @@
+import argparse
 import json
 from functools import reduce
 
@@ -51,11 +52,13 @@ def gen_default_value(meta: dict, required: bool) -> str:
 def gen_class(
     name: str,
     ignore_props: list[str],
-    meta: dict
+    meta: dict,
+    defer_build: bool = False
 ) -> tuple[str, CodeBlocks]:
     
     cls_def_start = f"class {name}(BaseModel):"
     docstring = f'"""{meta["description"]}"""' if meta.get("description") else ''
+    config = ['model_config = ConfigDict(defer_build=True)'] if defer_build else []
     
     cls_body = [
         f'{name}: ' 
@@ -68,10 +71,71 @@ def gen_class(
     return (
         cls_def_start, [
             docstring,
+            *config,
             *cls_body
         ]
     )
 
+def has_struct_union(meta: dict) -> bool:
+    match meta:
+        case {"oneOf": [*variants], **rest}:
+            return sum("$ref" in variant for variant in variants) > 1 or any(map(has_struct_union, variants))
+        case {"prefixItems": [*variants], **rest}:
+            return any(map(has_struct_union, variants))
+        case {"items": {**items_meta}, **rest}:
+            return has_struct_union(items_meta)
+        case _:
+            return False
+
+def gen_struct(
+    name: str,
+    ignore_props: list[str],
+    meta: dict,
+    tag: bool = False
+) -> tuple[str, CodeBlocks]:
+    options = ["msgspec.Struct", "kw_only=True", "omit_defaults=True"]
+    if tag:
+        options += ['tag_field="_type"', f'tag="{name}"']
+
+    cls_def_start = f"class {name}({', '.join(options)}):"
+    docstring = f'"""{meta["description"]}"""' if meta.get("description") else ''
+
+    props = [
+        (name, prop_meta, name in meta.get("required", []))
+        for name, prop_meta in meta["properties"].items()
+        if name not in ignore_props
+    ]
+
+    # msgspec only decodes unions of structs that are tagged, these are
+    # decoded as plain values and converted once the struct is built
+    converted = [
+        (name, gen_type_hint(prop_meta, required))
+        for name, prop_meta, required in props
+        if has_struct_union(prop_meta)
+    ]
+
+    cls_body = [
+        f'{name}: '
+        + ("Any" if has_struct_union(prop_meta) else gen_type_hint(prop_meta, required))
+        + gen_default_value(prop_meta, required)
+        for name, prop_meta, required in props
+    ]
+
+    post_init = [
+        "def __post_init__(self) -> None:", [
+            f"self.{name} = convert(self.{name}, {type_hint})"
+            for name, type_hint in converted
+        ]
+    ] if converted else []
+
+    return (
+        cls_def_start, [
+            docstring,
+            *cls_body,
+            *post_init
+        ] if docstring or cls_body else ['pass']
+    )
+
 def gen_func(
     name: str, 
     additional_args: list[tuple[str, str, str]], 
@@ -101,6 +165,15 @@ def gen_func(
     )
 
 
+def parse_target() -> str:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        '--target', choices=['pydantic', 'msgspec'], default='pydantic',
+        help='emit pydantic models or msgspec structs'
+    )
+    return parser.parse_args().target
+
+
 def unroll(blocks: CodeBlocks, indent: int = 0) -> str:
     return '\n'.join([
         ' ' * indent * 4 + block if isinstance(block, str) 
@@ -1,7 +1,25 @@
 from .codegen import gen_func, get_by_ref, CodeBlocks, unroll
 
+import argparse
 import json
 
+
+# Outbound scheduling class of each request, anything not listed is sent as
+# a plain REQUEST
+PRIORITIES = {
+    'KeepaliveRequest': 'CONTROL',
+    'ModerateRoomRequest': 'MODERATION',
+    'ChangeRoomPrivilegeRequest': 'MODERATION',
+    'MoveUserToRoomRequest': 'MODERATION',
+    'InviteSpeakerRequest': 'MODERATION',
+    'RemoveSpeakerRequest': 'MODERATION',
+    'ChatRequest': 'CHAT',
+    'ChannelRequest': 'CHAT',
+    'EmoteRequest': 'CHAT',
+    'ReactionRequest': 'CHAT',
+    'SendMessageRequest': 'CHAT',
+}
+
 def pascal_to_snake(name: str) -> str:
     return ''.join([
         '_' + char.lower() if char.isupper() else char
@@ -9,26 +27,69 @@ def pascal_to_snake(name: str) -> str:
     ]).removeprefix('_')
 
 
-def gen_api_request(name: str, meta: dict, returns_result: bool) -> tuple[str, CodeBlocks]:
+def gen_serializer(name: str, meta: dict, required: bool) -> str:
+    match meta:
+        case {"$ref": _}:
+            value = f"{name}.model_dump(by_alias=True)"
+        case {"type": "array", "items": {"$ref": _}}:
+            value = f"[item.model_dump(by_alias=True) for item in {name}]"
+        case _:
+            return name
+
+    return value if required else f"{value} if {name} is not None else None"
+
+
+def is_constant(meta: dict) -> bool:
+    return not [prop for prop in meta['properties'] if prop != 'rid']
+
+
+def template_name(name: str) -> str:
+    return pascal_to_snake(name).upper() + '_FRAME'
+
+
+def gen_api_request(name: str, meta: dict, returns_result: bool, builders: bool = False) -> tuple[str, CodeBlocks]:
+    required = meta.get('required', [])
     send_args = [('_type', f"'{name}'")] + [
-        (name, name) for name in meta['properties'].keys()
-        if name != 'rid'
+        (prop, gen_serializer(prop, prop_meta, prop in required) if builders else prop)
+        for prop, prop_meta in meta['properties'].items()
+        if prop != 'rid'
     ]
 
     send_args_dict = "{" + ','.join([f"'{key}': {value}" for key, value in send_args]) + "}"
-    
+    priority = f"Priority.{PRIORITIES.get(name, 'REQUEST')}"
+
+    if builders and is_constant(meta):
+        # Nothing varies but the rid, the frame was encoded at import time
+        func_body = []
+        send = f"self._connection.send_template({template_name(name)}"
+    elif builders:
+        # The typed signature already constrains the arguments, so the frame
+        # is built directly and only checked against the model when debugging.
+        # A request with its own 'type' property shadows the discriminator
+        # field on the generated model, which then cannot validate it.
+        func_body = [f"request = {send_args_dict}"]
+        if 'type' not in meta['properties']:
+            func_body += [
+                "if debug.validate_requests:", [
+                    f"from aiorise.api.request_types import {name}",
+                    f"{name}.model_validate(request)"
+                ]
+            ]
+        send = "self._connection.send(request"
+    else:
+        func_body = [f"request = {name}.model_validate({send_args_dict})"]
+        send = "self._connection.send(request.model_dump()"
+
     if returns_result:
         resp_type = name.removesuffix('Request') + 'Response'
-        func_body = [
-            f"request = {name}.model_validate({send_args_dict})",
-            f"return {resp_type}.model_validate(await self._connection.send(request.model_dump()))"
-        ]
+        func_body.append(
+            f"return {resp_type}.model_validate(await {send}, priority={priority}))"
+        )
     else:
         resp_type = 'None'
-        func_body = [
-            f"request = {name}.model_validate({send_args_dict})",
-            f"await self._connection.send(request.model_dump(), False)"
-        ]
+        func_body.append(
+            f"await {send}, False, priority={priority})"
+        )
 
     func = gen_func(
         pascal_to_snake(name).removesuffix('_request'),
@@ -41,12 +102,21 @@ def gen_api_request(name: str, meta: dict, returns_result: bool) -> tuple[str, C
 
     return func
 
-def gen_source_code(schema: dict) -> CodeBlocks:
+def gen_source_code(schema: dict, builders: bool = False) -> CodeBlocks:
     imports = [
         'from aiorise.api.response_types import *',
         'from aiorise.api.request_types import *',
-        'from aiorise.api.protocols import HaveApiConnection'
+        'from aiorise.api.protocols import HaveApiConnection',
+        'from aiorise.connection.scheduler import Priority'
     ]
+    if builders:
+        # Request models are only needed to validate in debug mode, they are
+        # imported there so the module is not loaded otherwise
+        imports.remove('from aiorise.api.request_types import *')
+        imports += [
+            'from aiorise.api import debug',
+            'from aiorise.connection.template import FrameTemplate'
+        ]
 
     response_types = [
         obj['$ref'] 
@@ -54,14 +124,26 @@ def gen_source_code(schema: dict) -> CodeBlocks:
         if obj['$ref'].endswith('Response')
     ]
 
+    requests = [
+        (obj['$ref'], get_by_ref(schema, obj['$ref']))
+        for obj in schema['channels']['/web/webapi']['publish']['message']['payload']['oneOf']
+        if obj['$ref'].endswith('Request')
+    ]
+
+    templates = [
+        f"{template_name(ref.split('/')[-1])} = FrameTemplate('{ref.split('/')[-1]}')"
+        for ref, meta in requests
+        if builders and is_constant(meta)
+    ]
+
     api_methods = [
         gen_api_request(
-            obj['$ref'].split('/')[-1], 
-            get_by_ref(schema, obj['$ref']),
-            obj['$ref'].removesuffix('Request') + 'Response' in response_types
+            ref.split('/')[-1],
+            meta,
+            ref.removesuffix('Request') + 'Response' in response_types,
+            builders
         )
-        for obj in schema['channels']['/web/webapi']['publish']['message']['payload']['oneOf']
-        if obj['$ref'].endswith('Request')
+        for ref, meta in requests
     ]
 
     cls_def = [
@@ -72,12 +154,20 @@ def gen_source_code(schema: dict) -> CodeBlocks:
 
     return [
         *imports,
+        *templates,
         *cls_def
     ]
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        '--builders', action='store_true',
+        help='build request frames as plain dicts instead of through the request models'
+    )
+    args = parser.parse_args()
+
     with open('api.json', 'r') as file:
         schema = json.load(file)
 
-    code = gen_source_code(schema)
+    code = gen_source_code(schema, args.builders)
     print(unroll(code))
@@ -1,8 +1,11 @@
-from .codegen import get_by_ref, gen_class, unroll, CodeBlocks
+from .codegen import get_by_ref, gen_class, gen_struct, parse_target, unroll, CodeBlocks
 
 import json
 
-def gen_event_class(name: str, schema: dict) -> tuple[str, CodeBlocks]:
+def gen_event_class(name: str, schema: dict, target: str = 'pydantic') -> tuple[str, CodeBlocks]:
+    if target == 'msgspec':
+        return gen_struct(name, [], schema, tag=True)
+
     generated_cls = gen_class(name, [], schema)
     
     generated_cls[1].insert(
@@ -12,12 +15,19 @@ def gen_event_class(name: str, schema: dict) -> tuple[str, CodeBlocks]:
     return generated_cls
 
 
-def gen_source_code(schema: dict) -> CodeBlocks: 
-    imports = [
-        'from pydantic import BaseModel, Field',
-        'from typing import Literal, Any',
-        'from aiorise.objects.object_types import *',
-    ]
+def gen_source_code(schema: dict, target: str = 'pydantic') -> CodeBlocks: 
+    if target == 'msgspec':
+        imports = [
+            'from typing import Literal, Any',
+            'from aiorise.structs.object_types import *',
+            'import msgspec',
+        ]
+    else:
+        imports = [
+            'from pydantic import BaseModel, Field',
+            'from typing import Annotated, Literal, Any',
+            'from aiorise.objects.object_types import *',
+        ]
 
 
     event_schemas = [
@@ -27,11 +37,18 @@ def gen_source_code(schema: dict) -> CodeBlocks:
     ]
 
     
-    events_union_type = f"AnyEvent = {'|'.join(name for name, _ in event_schemas)}"
+    if target == 'msgspec':
+        # Structs are tagged on `_type`, a plain union is already discriminated
+        events_union_type = f"AnyEvent = {'|'.join(name for name, _ in event_schemas)}"
+    else:
+        events_union_type = (
+            f"AnyEvent = Annotated[{'|'.join(name for name, _ in event_schemas)}, "
+            "Field(discriminator='type')]"
+        )
     
 
     event_classes = [
-        gen_event_class(name, schema)
+        gen_event_class(name, schema, target)
         for name, schema in event_schemas
     ]
    
@@ -48,7 +65,7 @@ if __name__ == '__main__':
     with open('api.json', 'r') as file:
         schema = json.load(file)
 
-    code = gen_source_code(schema)
+    code = gen_source_code(schema, parse_target())
     print(unroll(code))
 
 
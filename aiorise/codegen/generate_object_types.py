@@ -1,12 +1,21 @@
-from .codegen import gen_class, unroll, CodeBlocks
+from .codegen import gen_class, gen_struct, parse_target, unroll, CodeBlocks
 
 import json
 
-def gen_source_code(schema: dict) -> CodeBlocks:
-    imports = [
-        'from pydantic import BaseModel, Field',
-        'from typing import Literal, Any',
-    ]
+def gen_source_code(schema: dict, target: str = 'pydantic') -> CodeBlocks:
+    if target == 'msgspec':
+        imports = [
+            'from typing import Literal, Any',
+            'from aiorise.structs.convert import convert',
+            'import msgspec',
+        ]
+    else:
+        imports = [
+            'from pydantic import BaseModel, Field',
+            'from typing import Literal, Any',
+        ]
+
+    gen = gen_struct if target == 'msgspec' else gen_class
 
 
     pub_components = [
@@ -21,7 +30,7 @@ def gen_source_code(schema: dict) -> CodeBlocks:
 
 
     object_classes = [
-        gen_class(obj_name, [], obj_schema)
+        gen(obj_name, [], obj_schema)
         for obj_name, obj_schema in schema['components']['schemas'].items()
         if obj_name not in [*pub_components, *sub_components]
     ]
@@ -38,5 +47,5 @@ if __name__ == '__main__':
     with open('api.json', 'r') as file:
         schema = json.load(file)
 
-    code = gen_source_code(schema)
+    code = gen_source_code(schema, parse_target())
     print(unroll(code))
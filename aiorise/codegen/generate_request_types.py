@@ -1,23 +1,35 @@
-from .codegen import get_by_ref, gen_class, unroll, CodeBlocks
+from .codegen import get_by_ref, gen_class, gen_struct, parse_target, unroll, CodeBlocks
 
 import json
 
-def gen_request_class(name: str, schema: dict) -> tuple[str, CodeBlocks]:
-    generated_cls = gen_class(name, ["rid"], schema)
+def gen_request_class(name: str, schema: dict, target: str = 'pydantic') -> tuple[str, CodeBlocks]:
+    if target == 'msgspec':
+        return gen_struct(name, ["rid"], schema, tag=True)
+
+    # Most bots only ever send a handful of request types, their validators
+    # are built on first use instead of at import
+    generated_cls = gen_class(name, ["rid"], schema, defer_build=True)
     
     generated_cls[1].insert(
-        1, f'type: Literal["{name}"] = Field(alias="_type")'
+        2, f'type: Literal["{name}"] = Field(alias="_type")'
     )
     
     return generated_cls
 
 
-def gen_source_code(schema: dict) -> CodeBlocks:
-    imports = [
-        'from pydantic import BaseModel, Field',
-        'from typing import Literal, Any',
-        'from aiorise.objects.object_types import *',
-    ]
+def gen_source_code(schema: dict, target: str = 'pydantic') -> CodeBlocks:
+    if target == 'msgspec':
+        imports = [
+            'from typing import Literal, Any',
+            'from aiorise.structs.object_types import *',
+            'import msgspec',
+        ]
+    else:
+        imports = [
+            'from pydantic import BaseModel, ConfigDict, Field',
+            'from typing import Literal, Any',
+            'from aiorise.objects.object_types import *',
+        ]
 
     request_schemas = [
         (obj['$ref'].split('/')[-1], get_by_ref(schema, obj['$ref']))
@@ -26,7 +38,7 @@ def gen_source_code(schema: dict) -> CodeBlocks:
     ]
 
     response_classes = [
-        gen_request_class(name, schema)
+        gen_request_class(name, schema, target)
         for name, schema in request_schemas
     ]
 
@@ -40,5 +52,5 @@ if __name__ == '__main__':
     with open('api.json', 'r') as file:
         schema = json.load(file)
 
-    code = gen_source_code(schema)
+    code = gen_source_code(schema, parse_target())
     print(unroll(code))
@@ -1,23 +1,35 @@
-from .codegen import get_by_ref, gen_class, unroll, CodeBlocks
+from .codegen import get_by_ref, gen_class, gen_struct, parse_target, unroll, CodeBlocks
 
 import json
 
-def gen_response_class(name: str, schema: dict) -> tuple[str, CodeBlocks]:
-    generated_cls = gen_class(name, ["rid"], schema)
+def gen_response_class(name: str, schema: dict, target: str = 'pydantic') -> tuple[str, CodeBlocks]:
+    if target == 'msgspec':
+        return gen_struct(name, ["rid"], schema, tag=True)
+
+    # Only responses to requests a bot actually sends are ever validated,
+    # so their validators are built on first use instead of at import
+    generated_cls = gen_class(name, ["rid"], schema, defer_build=True)
     
     generated_cls[1].insert(
-        1, f'type: Literal["{name}"] = Field(alias="_type")'
+        2, f'type: Literal["{name}"] = Field(alias="_type")'
     )
     
     return generated_cls
 
 
-def gen_source_code(schema: dict) -> CodeBlocks:
-    imports = [
-        'from pydantic import BaseModel, Field',
-        'from typing import Literal, Any',
-        'from aiorise.objects.object_types import *',
-    ]
+def gen_source_code(schema: dict, target: str = 'pydantic') -> CodeBlocks:
+    if target == 'msgspec':
+        imports = [
+            'from typing import Literal, Any',
+            'from aiorise.structs.object_types import *',
+            'import msgspec',
+        ]
+    else:
+        imports = [
+            'from pydantic import BaseModel, ConfigDict, Field',
+            'from typing import Annotated, Literal, Any',
+            'from aiorise.objects.object_types import *',
+        ]
 
     response_schemas = [
         (obj['$ref'].split('/')[-1], get_by_ref(schema, obj['$ref']))
@@ -27,14 +39,24 @@ def gen_source_code(schema: dict) -> CodeBlocks:
 
 
     response_classes = [
-        gen_response_class(name, schema)
+        gen_response_class(name, schema, target)
         for name, schema in response_schemas
     ]
 
 
+    if target == 'msgspec':
+        responses_union_type = f"AnyResponse = {'|'.join(name for name, _ in response_schemas)}"
+    else:
+        responses_union_type = (
+            f"AnyResponse = Annotated[{'|'.join(name for name, _ in response_schemas)}, "
+            "Field(discriminator='type')]"
+        )
+
+
     return [
         *imports,
         *[line for response_class in response_classes for line in response_class],
+        responses_union_type
     ]
 
 
@@ -42,5 +64,5 @@ if __name__ == '__main__':
     with open('api.json', 'r') as file:
         schema = json.load(file)
 
-    code = gen_source_code(schema)
+    code = gen_source_code(schema, parse_target())
     print(unroll(code))
@@ -1 +1,7 @@
 from .connection import BaseApiConnection, HighriseWebApiConnection
+from .codec import BaseCodec, JsonCodec, OrjsonCodec, MsgspecCodec
+from .pending import PendingRequests, RequestLimitExceeded
+from .window import RequestWindow
+from .scheduler import OutboundScheduler, Priority, TokenBucket
+from .backoff import Backoff
+from .template import FrameTemplate
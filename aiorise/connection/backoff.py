@@ -0,0 +1,30 @@
+from typing import Iterator
+
+import itertools
+import random
+
+
+class Backoff:
+    _initial: float
+    _maximum: float
+    _factor: float
+    _attempts: int | None
+
+    def __init__(
+        self,
+        initial: float = 0.5,
+        maximum: float = 30,
+        factor: float = 2,
+        attempts: int | None = None
+    ):
+        self._initial = initial
+        self._maximum = maximum
+        self._factor = factor
+        self._attempts = attempts
+
+
+    def delays(self) -> Iterator[float]:
+        attempts = itertools.count() if self._attempts is None else range(self._attempts)
+        for attempt in attempts:
+            # Full jitter, so rooms dropped together do not reconnect in lockstep
+            yield random.uniform(0, min(self._maximum, self._initial * self._factor ** attempt))
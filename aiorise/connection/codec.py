@@ -0,0 +1,73 @@
+from abc import ABC, abstractmethod
+from typing import Any, Callable
+
+import json
+
+
+class BaseCodec(ABC):
+    # When set, event frames are handed to pydantic undecoded so they are
+    # validated straight from JSON instead of via an intermediate dict
+    validates_raw: bool = False
+
+    @abstractmethod
+    def encode(self, payload: dict) -> str:
+        pass
+
+    @abstractmethod
+    def decode(self, frame: str | bytes) -> dict:
+        pass
+
+
+class JsonCodec(BaseCodec):
+    def encode(self, payload: dict) -> str:
+        return json.dumps(payload)
+
+    def decode(self, frame: str | bytes) -> dict:
+        return json.loads(frame)
+
+
+class OrjsonCodec(BaseCodec):
+    validates_raw = True
+
+    _dumps: Callable[[Any], bytes]
+    _loads: Callable[[str | bytes], Any]
+
+    def __init__(self):
+        # Optional dependencies are imported on use so they cost no start-up
+        # time for bots that stay on the default codec
+        try:
+            import orjson
+        except ImportError:
+            raise ImportError("OrjsonCodec requires the orjson package") from None
+
+        self._dumps = orjson.dumps
+        self._loads = orjson.loads
+
+    def encode(self, payload: dict) -> str:
+        # Text frames: the server does not accept binary websocket messages
+        return self._dumps(payload).decode()
+
+    def decode(self, frame: str | bytes) -> dict:
+        return self._loads(frame)
+
+
+class MsgspecCodec(BaseCodec):
+    validates_raw = True
+
+    _encoder: "msgspec.json.Encoder"
+    _decoder: "msgspec.json.Decoder[dict]"
+
+    def __init__(self):
+        try:
+            import msgspec
+        except ImportError:
+            raise ImportError("MsgspecCodec requires the msgspec package") from None
+
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder(dict)
+
+    def encode(self, payload: dict) -> str:
+        return self._encoder.encode(payload).decode()
+
+    def decode(self, frame: str | bytes) -> dict:
+        return self._decoder.decode(frame)
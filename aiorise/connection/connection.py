@@ -1,15 +1,46 @@
-from collections import defaultdict
 from websockets.client import WebSocketClientProtocol
-from typing import NoReturn, AsyncIterable
+from typing import Callable, NoReturn, AsyncIterable, Container, Literal
 from abc import ABC, abstractmethod
+from .backoff import Backoff
+from .codec import BaseCodec, JsonCodec
+from .pending import PendingRequests
+from .scheduler import OutboundScheduler, Priority
+from .template import FrameTemplate
+from .window import RequestWindow
 
 import asyncio
+import functools
+import itertools
+import re
+import time
 
 import websockets.client
 import websockets.exceptions
 
-import json
-import random
+
+# Anchored at the opening brace, so they only match the first key of the
+# top-level object, never one of a nested object
+_TYPE_PATTERN = re.compile(r'\s*\{\s*"_type"\s*:\s*"([^"]*)"')
+_RID_PATTERN = re.compile(r'\s*\{\s*"rid"\s*:')
+
+_KEEPALIVE = FrameTemplate("KeepaliveRequest")
+
+
+def peek(frame: str, decode: Callable[[str], dict]) -> tuple[str | None, bool, dict | None]:
+    """Event type of a frame and whether it is a response, parsing it only when needed.
+
+    Returns the decoded frame as well when it had to be parsed.
+    """
+    if '"rid"' not in frame:
+        if match := _TYPE_PATTERN.match(frame):
+            return match.group(1), False, None
+    elif _RID_PATTERN.match(frame):
+        return None, True, None
+
+    # The key is not first, only a full decode tells a top-level key from a
+    # nested one
+    message = decode(frame)
+    return message.get("_type"), "rid" in message, message
 
 
 class BaseApiConnection(ABC):
@@ -22,43 +53,130 @@ class BaseApiConnection(ABC):
         pass
 
     @abstractmethod
-    async def send(self, payload: dict, wait_for_resp: bool = True) -> dict:
+    async def send(
+        self,
+        payload: dict,
+        wait_for_resp: bool = True,
+        priority: Priority = Priority.REQUEST
+    ) -> dict:
         pass
 
+    async def send_template(
+        self,
+        template: FrameTemplate,
+        wait_for_resp: bool = True,
+        priority: Priority = Priority.REQUEST
+    ) -> dict:
+        return await self.send(template.payload, wait_for_resp, priority)
+
     @abstractmethod
     async def listen(self) -> AsyncIterable[dict]:
         pass
 
+    async def listen_raw(
+        self,
+        types: Container[str] | None = None
+    ) -> AsyncIterable[tuple[str, str | dict]]:
+        async for message in self.listen(): # type: ignore
+            if types is None or message["_type"] in types:
+                yield message["_type"], message
+
 class HighriseWebApiConnection(BaseApiConnection):
     _keepalive_timeout: int = 15
     _websocket: WebSocketClientProtocol
-    _keepalive_task: asyncio.Task
-    _requests: dict[str, asyncio.Future[dict]]
+    _keepalive_task: asyncio.Task | None
+    _connected: asyncio.Event
+    _closing: bool
+    _reconnect: bool
+    _backoff: Backoff
+    _requests: PendingRequests
+    _window: RequestWindow
+    _scheduler: OutboundScheduler
+    _codec: BaseCodec
+    _rids: itertools.count
     
     uri: str
     api_token: str
     room_id: str
+    pending_policy: Literal["fail", "resend"]
+
+    reconnects: int
+    reconnect_time: float | None
+    downtime: float
 
 
-    def __init__(self, uri: str, api_token: str, room_id: str):
-        self._requests = defaultdict(asyncio.Future)
+    def __init__(
+        self,
+        uri: str,
+        api_token: str,
+        room_id: str,
+        codec: BaseCodec | None = None,
+        request_timeout: float | None = 30,
+        max_pending: int = 1024,
+        window: RequestWindow | None = None,
+        rates: dict[Priority, tuple[float, float] | None] | None = None,
+        reconnect: bool = True,
+        backoff: Backoff | None = None,
+        pending_policy: Literal["fail", "resend"] = "fail"
+    ):
+        self._keepalive_task = None
+        self._connected = asyncio.Event()
+        self._closing = False
+        self._reconnect = reconnect
+        self._backoff = backoff if backoff is not None else Backoff()
+        self._requests = PendingRequests(request_timeout, max_pending)
+        self._window = window if window is not None else RequestWindow()
+        self._scheduler = OutboundScheduler(self._write, rates)
+        self._codec = codec if codec is not None else JsonCodec()
+        self._rids = itertools.count()
         
         self.uri = uri
         self.api_token = api_token
         self.room_id = room_id
+        self.pending_policy = pending_policy
+
+        self.reconnects = 0
+        self.reconnect_time = None
+        self.downtime = 0
+
+
+    @property
+    def requests(self) -> PendingRequests:
+        return self._requests
+
+
+    @property
+    def window(self) -> RequestWindow:
+        return self._window
+
+
+    @property
+    def scheduler(self) -> OutboundScheduler:
+        return self._scheduler
 
 
     async def _keepalive(self) -> NoReturn:
         while True:
             await asyncio.sleep(self._keepalive_timeout)
-            await self.send({"_type": "KeepaliveRequest"})
+            try:
+                await self.send_template(_KEEPALIVE, priority=Priority.CONTROL)
+            except (TimeoutError, ConnectionError, websockets.exceptions.ConnectionClosed):
+                continue
+
+
+    async def _write(self, frame: str) -> None:
+        # Frames queued while reconnecting are held until the new socket is up
+        await self._connected.wait()
+        await self._websocket.send(frame)
 
 
     def _generate_rid(self) -> str:
-        return random.randbytes(16).hex()
+        # Only has to be unique among this connection's requests, and the
+        # counter outlives reconnects, so resent frames never collide
+        return format(next(self._rids), "x")
 
 
-    async def connect(self) -> None:
+    async def _open(self) -> None:
         self._websocket = await websockets.client.connect(
             self.uri, 
             extra_headers={
@@ -70,37 +188,176 @@ class HighriseWebApiConnection(BaseApiConnection):
         session_metadata = await self._websocket.recv()
 
         self._keepalive_task = asyncio.create_task(self._keepalive()) 
+        self._connected.set()
+
+
+    async def connect(self) -> None:
+        self._closing = False
+        await self._open()
+
+
+    async def _reopen(self) -> None:
+        self._connected.clear()
+        if self._keepalive_task is not None:
+            self._keepalive_task.cancel()
+
+        # Requests still queued were never written and simply go out on the
+        # new socket, only the ones written to the old one can be lost
+        lost = self._requests.unanswered()
+        if self.pending_policy == "fail":
+            self._requests.fail((rid for rid, _, _ in lost), ConnectionError("Connection lost"))
+            lost = []
+
+        start = time.monotonic()
+        for delay in self._backoff.delays():
+            await asyncio.sleep(delay)
+            try:
+                await self._open()
+                break
+            except websockets.exceptions.InvalidStatusCode as e:
+                # A rejected token or room is rejected again on every
+                # attempt, only server errors are worth retrying
+                if 400 <= e.status_code < 500:
+                    raise
+                continue
+            except (OSError, TimeoutError, websockets.exceptions.WebSocketException):
+                continue
+        else:
+            raise ConnectionError(f"Could not reconnect to {self.uri}")
+
+        self.reconnects += 1
+        self.reconnect_time = time.monotonic() - start
+        self.downtime += self.reconnect_time
+
+        for rid, frame, priority in lost:
+            # Callers may have timed out while we were reconnecting
+            if rid in self._requests:
+                self._scheduler.submit(frame, priority).add_done_callback(
+                    functools.partial(self._resent, rid, frame, priority)
+                )
+
+
+    def _resent(self, rid: str, frame: str, priority: Priority, future: asyncio.Future[None]) -> None:
+        # Failures surface to the waiting caller as a timeout, nothing
+        # awaits the resend itself
+        if not future.cancelled() and future.exception() is None:
+            self._requests.written(rid, frame, priority)
    
 
     async def close(self) -> None:
-        self._keepalive_task.cancel() 
+        self._closing = True
+        self._connected.clear()
+        if self._keepalive_task is not None:
+            self._keepalive_task.cancel() 
+        self._scheduler.close()
         await self._websocket.close()  
+        self._requests.fail_all(ConnectionError("Connection closed"))
  
 
-    async def send(self, payload: dict, wait_for_resp: bool = True) -> dict:
+    async def send(
+        self,
+        payload: dict,
+        wait_for_resp: bool = True,
+        priority: Priority = Priority.REQUEST
+    ) -> dict:
         rid = self._generate_rid()
         payload["rid"] = rid
-            
-        await self._websocket.send(json.dumps(payload))
+        return await self._send_frame(rid, self._codec.encode(payload), wait_for_resp, priority)
 
-        if wait_for_resp:
-            result = await self._requests[rid]
-            del self._requests[rid]
-            return result
-        else:
+
+    async def send_template(
+        self,
+        template: FrameTemplate,
+        wait_for_resp: bool = True,
+        priority: Priority = Priority.REQUEST
+    ) -> dict:
+        rid = self._generate_rid()
+        return await self._send_frame(rid, template.render(rid), wait_for_resp, priority)
+
+
+    async def _send_frame(
+        self,
+        rid: str,
+        frame: str,
+        wait_for_resp: bool,
+        priority: Priority
+    ) -> dict:
+        # Bounded even while the socket is down, a sender must not outwait
+        # its own deadline in the queue
+        if not wait_for_resp:
+            async with asyncio.timeout(self._requests.timeout):
+                await self._scheduler.send(frame, priority)
             return {}
 
+        # Control and moderation traffic is never held back by bulk requests
+        # occupying the window
+        gated = priority >= Priority.REQUEST
+        if gated:
+            await self._window.acquire()
 
-    async def listen(self) -> AsyncIterable[dict]:
-        async for message in self._websocket:
-            try:
-                message = json.loads(message)
+        future = None
+        start = None
+        rtt = None
+        try:
+            future = self._requests.add(rid)
+            async with asyncio.timeout(self._requests.timeout):
+                await self._scheduler.send(frame, priority)
+            self._requests.written(rid, frame, priority)
+            # Time spent queued behind our own rate limits says nothing
+            # about the server, only the round trip counts
+            start = time.monotonic()
+            result = await future
+            rtt = time.monotonic() - start
+            return result
+        except TimeoutError:
+            if gated and start is not None:
+                self._window.backoff()
+            raise
+        finally:
+            # No-op once answered; otherwise drops the entry of a request
+            # that failed to send or whose caller was cancelled
+            if future is not None:
+                future.cancel()
+            if gated:
+                self._window.release(rtt)
 
-                if rid := message.get("rid"):
-                    del message["rid"]
-                    self._requests[rid].set_result(message)
-                else:
-                    yield message
 
-            except websockets.exceptions.ConnectionClosed:
-                continue
+    async def listen_raw(
+        self,
+        types: Container[str] | None = None
+    ) -> AsyncIterable[tuple[str, str | dict]]:
+        try:
+            while True:
+                try:
+                    async for message in self._websocket:
+                        event_type, response, decoded = peek(message, self._codec.decode)
+
+                        if response:
+                            message = decoded if decoded is not None else self._codec.decode(message)
+                            self._requests.resolve(message.pop("rid"), message)
+                            continue
+
+                        if types is None or event_type in types:
+                            if decoded is not None:
+                                message = decoded
+                            elif not self._codec.validates_raw:
+                                message = self._codec.decode(message)
+                            yield event_type, message
+
+                except websockets.exceptions.ConnectionClosed:
+                    pass
+
+                if self._closing or not self._reconnect:
+                    break
+
+                await self._reopen()
+        finally:
+            # Nothing will write or answer them any more, including when
+            # reconnecting gave up
+            self._scheduler.close()
+            self._requests.fail_all(ConnectionError("Connection closed"))
+
+
+    async def listen(self) -> AsyncIterable[dict]:
+        async for _, message in self.listen_raw():
+            yield message if isinstance(message, dict) else self._codec.decode(message)
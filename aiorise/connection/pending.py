@@ -0,0 +1,110 @@
+from typing import Iterable
+from .scheduler import Priority
+
+import asyncio
+
+
+class RequestLimitExceeded(Exception):
+    pass
+
+
+class PendingRequests:
+    _futures: dict[str, asyncio.Future[dict]]
+    _frames: dict[str, tuple[str, Priority]]
+    _timers: dict[str, asyncio.TimerHandle]
+    _timeout: float | None
+    _limit: int
+
+    timeouts: int
+    orphans: int
+    failed: int
+
+    def __init__(self, timeout: float | None = 30, limit: int = 1024):
+        self._futures = {}
+        self._frames = {}
+        self._timers = {}
+        self._timeout = timeout
+        self._limit = limit
+
+        self.timeouts = 0
+        self.orphans = 0
+        self.failed = 0
+
+
+    @property
+    def timeout(self) -> float | None:
+        return self._timeout
+
+
+    def __len__(self) -> int:
+        return len(self._futures)
+
+
+    def __contains__(self, rid: str) -> bool:
+        return rid in self._futures
+
+
+    def add(self, rid: str) -> asyncio.Future[dict]:
+        if len(self._futures) >= self._limit:
+            raise RequestLimitExceeded(f"{self._limit} requests are already awaiting a response")
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        self._futures[rid] = future
+        if self._timeout is not None:
+            self._timers[rid] = loop.call_later(self._timeout, self._expire, rid)
+
+        # Whoever completes the future (response, timeout, failure or the
+        # caller going away) the entry is dropped with it
+        future.add_done_callback(lambda _: self._discard(rid))
+        return future
+
+
+    def _discard(self, rid: str) -> None:
+        self._futures.pop(rid, None)
+        self._frames.pop(rid, None)
+        if (timer := self._timers.pop(rid, None)) is not None:
+            timer.cancel()
+
+
+    def _expire(self, rid: str) -> None:
+        future = self._futures.get(rid)
+        if future is not None and not future.done():
+            self.timeouts += 1
+            future.set_exception(TimeoutError(f"No response to request {rid} in {self._timeout}s"))
+
+
+    def written(self, rid: str, frame: str, priority: Priority) -> None:
+        # Only frames that reached a socket can be lost with it, unsent ones
+        # are still queued and go out on the next socket anyway
+        if rid in self._futures:
+            self._frames[rid] = (frame, priority)
+
+
+    def unanswered(self) -> list[tuple[str, str, Priority]]:
+        """Written frames still awaiting a response, forgotten until written again."""
+        frames = [(rid, frame, priority) for rid, (frame, priority) in self._frames.items()]
+        self._frames.clear()
+        return frames
+
+
+    def resolve(self, rid: str, message: dict) -> None:
+        future = self._futures.get(rid)
+        if future is None or future.done():
+            self.orphans += 1
+            return
+
+        future.set_result(message)
+
+
+    def fail(self, rids: Iterable[str], exc: BaseException) -> None:
+        for rid in rids:
+            future = self._futures.get(rid)
+            if future is not None and not future.done():
+                self.failed += 1
+                future.set_exception(exc)
+
+
+    def fail_all(self, exc: BaseException) -> None:
+        self.fail(list(self._futures), exc)
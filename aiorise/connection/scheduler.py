@@ -0,0 +1,195 @@
+from collections import deque
+from enum import IntEnum
+from typing import Awaitable, Callable, NoReturn
+
+import asyncio
+import time
+
+
+class Priority(IntEnum):
+    CONTROL = 0
+    MODERATION = 1
+    REQUEST = 2
+    CHAT = 3
+
+
+class TokenBucket:
+    _rate: float
+    _burst: float
+    _tokens: float
+    _updated: float
+
+    def __init__(self, rate: float, burst: float):
+        # A bucket that never refills would hold its class back forever,
+        # leave the class unlimited (None) or pick a small positive rate
+        if rate <= 0:
+            raise ValueError(f"Invalid rate {rate}, must be positive")
+        if burst < 1:
+            raise ValueError(f"Invalid burst {burst}, must allow at least one frame")
+
+        self._rate = rate
+        self._burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+
+    def delay(self) -> float:
+        self._refill()
+        return 0 if self._tokens >= 1 else (1 - self._tokens) / self._rate
+
+
+    def take(self) -> None:
+        self._tokens -= 1
+
+
+class OutboundScheduler:
+    DEFAULT_RATES: dict[Priority, tuple[float, float] | None] = {
+        Priority.CONTROL: None,
+        Priority.MODERATION: (20, 20),
+        Priority.REQUEST: (50, 100),
+        Priority.CHAT: (10, 20),
+    }
+
+    _write: Callable[[str], Awaitable[None]]
+    _buckets: dict[Priority, TokenBucket | None]
+    _queues: dict[Priority, deque[tuple[str, asyncio.Future[None]]]]
+    _waiters: dict[Priority, deque[asyncio.Future[None]]]
+    _max_queued: int
+    _wakeup: asyncio.Event
+    _task: asyncio.Task | None
+
+    def __init__(
+        self,
+        write: Callable[[str], Awaitable[None]],
+        rates: dict[Priority, tuple[float, float] | None] | None = None,
+        max_queued: int = 1024
+    ):
+        if max_queued < 1:
+            raise ValueError(f"Invalid queue size {max_queued}")
+
+        rates = self.DEFAULT_RATES | (rates or {})
+
+        self._write = write
+        self._buckets = {
+            priority: TokenBucket(*rate) if rate is not None else None
+            for priority, rate in rates.items()
+        }
+        self._queues = {priority: deque() for priority in Priority}
+        self._waiters = {priority: deque() for priority in Priority}
+        self._max_queued = max_queued
+        self._wakeup = asyncio.Event()
+        self._task = None
+
+
+    def queued(self, priority: Priority) -> int:
+        return len(self._queues[priority])
+
+
+    def submit(self, frame: str, priority: Priority = Priority.REQUEST) -> asyncio.Future[None]:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+        future = asyncio.get_running_loop().create_future()
+        self._queues[priority].append((frame, future))
+        self._wakeup.set()
+        return future
+
+
+    async def send(self, frame: str, priority: Priority = Priority.REQUEST) -> None:
+        # A stalled socket holds senders back here instead of letting the
+        # queue grow without bound
+        while len(self._queues[priority]) >= self._max_queued:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters[priority].append(waiter)
+            try:
+                await waiter
+            finally:
+                if waiter in self._waiters[priority]:
+                    self._waiters[priority].remove(waiter)
+
+        await self.submit(frame, priority)
+
+
+    def _wake(self, priority: Priority) -> None:
+        waiters = self._waiters[priority]
+        while waiters:
+            if not (waiter := waiters.popleft()).done():
+                waiter.set_result(None)
+                return
+
+
+    def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+        for queue in self._queues.values():
+            while queue:
+                _, future = queue.popleft()
+                if not future.done():
+                    future.set_exception(ConnectionError("Connection closed"))
+
+        for waiters in self._waiters.values():
+            while waiters:
+                if not (waiter := waiters.popleft()).done():
+                    waiter.set_exception(ConnectionError("Connection closed"))
+
+
+    def _next(self) -> tuple[tuple[str, asyncio.Future[None]] | None, float | None]:
+        # Highest class with a frame and a token goes first; a throttled
+        # class never blocks the classes below it
+        wait = None
+        for priority in Priority:
+            if not (queue := self._queues[priority]):
+                continue
+
+            bucket = self._buckets.get(priority)
+            if bucket is None or (delay := bucket.delay()) == 0:
+                if bucket is not None:
+                    bucket.take()
+                item = queue.popleft()
+                self._wake(priority)
+                return item, None
+
+            wait = delay if wait is None else min(wait, delay)
+
+        return None, wait
+
+
+    async def _run(self) -> NoReturn:
+        while True:
+            item, wait = self._next()
+
+            if item is None:
+                self._wakeup.clear()
+                try:
+                    async with asyncio.timeout(wait):
+                        await self._wakeup.wait()
+                except TimeoutError:
+                    pass
+                continue
+
+            frame, future = item
+            if future.done():
+                continue
+
+            try:
+                await self._write(frame)
+            except asyncio.CancelledError:
+                # Closed mid-write, the frame is in no queue close() can
+                # fail so its sender is released here
+                if not future.done():
+                    future.set_exception(ConnectionError("Connection closed"))
+                raise
+            except Exception as exc:
+                if not future.done():
+                    future.set_exception(exc)
+            else:
+                if not future.done():
+                    future.set_result(None)
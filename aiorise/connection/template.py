@@ -0,0 +1,29 @@
+from typing import Any
+
+import json
+
+
+class FrameTemplate:
+    """A request frame encoded once, with only the `rid` spliced in per send."""
+
+    __slots__ = ("_payload", "_prefix", "_suffix")
+
+    _payload: dict[str, Any]
+    _prefix: str
+    _suffix: str
+
+    def __init__(self, request_type: str, **fields: Any):
+        self._payload = {"_type": request_type, **fields}
+
+        # rids are plain hex, so they never need escaping
+        self._prefix = json.dumps(self._payload)[:-1] + ', "rid": "'
+        self._suffix = '"}'
+
+
+    @property
+    def payload(self) -> dict[str, Any]:
+        return dict(self._payload)
+
+
+    def render(self, rid: str) -> str:
+        return self._prefix + rid + self._suffix
@@ -0,0 +1,110 @@
+from collections import deque
+
+import asyncio
+import time
+
+
+class RequestWindow:
+    _limit: float
+    _min_limit: int
+    _max_limit: int
+    _tolerance: float
+    _decrease: float
+
+    _waiters: deque[asyncio.Future[None]]
+    _last_decrease: float
+
+    in_flight: int
+    min_rtt: float | None
+    srtt: float | None
+
+    def __init__(
+        self,
+        initial: int = 8,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        tolerance: float = 2.0,
+        decrease: float = 0.5
+    ):
+        if not 1 <= min_limit <= initial <= max_limit:
+            raise ValueError(f"Invalid window bounds {min_limit} <= {initial} <= {max_limit}")
+
+        self._limit = initial
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._tolerance = tolerance
+        self._decrease = decrease
+
+        self._waiters = deque()
+        self._last_decrease = 0
+
+        self.in_flight = 0
+        self.min_rtt = None
+        self.srtt = None
+
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+
+    @property
+    def waiting(self) -> int:
+        return len(self._waiters)
+
+
+    async def acquire(self) -> None:
+        if self.in_flight < self.limit and not self._waiters:
+            self.in_flight += 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just as the caller went away
+                self.release()
+            else:
+                self._waiters.remove(waiter)
+            raise
+
+
+    def release(self, rtt: float | None = None) -> None:
+        self.in_flight -= 1
+
+        if rtt is not None:
+            self._sample(rtt)
+
+        self._wake()
+
+
+    def backoff(self) -> None:
+        # Multiplicative decrease at most once per round trip, so a burst of
+        # slow responses to one window only shrinks it once
+        now = time.monotonic()
+        if now - self._last_decrease < (self.srtt or 0):
+            return
+
+        self._last_decrease = now
+        self._limit = max(self._min_limit, self._limit * self._decrease)
+
+
+    def _sample(self, rtt: float) -> None:
+        self.min_rtt = rtt if self.min_rtt is None else min(self.min_rtt, rtt)
+        self.srtt = rtt if self.srtt is None else 0.875 * self.srtt + 0.125 * rtt
+
+        if rtt > self.min_rtt * self._tolerance:
+            self.backoff()
+        else:
+            # Additive increase: about one slot per window of fast responses
+            self._limit = min(self._max_limit, self._limit + 1 / self._limit)
+
+
+    def _wake(self) -> None:
+        while self._waiters and self.in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
@@ -0,0 +1,7 @@
+from .dispatcher import (
+    BaseDispatcher,
+    PoolDispatcher,
+    LaneDispatcher,
+    user_key,
+    conversation_key
+)
@@ -0,0 +1,301 @@
+from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
+from typing import Callable, Hashable, Iterable, NoReturn
+from aiorise.events.event_types import AnyEvent
+from aiorise.events.event_context import EventContext
+from aiorise.handlers.handler import Handler
+
+import asyncio
+import logging
+
+
+logger = logging.getLogger(__name__)
+
+LaneKey = Callable[[AnyEvent], Hashable]
+
+
+def user_key(e: AnyEvent) -> Hashable:
+    if (user := getattr(e, "user", None) or getattr(e, "sender", None)) is not None:
+        return user.id
+
+    return getattr(e, "user_id", None) or getattr(e, "sender_id", None)
+
+
+def conversation_key(e: AnyEvent) -> Hashable:
+    if (conversation_id := getattr(e, "conversation_id", None)) is not None:
+        return conversation_id
+
+    return user_key(e)
+
+
+class BaseDispatcher(ABC):
+    @abstractmethod
+    async def dispatch(self, e: AnyEvent, ctx: EventContext) -> None:
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        pass
+
+    @abstractmethod
+    async def run(self, handler: Handler) -> None:
+        pass
+
+
+class PoolDispatcher(BaseDispatcher):
+    """Runs handlers on `workers` tasks fed from a bounded queue.
+
+    A full queue holds the reader back until a worker frees a slot. While it
+    waits no frames are read, so responses to requests awaited by every
+    worker at once only arrive after those requests time out. With
+    `shed_oldest` the reader never waits and the oldest queued event is
+    dropped instead, counted in `dropped`.
+    """
+
+    _workers: int
+    _queue: asyncio.Queue[tuple[AnyEvent, EventContext]]
+    _shed_oldest: bool
+    _shedding: bool
+    _closed: asyncio.Event
+
+    dropped: int
+
+    def __init__(self, workers: int = 1, queue_size: int = 1024, shed_oldest: bool = False):
+        if workers < 1:
+            raise ValueError(f"Invalid number of workers {workers}")
+
+        self._workers = workers
+        self._queue = asyncio.Queue(queue_size)
+        self._shed_oldest = shed_oldest
+        self._shedding = False
+        self._closed = asyncio.Event()
+
+        self.dropped = 0
+
+
+    async def dispatch(self, e: AnyEvent, ctx: EventContext) -> None:
+        if not self._shed_oldest:
+            await self._queue.put((e, ctx))
+            return
+
+        if self._queue.full():
+            self._queue.get_nowait()
+            self._queue.task_done()
+            self.dropped += 1
+            # Once per overflow, not once per event
+            if not self._shedding:
+                self._shedding = True
+                logger.warning("Dispatcher queue is full, dropping oldest events (%s so far)", self.dropped)
+        else:
+            self._shedding = False
+
+        self._queue.put_nowait((e, ctx))
+
+
+    def close(self) -> None:
+        self._closed.set()
+
+
+    async def _work(self, handler: Handler) -> NoReturn:
+        while True:
+            e, ctx = await self._queue.get()
+            try:
+                await handler.run(e, ctx)
+            finally:
+                self._queue.task_done()
+
+
+    async def run(self, handler: Handler) -> None:
+        async with asyncio.TaskGroup() as tg:
+            workers = [
+                tg.create_task(self._work(handler))
+                for _ in range(self._workers)
+            ]
+
+            await self._closed.wait()
+            await self._queue.join()
+
+            for worker in workers:
+                worker.cancel()
+
+
+class LaneDispatcher(BaseDispatcher):
+    _key: LaneKey
+    _max_lanes: int
+    _queue_size: int
+    _max_pending: int
+    _idle_timeout: float
+
+    _lanes: dict[Hashable, asyncio.Queue[tuple[AnyEvent, EventContext] | None]]
+    _pending: OrderedDict[Hashable, deque[tuple[AnyEvent, EventContext]]]
+    _pending_size: int
+    _shedding: bool
+    _overflowing: set[Hashable]
+    _handler: Handler | None
+    _tg: asyncio.TaskGroup | None
+    _closed: asyncio.Event
+
+    dropped: int
+
+    def __init__(
+        self,
+        key: LaneKey = user_key,
+        max_lanes: int = 256,
+        queue_size: int = 64,
+        max_pending: int = 4096,
+        idle_timeout: float = 30
+    ):
+        if max_lanes < 1:
+            raise ValueError(f"Invalid number of lanes {max_lanes}")
+        if max_pending < 1:
+            raise ValueError(f"Invalid pending limit {max_pending}")
+
+        self._key = key
+        self._max_lanes = max_lanes
+        self._queue_size = queue_size
+        self._max_pending = max_pending
+        self._idle_timeout = idle_timeout
+
+        self._lanes = {}
+        self._pending = OrderedDict()
+        self._pending_size = 0
+        self._shedding = False
+        self._overflowing = set()
+        self._handler = None
+        self._tg = None
+        self._closed = asyncio.Event()
+
+        self.dropped = 0
+
+
+    @property
+    def lanes(self) -> int:
+        return len(self._lanes)
+
+
+    @property
+    def pending(self) -> int:
+        return self._pending_size
+
+
+    async def dispatch(self, e: AnyEvent, ctx: EventContext) -> None:
+        key = self._key(e)
+
+        if (lane := self._lanes.get(key)) is not None:
+            if lane.full():
+                lane.get_nowait()
+                self._overflow(key)
+            else:
+                self._overflowing.discard(key)
+            lane.put_nowait((e, ctx))
+
+        elif (pending := self._pending.get(key)) is not None:
+            if len(pending) >= self._queue_size:
+                pending.popleft()
+                self._overflow(key)
+            else:
+                self._overflowing.discard(key)
+                self._pending_size += 1
+            pending.append((e, ctx))
+
+        elif self._tg is not None and len(self._lanes) < self._max_lanes:
+            self._open_lane(key, [(e, ctx)])
+
+        else:
+            self._pending[key] = deque([(e, ctx)])
+            self._pending_size += 1
+
+        # Per-key bounds alone do not hold memory flat when new keys keep
+        # arriving, the total is capped too
+        if self._pending_size > self._max_pending:
+            self._shed()
+        else:
+            self._shedding = False
+
+
+    def _overflow(self, key: Hashable) -> None:
+        self.dropped += 1
+
+        # Logged once per key until its lane keeps up again
+        if key not in self._overflowing:
+            self._overflowing.add(key)
+            logger.warning("Lane %r is full, dropping its oldest events (%s so far)", key, self.dropped)
+
+
+    def _shed(self) -> None:
+        key, oldest = next(iter(self._pending.items()))
+        oldest.popleft()
+        if not oldest:
+            del self._pending[key]
+            self._overflowing.discard(key)
+        self._pending_size -= 1
+        self.dropped += 1
+
+        if not self._shedding:
+            self._shedding = True
+            logger.warning("Too many events waiting for a lane, dropping oldest (%s so far)", self.dropped)
+
+
+    def close(self) -> None:
+        self._closed.set()
+
+        # Wake lanes blocked on an empty queue so they can exit
+        for lane in self._lanes.values():
+            if lane.empty():
+                lane.put_nowait(None)
+
+
+    def _open_pending(self) -> None:
+        key, events = self._pending.popitem(last=False)
+        self._pending_size -= len(events)
+        self._open_lane(key, events)
+
+
+    def _open_lane(self, key: Hashable, events: Iterable[tuple[AnyEvent, EventContext]]) -> None:
+        lane = asyncio.Queue(self._queue_size)
+        for item in events:
+            lane.put_nowait(item)
+
+        self._lanes[key] = lane
+        self._tg.create_task(self._run_lane(key, lane))
+
+
+    async def _run_lane(
+        self,
+        key: Hashable,
+        lane: asyncio.Queue[tuple[AnyEvent, EventContext] | None]
+    ) -> None:
+        while True:
+            if lane.empty() and (self._pending or self._closed.is_set()):
+                break
+
+            try:
+                async with asyncio.timeout(self._idle_timeout):
+                    item = await lane.get()
+            except TimeoutError:
+                if lane.empty():
+                    break
+                continue
+
+            if item is not None:
+                await self._handler.run(*item)
+
+        # Nothing awaits between the emptiness check and here, so no event
+        # can land in a lane that is being retired.
+        del self._lanes[key]
+        self._overflowing.discard(key)
+
+        if self._pending:
+            self._open_pending()
+
+
+    async def run(self, handler: Handler) -> None:
+        self._handler = handler
+
+        async with asyncio.TaskGroup() as tg:
+            self._tg = tg
+
+            while self._pending and len(self._lanes) < self._max_lanes:
+                self._open_pending()
+
+            await self._closed.wait()
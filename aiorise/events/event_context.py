@@ -1,7 +1,21 @@
 from aiorise.api.client import HighriseWebApiClient
 
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from aiorise.state.room import RoomState
+
 class EventContext:
     client: HighriseWebApiClient
+    room_id: str | None
+    room: "RoomState | None"
 
-    def __init__(self, client: HighriseWebApiClient):
+    def __init__(
+        self,
+        client: HighriseWebApiClient,
+        room_id: str | None = None,
+        room: "RoomState | None" = None
+    ):
         self.client = client
+        self.room_id = room_id
+        self.room = room
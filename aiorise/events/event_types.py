@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Literal, Any
+from typing import Annotated, Literal, Any
 from aiorise.objects.object_types import *
 
 
@@ -92,7 +92,7 @@ class MessageEvent(BaseModel):
     is_new_conversation: bool
 
 
-AnyEvent = (
+AnyEvent = Annotated[
     ChatEvent
     | EmoteEvent
     | ReactionEvent
@@ -102,5 +102,6 @@ AnyEvent = (
     | TipReactionEvent
     | UserMovedEvent
     | VoiceEvent
-    | MessageEvent
-)
+    | MessageEvent,
+    Field(discriminator="type"),
+]
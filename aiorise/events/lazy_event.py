@@ -0,0 +1,48 @@
+from typing import Any, get_args
+from aiorise.api import adapters
+from .event_types import AnyEvent
+
+
+EVENT_TYPES: dict[str, type] = {
+    cls.__name__: cls for cls in get_args(get_args(AnyEvent)[0])
+}
+
+
+class LazyEvent:
+    __slots__ = ("_type", "_frame", "_event")
+
+    _type: str
+    _frame: str | bytes | dict
+    _event: AnyEvent | None
+
+    def __init__(self, type: str, frame: str | bytes | dict):
+        self._type = type
+        self._frame = frame
+        self._event = None
+
+
+    # Lets isinstance checks and handler routing see the event class named by
+    # the frame without validating it
+    @property
+    def __class__(self) -> type:
+        return EVENT_TYPES.get(self._type, LazyEvent)
+
+
+    def materialize(self) -> AnyEvent:
+        if self._event is None:
+            if isinstance(self._frame, dict):
+                self._event = adapters.event_adapter.validate_python(self._frame)
+            else:
+                self._event = adapters.event_adapter.validate_json(self._frame)
+            self._frame = None
+        return self._event
+
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.materialize(), name)
+
+
+    def __repr__(self) -> str:
+        if self._event is None:
+            return f"LazyEvent({self._type})"
+        return repr(self._event)
@@ -4,33 +4,45 @@ from aiorise.actions.action import BaseAction, ActionFactory
 from aiorise.events.event_types import AnyEvent
 from aiorise.events.event_context import EventContext
 from aiorise.filters.filter import BaseFilter, FilterFactory
-
-import asyncio
+from aiorise.handlers.plan import CompiledHandler
 
 class Handler:
     _parent: Self | None
     _children: list[Self]
+    _plan: CompiledHandler | None
 
+    _event_types: tuple[type, ...] | None
     _filter: BaseFilter | None
     _action: BaseAction | None
 
     def __init__(self, parent: Self | None = None):
         self._parent = parent
         self._children = []
+        self._plan = None
+        self._event_types = None
         self._filter = None
         self._action = None
 
 
     def add_child(self, child: Self) -> None:
+        child._parent = self
         self._children.append(child)
+        self._invalidate()
+
+
+    def set_event_types(self, *event_types: type) -> None:
+        self._event_types = event_types or None
+        self._invalidate()
 
     
     def set_filter(self, f: FilterFactory.SupportedTypes) -> None:
         self._filter = FilterFactory.create(f)
+        self._invalidate()
 
 
     def set_action(self, a: ActionFactory.SupportedTypes) -> None:
         self._action = ActionFactory.create(a)
+        self._invalidate()
 
     def set(self, f: FilterFactory.SupportedTypes) -> Callable[[ActionFactory.SupportedTypes], None]:
         def inner(a: ActionFactory.SupportedTypes) -> None:
@@ -46,11 +58,42 @@ class Handler:
             self.add_child(child)
         return inner
 
+    def on(
+        self,
+        *event_types: type,
+        f: FilterFactory.SupportedTypes | None = None
+    ) -> Callable[[ActionFactory.SupportedTypes], None]:
+        def inner(a: ActionFactory.SupportedTypes) -> None:
+            child = Handler(self)
+            child.set_event_types(*event_types)
+            if f is not None:
+                child.set_filter(f)
+            child.set_action(a)
+            self.add_child(child)
+        return inner
+
 
-    async def run(self, e: AnyEvent, ctx: EventContext) -> None:
-        if (await self._filter.check(e, ctx) if self._filter else True):
-            await self._action.run(e, ctx) if self._action else None
+    def accepts(self, event_type: type) -> bool:
+        return self.compile().accepts(event_type)
+
+
+    def _invalidate(self) -> None:
+        handler = self
+        while handler is not None and handler._plan is not None:
+            handler._plan = None
+            handler = handler._parent
 
-            async with asyncio.TaskGroup() as tg:
-                for child in self._children:
-                    tg.create_task(child.run(e, ctx))
+
+    def compile(self) -> CompiledHandler:
+        if self._plan is None:
+            self._plan = CompiledHandler(
+                self._event_types,
+                self._filter,
+                self._action,
+                [child.compile() for child in self._children]
+            )
+        return self._plan
+
+
+    async def run(self, e: AnyEvent, ctx: EventContext) -> None:
+        await self.compile().run(e, ctx)
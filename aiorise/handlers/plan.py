@@ -0,0 +1,150 @@
+from typing import Callable, Self
+
+from aiorise.actions.action import BaseAction, SyncAction
+from aiorise.events.event_types import AnyEvent
+from aiorise.events.lazy_event import EVENT_TYPES
+from aiorise.events.event_context import EventContext
+from aiorise.filters.filter import BaseFilter, SyncFilter
+
+import asyncio
+
+
+class CompiledHandler:
+    __slots__ = (
+        "_event_types", "_event_names", "_check", "_acheck", "_act", "_aact",
+        "_children", "_routes", "is_sync", "subscriptions"
+    )
+
+    _event_types: tuple[type, ...] | None
+    _event_names: frozenset[str]
+    _check: Callable[[AnyEvent, EventContext], bool] | None
+    _acheck: BaseFilter | None
+    _act: Callable[[AnyEvent, EventContext], None] | None
+    _aact: BaseAction | None
+    _children: tuple[Self, ...]
+    _routes: dict[type, tuple[tuple[Self, ...], tuple[Self, ...]]]
+
+    is_sync: bool
+    subscriptions: frozenset[type] | None
+
+    def __init__(
+        self,
+        event_types: tuple[type, ...] | None,
+        f: BaseFilter | None,
+        a: BaseAction | None,
+        children: list[Self]
+    ):
+        self._event_types = event_types
+        self._check, self._acheck = (f._func, None) if isinstance(f, SyncFilter) else (None, f)
+        self._act, self._aact = (a._func, None) if isinstance(a, SyncAction) else (None, a)
+        self._children = tuple(children)
+        self._routes = {}
+
+        self.is_sync = (
+            self._acheck is None and self._aact is None
+            and all(child.is_sync for child in self._children)
+        )
+
+        # Event classes that can reach an action in this subtree, None if any
+        # event can
+        if a is not None:
+            subscriptions = None
+        elif any(child.subscriptions is None for child in self._children):
+            subscriptions = None
+        else:
+            subscriptions = frozenset().union(*(child.subscriptions for child in self._children))
+
+        if event_types is not None:
+            # Classes from another model family (msgspec structs) are not in
+            # EVENT_TYPES but share the event names readers filter on
+            accepted = frozenset(
+                cls for cls in EVENT_TYPES.values()
+                if issubclass(cls, event_types)
+            ) | frozenset(
+                cls for cls in event_types
+                if cls.__name__ in EVENT_TYPES
+            )
+            subscriptions = accepted if subscriptions is None else subscriptions & accepted
+            self._event_names = frozenset(cls.__name__ for cls in accepted)
+        else:
+            self._event_names = frozenset()
+
+        self.subscriptions = subscriptions
+
+
+    def accepts(self, event_type: type) -> bool:
+        # By name too, so a handler declared with the pydantic classes also
+        # receives the msgspec structs of the same events and vice versa
+        return (
+            self._event_types is None
+            or event_type.__name__ in self._event_names
+            or issubclass(event_type, self._event_types)
+        )
+
+
+    def _route(self, event_type: type) -> tuple[tuple[Self, ...], tuple[Self, ...]]:
+        try:
+            return self._routes[event_type]
+        except KeyError:
+            children = [child for child in self._children if child.accepts(event_type)]
+            route = self._routes[event_type] = (
+                tuple(child for child in children if child.is_sync),
+                tuple(child for child in children if not child.is_sync)
+            )
+            return route
+
+
+    def run_sync(self, e: AnyEvent, ctx: EventContext) -> None:
+        if self._check is None or self._check(e, ctx):
+            if self._act is not None:
+                self._act(e, ctx)
+
+            for child in self._route(e.__class__)[0]:
+                child.run_sync(e, ctx)
+
+
+    async def _body(self, e: AnyEvent, ctx: EventContext) -> None:
+        if self._act is not None:
+            self._act(e, ctx)
+        elif self._aact is not None:
+            await self._aact.run(e, ctx)
+
+        sync_children, async_children = self._route(e.__class__)
+
+        for child in sync_children:
+            child.run_sync(e, ctx)
+
+        if not async_children:
+            return
+
+        # Sync filters of async children are checked inline, so a task is
+        # only spawned for a branch that is actually going to run.
+        coros = []
+        for child in async_children:
+            if child._check is None:
+                coros.append(child._run(e, ctx))
+            elif child._check(e, ctx):
+                coros.append(child._body(e, ctx))
+
+        if len(coros) == 1:
+            await coros[0]
+        elif coros:
+            async with asyncio.TaskGroup() as tg:
+                for coro in coros:
+                    tg.create_task(coro)
+
+
+    async def _run(self, e: AnyEvent, ctx: EventContext) -> None:
+        if self._check is not None:
+            if not self._check(e, ctx):
+                return
+        elif self._acheck is not None:
+            if not await self._acheck.check(e, ctx):
+                return
+
+        await self._body(e, ctx)
+
+
+    async def run(self, e: AnyEvent, ctx: EventContext) -> None:
+        if self.accepts(e.__class__):
+            await self._run(e, ctx)
@@ -0,0 +1,2 @@
+from .room import RoomState
+from .spatial import SpatialIndex
@@ -0,0 +1,139 @@
+from aiorise.api.client import HighriseWebApiClient
+from aiorise.events.event_types import AnyEvent
+from aiorise.objects.object_types import AnchorPosition, Position, User
+from .spatial import SpatialIndex
+
+from types import MappingProxyType
+from typing import Mapping
+
+import asyncio
+import logging
+import time
+
+
+logger = logging.getLogger(__name__)
+
+
+class RoomState:
+    _retry_delay: float = 5
+    _users: dict[str, User]
+    _positions: dict[str, Position | AnchorPosition]
+    _buffer: list[AnyEvent] | None
+    _resync_interval: float | None
+
+    spatial: SpatialIndex
+    synced_at: float | None
+    resyncs: int
+    drift: int
+
+    def __init__(self, resync_interval: float | None = 60, cell_size: float = 2.0):
+        self._users = {}
+        self._positions = {}
+        self._buffer = None
+        self._resync_interval = resync_interval
+
+        self.spatial = SpatialIndex(cell_size)
+
+        self.synced_at = None
+        self.resyncs = 0
+        self.drift = 0
+
+
+    @property
+    def users(self) -> Mapping[str, User]:
+        return MappingProxyType(self._users)
+
+
+    @property
+    def positions(self) -> Mapping[str, Position | AnchorPosition]:
+        return MappingProxyType(self._positions)
+
+
+    def user(self, user_id: str) -> User | None:
+        return self._users.get(user_id)
+
+
+    def position(self, user_id: str) -> Position | AnchorPosition | None:
+        return self._positions.get(user_id)
+
+
+    def __contains__(self, user_id: str) -> bool:
+        return user_id in self._users
+
+
+    def __len__(self) -> int:
+        return len(self._users)
+
+
+    def _place(self, user: User, position: Position | AnchorPosition) -> None:
+        self._users[user.id] = user
+        self._positions[user.id] = position
+        self.spatial.update(user.id, position)
+
+
+    def _remove(self, user_id: str) -> None:
+        self._users.pop(user_id, None)
+        self._positions.pop(user_id, None)
+        self.spatial.remove(user_id)
+
+
+    def apply(self, e: AnyEvent) -> None:
+        # Matched by name so lazy events and msgspec structs are handled too
+        match e.__class__.__name__:
+            case "UserJoinedEvent" | "UserMovedEvent":
+                # A move from an unknown user heals a missed join
+                self._place(e.user, e.position)
+            case "UserLeftEvent":
+                self._remove(e.user.id)
+            case _:
+                return
+
+        if self._buffer is not None:
+            self._buffer.append(e)
+
+
+    async def sync(self, client: HighriseWebApiClient) -> None:
+        # Events seen while the snapshot is in flight may or may not be part
+        # of it, they are replayed on top so none of them is lost
+        self._buffer = []
+        try:
+            response = await client.get_room_users()
+            buffered = self._buffer
+        finally:
+            self._buffer = None
+
+        before = dict(self._positions)
+        self._users = {user.id: user for user, _ in response.content}
+        self._positions = {user.id: position for user, position in response.content}
+        self.spatial.clear()
+        for user_id, position in self._positions.items():
+            self.spatial.update(user_id, position)
+        for e in buffered:
+            self.apply(e)
+
+        if self.synced_at is not None:
+            self.drift = sum(
+                before.get(user_id) != position
+                for user_id, position in self._positions.items()
+            ) + len(before.keys() - self._positions.keys())
+            if self.drift:
+                logger.info("Room state resync corrected %s users", self.drift)
+
+        self.synced_at = time.monotonic()
+        self.resyncs += 1
+
+
+    async def run(self, client: HighriseWebApiClient) -> None:
+        while True:
+            try:
+                await self.sync(client)
+            except Exception:
+                # Error replies, rate limits and dropped sockets alike, the
+                # mirror keeps following events until the next attempt
+                logger.warning("Room state sync failed, retrying in %ss", self._retry_delay, exc_info=True)
+                await asyncio.sleep(self._retry_delay)
+                continue
+
+            if self._resync_interval is None:
+                return
+            await asyncio.sleep(self._resync_interval)
@@ -0,0 +1,163 @@
+from aiorise.objects.object_types import AnchorPosition, Position
+
+from types import MappingProxyType
+from typing import Iterator, Mapping
+
+import heapq
+import math
+
+
+Cell = tuple[int, int]
+
+
+class SpatialIndex:
+    """Uniform grid over the floor plane (x, z) of a room.
+
+    Every user sits in the bucket of the cell containing it, so a move only
+    touches two buckets and a query only scans the cells its radius covers.
+    Users sitting on an anchor have no coordinates, they are tracked in
+    `anchors` by (entity_id, anchor_ix) instead.
+    """
+
+    cell_size: float
+    _cells: dict[Cell, dict[str, tuple[float, float]]]
+    _points: dict[str, Cell]
+    _anchors: dict[tuple[str, int], str]
+    _anchored: dict[str, tuple[str, int]]
+
+    def __init__(self, cell_size: float = 2.0):
+        if cell_size <= 0:
+            raise ValueError("cell_size must be positive")
+
+        self.cell_size = cell_size
+        self._cells = {}
+        self._points = {}
+        self._anchors = {}
+        self._anchored = {}
+
+
+    @property
+    def anchors(self) -> Mapping[tuple[str, int], str]:
+        return MappingProxyType(self._anchors)
+
+
+    def occupant(self, entity_id: str, anchor_ix: int) -> str | None:
+        return self._anchors.get((entity_id, anchor_ix))
+
+
+    def __contains__(self, user_id: str) -> bool:
+        return user_id in self._points or user_id in self._anchored
+
+
+    def __len__(self) -> int:
+        return len(self._points) + len(self._anchored)
+
+
+    def _cell(self, x: float, z: float) -> Cell:
+        return math.floor(x / self.cell_size), math.floor(z / self.cell_size)
+
+
+    def update(self, user_id: str, position: Position | AnchorPosition) -> None:
+        # Matched by name so msgspec structs are indexed too
+        if position.__class__.__name__ == "AnchorPosition":
+            self.remove(user_id)
+            anchor = (position.entity_id, position.anchor_ix)
+            # Whoever the server still had on this anchor has moved away
+            if (previous := self._anchors.get(anchor)) is not None:
+                del self._anchored[previous]
+            self._anchors[anchor] = user_id
+            self._anchored[user_id] = anchor
+            return
+
+        cell = self._cell(position.x, position.z)
+        if self._points.get(user_id) != cell:
+            self.remove(user_id)
+            self._points[user_id] = cell
+        self._cells.setdefault(cell, {})[user_id] = (position.x, position.z)
+
+
+    def remove(self, user_id: str) -> None:
+        if (cell := self._points.pop(user_id, None)) is not None:
+            bucket = self._cells[cell]
+            del bucket[user_id]
+            if not bucket:
+                del self._cells[cell]
+        elif (anchor := self._anchored.pop(user_id, None)) is not None:
+            del self._anchors[anchor]
+
+
+    def clear(self) -> None:
+        self._cells.clear()
+        self._points.clear()
+        self._anchors.clear()
+        self._anchored.clear()
+
+
+    def _ring(self, center: Cell, r: int) -> Iterator[Cell]:
+        cx, cz = center
+        if r == 0:
+            yield center
+            return
+        for dx in range(-r, r + 1):
+            yield cx + dx, cz - r
+            yield cx + dx, cz + r
+        for dz in range(-r + 1, r):
+            yield cx - r, cz + dz
+            yield cx + r, cz + dz
+
+
+    def within(self, x: float, z: float, radius: float) -> list[tuple[str, float]]:
+        """Users at most `radius` away from (x, z), closest first."""
+        found = []
+        (lx, lz), (hx, hz) = self._cell(x - radius, z - radius), self._cell(x + radius, z + radius)
+
+        # A huge radius over a small room is cheaper to answer bucket by bucket
+        if (hx - lx + 1) * (hz - lz + 1) > len(self._cells):
+            cells = [
+                bucket for (cx, cz), bucket in self._cells.items()
+                if lx <= cx <= hx and lz <= cz <= hz
+            ]
+        else:
+            cells = [
+                bucket for cx in range(lx, hx + 1) for cz in range(lz, hz + 1)
+                if (bucket := self._cells.get((cx, cz))) is not None
+            ]
+
+        for bucket in cells:
+            for user_id, (ux, uz) in bucket.items():
+                if (distance := math.hypot(ux - x, uz - z)) <= radius:
+                    found.append((user_id, distance))
+
+        found.sort(key=lambda item: item[1])
+        return found
+
+
+    def nearest(self, x: float, z: float, k: int = 1) -> list[tuple[str, float]]:
+        """The `k` users closest to (x, z), closest first."""
+        if k <= 0 or not self._points:
+            return []
+
+        center = self._cell(x, z)
+        best: list[tuple[float, str]] = []
+        seen = 0
+        r = 0
+
+        # Rings of cells around the center, until every user has been seen or
+        # the next ring starts farther than the k-th best candidate
+        while seen < len(self._points):
+            if len(best) == k and (r - 1) * self.cell_size > -best[0][0]:
+                break
+
+            for cell in self._ring(center, r):
+                if (bucket := self._cells.get(cell)) is None:
+                    continue
+                seen += len(bucket)
+                for user_id, (ux, uz) in bucket.items():
+                    distance = math.hypot(ux - x, uz - z)
+                    if len(best) < k:
+                        heapq.heappush(best, (-distance, user_id))
+                    elif distance < -best[0][0]:
+                        heapq.heapreplace(best, (-distance, user_id))
+            r += 1
+
+        return [(user_id, -distance) for distance, user_id in sorted(best, reverse=True)]
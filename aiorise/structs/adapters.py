@@ -0,0 +1,14 @@
+from .event_types import AnyEvent
+
+import msgspec
+
+
+# Built once: like the pydantic adapter it compiles the union up front, and
+# the `_type` tag makes decoding a single lookup
+event_decoder: msgspec.json.Decoder[AnyEvent] = msgspec.json.Decoder(AnyEvent)
+
+
+def decode_event(frame: str | bytes | dict) -> AnyEvent:
+    if isinstance(frame, dict):
+        return msgspec.convert(frame, AnyEvent)
+    return event_decoder.decode(frame)
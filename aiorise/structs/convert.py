@@ -0,0 +1,46 @@
+from functools import cache
+from types import NoneType, UnionType
+from typing import Any, Callable, Union, get_args, get_origin
+
+import msgspec
+
+
+def convert(value: Any, type_hint: Any) -> Any:
+    """Convert a decoded value to a type msgspec can not decode directly.
+
+    msgspec refuses unions of untagged structs, such as
+    `Position | AnchorPosition`, so fields holding them are decoded as plain
+    values and each variant is tried in order here.
+    """
+    return _converter(type_hint)(value)
+
+
+@cache
+def _converter(type_hint: Any) -> Callable[[Any], Any]:
+    origin, args = get_origin(type_hint), get_args(type_hint)
+
+    if origin in (Union, UnionType):
+        optional = NoneType in args
+        variants = [_converter(arg) for arg in args if arg is not NoneType]
+
+        def convert_union(value: Any) -> Any:
+            if value is None and optional:
+                return None
+            for variant in variants:
+                try:
+                    return variant(value)
+                except (msgspec.ValidationError, TypeError):
+                    continue
+            raise msgspec.ValidationError(f"Expected `{type_hint}`, got `{type(value).__name__}`")
+
+        return convert_union
+
+    if origin is list:
+        item = _converter(args[0])
+        return lambda value: [item(v) for v in value]
+
+    if origin is tuple:
+        items = [_converter(arg) for arg in args]
+        return lambda value: tuple(item(v) for item, v in zip(items, value))
+
+    return lambda value: value if type(value) is type_hint else msgspec.convert(value, type_hint)
@@ -0,0 +1,161 @@
+from typing import Literal, Any
+from aiorise.structs.object_types import *
+import msgspec
+
+
+class ChatEvent(
+    msgspec.Struct, kw_only=True, omit_defaults=True, tag_field="_type", tag="ChatEvent"
+):
+    """A chat event, sent by a `user` in the room."""
+
+    user: User
+    message: str
+    whisper: bool
+
+
+class EmoteEvent(
+    msgspec.Struct,
+    kw_only=True,
+    omit_defaults=True,
+    tag_field="_type",
+    tag="EmoteEvent",
+):
+    """An emote event, performed by a `user` in the room."""
+
+    user: User
+    emote_id: str
+    receiver: User
+
+
+class ReactionEvent(
+    msgspec.Struct,
+    kw_only=True,
+    omit_defaults=True,
+    tag_field="_type",
+    tag="ReactionEvent",
+):
+    """A reaction event, performed by a `user` in the room."""
+
+    user: User
+    reaction: Literal["clap", "heart", "thumbs", "wave", "wink"]
+    receiver: User
+
+
+class UserJoinedEvent(
+    msgspec.Struct,
+    kw_only=True,
+    omit_defaults=True,
+    tag_field="_type",
+    tag="UserJoinedEvent",
+):
+    """A user has joined the room."""
+
+    user: User
+    position: Any
+
+    def __post_init__(self) -> None:
+        self.position = convert(self.position, Position | AnchorPosition)
+
+
+class UserLeftEvent(
+    msgspec.Struct,
+    kw_only=True,
+    omit_defaults=True,
+    tag_field="_type",
+    tag="UserLeftEvent",
+):
+    """A user has left the room."""
+
+    user: User
+
+
+class ChannelEvent(
+    msgspec.Struct,
+    kw_only=True,
+    omit_defaults=True,
+    tag_field="_type",
+    tag="ChannelEvent",
+):
+    """A hidden channel event."""
+
+    sender_id: str
+    msg: str
+    tags: list[str] | None = None
+
+
+class TipReactionEvent(
+    msgspec.Struct,
+    kw_only=True,
+    omit_defaults=True,
+    tag_field="_type",
+    tag="TipReactionEvent",
+):
+    """The `sender` has sent `receiver` a tip (the `item`) in the current room."""
+
+    sender: User
+    receiver: User
+    item: Any
+
+    def __post_init__(self) -> None:
+        self.item = convert(self.item, Item | CurrencyItem)
+
+
+class UserMovedEvent(
+    msgspec.Struct,
+    kw_only=True,
+    omit_defaults=True,
+    tag_field="_type",
+    tag="UserMovedEvent",
+):
+    """A user has moved in the room."""
+
+    user: User
+    position: Any
+
+    def __post_init__(self) -> None:
+        self.position = convert(self.position, Position | AnchorPosition)
+
+
+class VoiceEvent(
+    msgspec.Struct,
+    kw_only=True,
+    omit_defaults=True,
+    tag_field="_type",
+    tag="VoiceEvent",
+):
+    """Event that is sent when status of voice is changed in the room.
+
+    users: The list of users that currently have voice chat privileges in the room and status of their voice.
+    seconds_left: The number of seconds left until the voice chat ends."""
+
+    users: list[tuple[User, Any]]
+    seconds_left: int
+
+
+class MessageEvent(
+    msgspec.Struct,
+    kw_only=True,
+    omit_defaults=True,
+    tag_field="_type",
+    tag="MessageEvent",
+):
+    """A message event, indicating that bot has received a message from someone. If the message is from a new conversation,
+    `is_new_conversation` field will be True."""
+
+    user_id: str
+    conversation_id: str
+    is_new_conversation: bool
+
+
+AnyEvent = (
+    ChatEvent
+    | EmoteEvent
+    | ReactionEvent
+    | UserJoinedEvent
+    | UserLeftEvent
+    | ChannelEvent
+    | TipReactionEvent
+    | UserMovedEvent
+    | VoiceEvent
+    | MessageEvent
+)
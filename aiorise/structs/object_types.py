@@ -0,0 +1,73 @@
+from typing import Literal, Any
+from aiorise.structs.convert import convert
+import msgspec
+
+
+class Item(msgspec.Struct, kw_only=True, omit_defaults=True):
+    """A Highrise item."""
+
+    type: Literal["clothing", "collectible"]
+    amount: int
+    id: str
+    account_bound: bool
+    active_palette: int | None = None
+
+
+class User(msgspec.Struct, kw_only=True, omit_defaults=True):
+    """A Highrise user.
+
+    Keep in mind it's possible for users to change their username,
+    but their ID will never change."""
+
+    id: str
+    username: str
+
+
+class Message(msgspec.Struct, kw_only=True, omit_defaults=True):
+    message_id: str
+    conversation_id: str
+    content: str
+    sender_id: str
+    category: Literal["text", "invite"]
+
+
+class Conversation(msgspec.Struct, kw_only=True, omit_defaults=True):
+    id: str
+    did_join: bool
+    unread_count: int
+    muted: bool
+    member_ids: list[str] | None = None
+    name: str | None = None
+    owner_id: str | None = None
+
+
+class Position(msgspec.Struct, kw_only=True, omit_defaults=True):
+    x: float
+    y: float
+    z: float
+    facing: Literal["FrontRight", "FrontLeft", "BackRight", "BackLeft"] | None = None
+
+
+class AnchorPosition(msgspec.Struct, kw_only=True, omit_defaults=True):
+    entity_id: str
+    anchor_ix: int
+
+
+class RoomInfo(msgspec.Struct, kw_only=True, omit_defaults=True):
+    """Information about the room."""
+
+    owner_id: str
+    room_name: str
+
+
+class CurrencyItem(msgspec.Struct, kw_only=True, omit_defaults=True):
+    """A Highrise currency amount.
+
+    The most used currencies are:
+    * `gold`
+    * `bubbles`
+
+    Many other currencies exist, however."""
+
+    type: str
+    amount: int
@@ -0,0 +1,394 @@
+from typing import Literal, Any
+from aiorise.structs.object_types import *
+import msgspec
+
+
+class ChatRequest(
+    msgspec.Struct,
+    kw_only=True,
+    omit_defaults=True,
+    tag_field="_type",
+    tag="ChatRequest",
+):
+    """Send a chat message to a room.
+
+    The chat message will be broadcast to everyone in the room, or whispered to `whisper_target_id` if provided.
+    """
+
+    message: str
+    whisper_target_id: str | None = None
+
+
+class ChannelRequest(
+    msgspec.Struct,
+    kw_only=True,
+    omit_defaults=True,
+    tag_field="_type",
+    tag="ChannelRequest",
+):
+    """Send a hidden channel message to the room.
+
+    This message not be displayed in the chat, so it can be used to
+    communicate between bots or client-side scripts."""
+
+    message: str
+    tags: list[str] | None = None
+
+
+class EmoteRequest(
+    msgspec.Struct,
+    kw_only=True,
+    omit_defaults=True,
+    tag_field="_type",
+    tag="EmoteRequest",
+):
+    """Perform an emote.
+
+    Some of the available emotes are:
+    * "emoji-angry",
+    * "emoji-thumbsup",
+    * "emote-hello",
+    * "emote-tired",
+    * "dance-macarena"
+
+    `target_user_id` can be provided if the emote can be directed toward a player."""
+
+    emote_id: str
+    target_user_id: str | None = None
+
+
+class ReactionRequest(
+    msgspec.Struct,
+    kw_only=True,
+    omit_defaults=True,
+    tag_field="_type",
+    tag="ReactionRequest",
+):
+    """Send a reaction to a user."""
+
+    reaction: Literal["clap", "heart", "thumbs", "wave", "wink"]
+    target_user_id: str
+
+
+class KeepaliveRequest(
+    msgspec.Struct,
+    kw_only=True,
+    omit_defaults=True,
+    tag_field="_type",
+    tag="KeepaliveRequest",
+):
+    """Send a keepalive request.
+
+    This must be sent every 15 seconds or the server will terminate the connection."""
+
+
+class TeleportRequest(
+    msgspec.Struct,
+    kw_only=True,
+    omit_defaults=True,
+    tag_field="_type",
+    tag="TeleportRequest",
+):
+    """Teleport the provided `user_id` to the provided `destination`."""
+
+    user_id: str
+
+
+class FloorHitRequest(
+    msgspec.Struct,
+    kw_only=True,
+    omit_defaults=True,
+    tag_field="_type",
+    tag="FloorHitRequest",
+):
+    """Move the bot to the given `destination`."""
+
+
+class GetRoomUsersRequest(
+    msgspec.Struct,
+    kw_only=True,
+    omit_defaults=True,
+    tag_field="_type",
+    tag="GetRoomUsersRequest",
+):
+    """Fetch the list of users currently in the room, with their positions."""
+
+
+class GetWalletRequest(
+    msgspec.Struct,
+    kw_only=True,
+    omit_defaults=True,
+    tag_field="_type",
+    tag="GetWalletRequest",
+):
+    """Fetch the bot's wallet.
+
+    The wallet contains Highrise currencies."""
+
+
+class ModerateRoomRequest(
+    msgspec.Struct,
+    kw_only=True,
+    omit_defaults=True,
+    tag_field="_type",
+    tag="ModerateRoomRequest",
+):
+    """Moderate the room.
+
+    This can be used to kick, ban, unban, or mute a user."""
+
+    user_id: str
+    moderation_action: Literal["kick", "ban", "unban", "mute"]
+    action_length: int | None = None
+
+
+class GetRoomPrivilegeRequest(
+    msgspec.Struct,
+    kw_only=True,
+    omit_defaults=True,
+    tag_field="_type",
+    tag="GetRoomPrivilegeRequest",
+):
+    """Fetch the room privileges for provided `user_id`."""
+
+    user_id: str
+
+
+class ChangeRoomPrivilegeRequest(
+    msgspec.Struct,
+    kw_only=True,
+    omit_defaults=True,
+    tag_field="_type",
+    tag="ChangeRoomPrivilegeRequest",
+):
+    """Change the room privileges for provided `user_id`.
+    This can be used to both give and take moderation and designer privileges for current room.
+
+    Bots have to be in the room to change privileges.
+    Bots are using their owner's privileges."""
+
+    user_id: str
+
+
+class MoveUserToRoomRequest(
+    msgspec.Struct,
+    kw_only=True,
+    omit_defaults=True,
+    tag_field="_type",
+    tag="MoveUserToRoomRequest",
+):
+    """Move the provided `user_id` to the provided `room_id`."""
+
+    user_id: str
+    room_id: str
+
+
+class AnchorHitRequest(
+    msgspec.Struct,
+    kw_only=True,
+    omit_defaults=True,
+    tag_field="_type",
+    tag="AnchorHitRequest",
+):
+    """Move the bot to the given furniture Anchor Position."""
+
+
+class InviteSpeakerRequest(
+    msgspec.Struct,
+    kw_only=True,
+    omit_defaults=True,
+    tag_field="_type",
+    tag="InviteSpeakerRequest",
+):
+    """Invite a user to speak in the room."""
+
+    user_id: str
+
+
+class RemoveSpeakerRequest(
+    msgspec.Struct,
+    kw_only=True,
+    omit_defaults=True,
+    tag_field="_type",
+    tag="RemoveSpeakerRequest",
+):
+    """Remove a user from speaking in the room."""
+
+    user_id: str
+
+
+class CheckVoiceChatRequest(
+    msgspec.Struct,
+    kw_only=True,
+    omit_defaults=True,
+    tag_field="_type",
+    tag="CheckVoiceChatRequest",
+):
+    """Check the voice chat status in the room."""
+
+
+class GetUserOutfitRequest(
+    msgspec.Struct,
+    kw_only=True,
+    omit_defaults=True,
+    tag_field="_type",
+    tag="GetUserOutfitRequest",
+):
+    """Get the outfit of a user."""
+
+    user_id: str
+
+
+class GetBackpackRequest(
+    msgspec.Struct,
+    kw_only=True,
+    omit_defaults=True,
+    tag_field="_type",
+    tag="GetBackpackRequest",
+):
+    """Fetch a user's world backpack."""
+
+    user_id: str
+
+
+class GetMessagesRequest(
+    msgspec.Struct,
+    kw_only=True,
+    omit_defaults=True,
+    tag_field="_type",
+    tag="GetMessagesRequest",
+):
+    """Get the messages of a conversation. 20 messages will be returned at most, if all 20 messages are returned, the
+    last_message_id can be used to retrieve the next 20 messages. conversation_id must be provided.
+    """
+
+    conversation_id: str
+    last_message_id: str | None = None
+
+
+class SendMessageRequest(
+    msgspec.Struct,
+    kw_only=True,
+    omit_defaults=True,
+    tag_field="_type",
+    tag="SendMessageRequest",
+):
+    """Send a message to a conversation. If bot wishes to send room invite, the room_id must be provided."""
+
+    conversation_id: str
+    content: str
+    type: Literal["text", "invite"]
+    room_id: str | None = None
+
+
+class GetConversationsRequest(
+    msgspec.Struct,
+    kw_only=True,
+    omit_defaults=True,
+    tag_field="_type",
+    tag="GetConversationsRequest",
+):
+    """Get the conversations of a bat. if not_joined is true, only get the conversations that bot has not joined yet will
+    be returned. 20 conversations will be returned at most, if all 20 conversations are returned, the last_id can be used
+    to retrieve the next 20 conversations."""
+
+    not_joined: bool | None = None
+    last_id: str | None = None
+
+
+class LeaveConversationRequest(
+    msgspec.Struct,
+    kw_only=True,
+    omit_defaults=True,
+    tag_field="_type",
+    tag="LeaveConversationRequest",
+):
+    """Leave a conversation."""
+
+    conversation_id: str
+
+
+class BuyVoiceTimeRequest(
+    msgspec.Struct,
+    kw_only=True,
+    omit_defaults=True,
+    tag_field="_type",
+    tag="BuyVoiceTimeRequest",
+):
+    """Buy a voice time for a room."""
+
+    payment_method: Literal[
+        "bot_wallet_only", "bot_wallet_priority", "user_wallet_only"
+    ]
+
+
+class BuyRoomBoostRequest(
+    msgspec.Struct,
+    kw_only=True,
+    omit_defaults=True,
+    tag_field="_type",
+    tag="BuyRoomBoostRequest",
+):
+    """Buy a room boost."""
+
+    payment_method: Literal[
+        "bot_wallet_only", "bot_wallet_priority", "user_wallet_only"
+    ]
+    amount: int | None = None
+
+
+class TipUserRequest(
+    msgspec.Struct,
+    kw_only=True,
+    omit_defaults=True,
+    tag_field="_type",
+    tag="TipUserRequest",
+):
+    """Tip a user."""
+
+    user_id: str
+    gold_bar: Literal[
+        "gold_bar_1",
+        "gold_bar_5",
+        "gold_bar_10",
+        "gold_bar_50",
+        "gold_bar_100",
+        "gold_bar_500",
+        "gold_bar_1k",
+        "gold_bar_5000",
+        "gold_bar_10k",
+    ]
+
+
+class SetOutfitRequest(
+    msgspec.Struct,
+    kw_only=True,
+    omit_defaults=True,
+    tag_field="_type",
+    tag="SetOutfitRequest",
+):
+    """Set the outfit of a user."""
+
+    outfit: list[Item]
+
+
+class GetInventoryRequest(
+    msgspec.Struct,
+    kw_only=True,
+    omit_defaults=True,
+    tag_field="_type",
+    tag="GetInventoryRequest",
+):
+    """Get the inventory of a user."""
+
+
+class BuyItemRequest(
+    msgspec.Struct,
+    kw_only=True,
+    omit_defaults=True,
+    tag_field="_type",
+    tag="BuyItemRequest",
+):
+    """Buy an item."""
+
+    item_id: str
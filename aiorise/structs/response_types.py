@@ -0,0 +1,316 @@
+from typing import Literal, Any
+from aiorise.structs.object_types import *
+import msgspec
+
+
+class EmoteResponse(
+    msgspec.Struct,
+    kw_only=True,
+    omit_defaults=True,
+    tag_field="_type",
+    tag="EmoteResponse",
+):
+    """The successful response to a `EmoteRequest`."""
+
+
+class ChannelResponse(
+    msgspec.Struct,
+    kw_only=True,
+    omit_defaults=True,
+    tag_field="_type",
+    tag="ChannelResponse",
+):
+    """A channel message has been successfully sent."""
+
+
+class GetRoomUsersResponse(
+    msgspec.Struct,
+    kw_only=True,
+    omit_defaults=True,
+    tag_field="_type",
+    tag="GetRoomUsersResponse",
+):
+    """The list of users in the room, alongside their positions."""
+
+    content: Any
+
+    def __post_init__(self) -> None:
+        self.content = convert(
+            self.content, list[tuple[User, Position | AnchorPosition]]
+        )
+
+
+class ReactionResponse(
+    msgspec.Struct,
+    kw_only=True,
+    omit_defaults=True,
+    tag_field="_type",
+    tag="ReactionResponse",
+):
+    """A response to a successful reaction."""
+
+
+class GetWalletResponse(
+    msgspec.Struct,
+    kw_only=True,
+    omit_defaults=True,
+    tag_field="_type",
+    tag="GetWalletResponse",
+):
+    """The bot's wallet."""
+
+    content: list[CurrencyItem]
+
+
+class TeleportResponse(
+    msgspec.Struct,
+    kw_only=True,
+    omit_defaults=True,
+    tag_field="_type",
+    tag="TeleportResponse",
+):
+    """The successful response to a `TeleportRequest`."""
+
+
+class FloorHitResponse(
+    msgspec.Struct,
+    kw_only=True,
+    omit_defaults=True,
+    tag_field="_type",
+    tag="FloorHitResponse",
+):
+    """The successful response to a `FloorHitRequest`."""
+
+
+class AnchorHitResponse(
+    msgspec.Struct,
+    kw_only=True,
+    omit_defaults=True,
+    tag_field="_type",
+    tag="AnchorHitResponse",
+):
+    """The successful response to a `AnchorHitRequest`."""
+
+
+class KeepaliveResponse(
+    msgspec.Struct,
+    kw_only=True,
+    omit_defaults=True,
+    tag_field="_type",
+    tag="KeepaliveResponse",
+):
+    """The successful response to a `KeepaliveRequest`."""
+
+
+class ModerateRoomResponse(
+    msgspec.Struct,
+    kw_only=True,
+    omit_defaults=True,
+    tag_field="_type",
+    tag="ModerateRoomResponse",
+):
+    """The successful response to a `ModerateRoomRequest`."""
+
+
+class GetRoomPrivilegeResponse(
+    msgspec.Struct,
+    kw_only=True,
+    omit_defaults=True,
+    tag_field="_type",
+    tag="GetRoomPrivilegeResponse",
+):
+    """The room privileges for provided `user_id`."""
+
+
+class ChangeRoomPrivilegeResponse(
+    msgspec.Struct,
+    kw_only=True,
+    omit_defaults=True,
+    tag_field="_type",
+    tag="ChangeRoomPrivilegeResponse",
+):
+    """The successful response to a `ChangeRoomPrivilegeRequest`."""
+
+
+class MoveUserToRoomResponse(
+    msgspec.Struct,
+    kw_only=True,
+    omit_defaults=True,
+    tag_field="_type",
+    tag="MoveUserToRoomResponse",
+):
+    """The successful response to a `MoveUserToRoomRequest`."""
+
+
+class CheckVoiceChatResponse(
+    msgspec.Struct,
+    kw_only=True,
+    omit_defaults=True,
+    tag_field="_type",
+    tag="CheckVoiceChatResponse",
+):
+    """Returns the status of voice chat in the room.
+    seconds_left: The number of seconds left until the voice chat ends.
+    auto_speakers: The list of users that automatically have voice chat privileges in the room like moderators and
+    owner.
+    users: The list of users that currently have voice chat privileges in the room."""
+
+    seconds_left: int
+
+
+class GetUserOutfitResponse(
+    msgspec.Struct,
+    kw_only=True,
+    omit_defaults=True,
+    tag_field="_type",
+    tag="GetUserOutfitResponse",
+):
+    """The outfit of a user. Returns list of items user is currently wearing."""
+
+    outfit: list[Item]
+
+
+class GetMessagesResponse(
+    msgspec.Struct,
+    kw_only=True,
+    omit_defaults=True,
+    tag_field="_type",
+    tag="GetMessagesResponse",
+):
+    """The messages of a conversation. This will return list of max 20 messages."""
+
+    messages: list[Message]
+
+
+class SendMessageResponse(
+    msgspec.Struct,
+    kw_only=True,
+    omit_defaults=True,
+    tag_field="_type",
+    tag="SendMessageResponse",
+):
+    """The message sent success response."""
+
+
+class GetConversationsResponse(
+    msgspec.Struct,
+    kw_only=True,
+    omit_defaults=True,
+    tag_field="_type",
+    tag="GetConversationsResponse",
+):
+    """The conversations of a bot. This will return list of max 20 conversations.
+    not_joined: The number of conversations that bot has not joined yet. Those are not returned in the conversations
+    list unless not_joined is true."""
+
+    conversations: list[Conversation]
+    not_joined: int
+
+
+class LeaveConversationResponse(
+    msgspec.Struct,
+    kw_only=True,
+    omit_defaults=True,
+    tag_field="_type",
+    tag="LeaveConversationResponse",
+):
+    """The leave conversation success response."""
+
+
+class BuyVoiceTimeResponse(
+    msgspec.Struct,
+    kw_only=True,
+    omit_defaults=True,
+    tag_field="_type",
+    tag="BuyVoiceTimeResponse",
+):
+    """Buy a voice token."""
+
+    result: Literal["success", "insufficient_funds", "only_token_bought"]
+
+
+class BuyRoomBoostResponse(
+    msgspec.Struct,
+    kw_only=True,
+    omit_defaults=True,
+    tag_field="_type",
+    tag="BuyRoomBoostResponse",
+):
+    """Buy a room boost."""
+
+    result: Literal["success", "insufficient_funds", "only_token_bought"]
+
+
+class TipUserResponse(
+    msgspec.Struct,
+    kw_only=True,
+    omit_defaults=True,
+    tag_field="_type",
+    tag="TipUserResponse",
+):
+    """Tip a user."""
+
+    result: Literal["success", "insufficient_funds"]
+
+
+class SetOutfitResponse(
+    msgspec.Struct,
+    kw_only=True,
+    omit_defaults=True,
+    tag_field="_type",
+    tag="SetOutfitResponse",
+):
+    """Set the outfit of a user."""
+
+
+class GetInventoryResponse(
+    msgspec.Struct,
+    kw_only=True,
+    omit_defaults=True,
+    tag_field="_type",
+    tag="GetInventoryResponse",
+):
+    """Get the inventory of a user."""
+
+    items: list[Item]
+
+
+class BuyItemResponse(
+    msgspec.Struct,
+    kw_only=True,
+    omit_defaults=True,
+    tag_field="_type",
+    tag="BuyItemResponse",
+):
+    """Buy an item."""
+
+    result: Literal["success", "insufficient_funds"]
+
+
+AnyResponse = (
+    EmoteResponse
+    | ChannelResponse
+    | GetRoomUsersResponse
+    | ReactionResponse
+    | GetWalletResponse
+    | TeleportResponse
+    | FloorHitResponse
+    | AnchorHitResponse
+    | KeepaliveResponse
+    | ModerateRoomResponse
+    | GetRoomPrivilegeResponse
+    | ChangeRoomPrivilegeResponse
+    | MoveUserToRoomResponse
+    | CheckVoiceChatResponse
+    | GetUserOutfitResponse
+    | GetMessagesResponse
+    | SendMessageResponse
+    | GetConversationsResponse
+    | LeaveConversationResponse
+    | BuyVoiceTimeResponse
+    | BuyRoomBoostResponse
+    | TipUserResponse
+    | SetOutfitResponse
+    | GetInventoryResponse
+    | BuyItemResponse
+)
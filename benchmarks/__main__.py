@@ -0,0 +1,65 @@
+from .compare import compare
+from .harness import RESULTS
+
+import argparse
+import asyncio
+import importlib
+import json
+import platform
+import subprocess
+import sys
+import time
+
+
+SUITES = ["startup", "events", "codecs", "structs", "dispatch", "handlers", "requests", "e2e"]
+
+
+def revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Run the benchmark suites")
+    parser.add_argument("suites", nargs="*", choices=SUITES, default=[], metavar="suite",
+                        help=f"suites to run, all by default ({', '.join(SUITES)})")
+    parser.add_argument("--json", metavar="PATH", help="save results to PATH")
+    parser.add_argument("--baseline", metavar="PATH", help="diff results against a saved run")
+    parser.add_argument("--tolerance", type=float, default=0.1,
+                        help="relative change counted as a regression (default: 0.1)")
+    args = parser.parse_args()
+
+    for suite in args.suites or SUITES:
+        module = importlib.import_module(f".bench_{suite}", __package__)
+        result = module.main()
+        # Some suites expose main() as a coroutine function
+        if asyncio.iscoroutine(result):
+            asyncio.run(result)
+        print()
+
+    run = {
+        "revision": revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "time": time.time(),
+        "benchmarks": RESULTS,
+    }
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(run, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if regressions := compare(baseline, run, args.tolerance):
+            print(f"{len(regressions)} regressions beyond {args.tolerance:.0%}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+from aiorise.api.adapters import event_adapter
+from aiorise.connection.codec import BaseCodec, JsonCodec, OrjsonCodec, MsgspecCodec
+from aiorise.connection.template import FrameTemplate
+
+from .bench_events import realistic_mix
+from .harness import rate, report
+
+import json
+
+
+REQUESTS = [
+    {"_type": "ChatRequest", "message": "hello there", "whisper_target_id": None, "rid": "0" * 32},
+    {"_type": "TeleportRequest", "user_id": "1" * 24, "destination": {"x": 1.5, "y": 0.0, "z": 3.5}, "rid": "0" * 32},
+    {"_type": "KeepaliveRequest", "rid": "0" * 32},
+]
+
+
+def codecs() -> dict[str, BaseCodec]:
+    available = {"json": JsonCodec()}
+    for name, cls in (("orjson", OrjsonCodec), ("msgspec", MsgspecCodec)):
+        try:
+            available[name] = cls()
+        except ImportError:
+            print(f"{name} is not installed, skipping")
+    return available
+
+
+def main() -> None:
+    frames = [json.dumps(frame) for frame in realistic_mix(10_000)]
+    number = len(frames)
+
+    encode, decode, events = {}, {}, {}
+    for name, codec in codecs().items():
+        it = iter(REQUESTS * number)
+        encode[name] = rate(lambda: codec.encode(next(it)), number)
+
+        it = iter(frames)
+        decode[name] = rate(lambda: codec.decode(next(it)), number)
+
+        it = iter(frames)
+        events[f"{name} decode + validate_python"] = rate(
+            lambda: event_adapter.validate_python(codec.decode(next(it))), number
+        )
+
+    keepalive = {"_type": "KeepaliveRequest"}
+    template = FrameTemplate("KeepaliveRequest")
+    encode["json, KeepaliveRequest"] = rate(lambda: json.dumps(keepalive | {"rid": "0"}), number)
+    encode["FrameTemplate, KeepaliveRequest"] = rate(lambda: template.render("0"), number)
+
+    # The path taken by codecs with validates_raw set
+    it = iter(frames)
+    events["validate_json"] = rate(lambda: event_adapter.validate_json(next(it)), number)
+
+    report("Encode, requests", encode, "frames/s")
+    report("Decode, event frames", decode, "frames/s")
+    report("Decode and validate, event frames", events, "events/s")
+
+
+if __name__ == "__main__":
+    main()
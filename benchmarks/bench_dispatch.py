@@ -0,0 +1,94 @@
+from aiorise.actions.action import ActionFactory, SyncAction
+from aiorise.events.event_types import ChatEvent, User
+from aiorise.events.event_context import EventContext
+from aiorise.filters.filter import FilterFactory, SyncFilter
+from aiorise.handlers.handler import Handler
+
+from .harness import arate, rate, report
+
+import asyncio
+
+
+SHAPES = [(1, 1), (1, 10), (1, 100), (3, 3), (3, 5), (6, 2)]  # (depth, width)
+
+
+def build_tree(depth: int, width: int, asynchronous: bool) -> Handler:
+    def check(e, ctx):
+        return True
+
+    async def acheck(e, ctx):
+        return True
+
+    def action(e, ctx):
+        pass
+
+    def grow(node: Handler, level: int) -> None:
+        if level == depth:
+            return
+        for _ in range(width):
+            child = Handler()
+            child.set_filter(acheck if asynchronous else check)
+            child.set_action(action)
+            node.add_child(child)
+            grow(child, level + 1)
+
+    root = Handler()
+    grow(root, 0)
+    return root
+
+
+def size(depth: int, width: int) -> int:
+    return sum(width ** level for level in range(1, depth + 1))
+
+
+async def handler_trees() -> None:
+    e = ChatEvent(_type="ChatEvent", user=User(id="1", username="user"), message="hello", whisper=False)
+    ctx = EventContext(client=None)  # type: ignore
+
+    for kind, asynchronous in (("SyncFilter", False), ("AsyncFilter", True)):
+        results = {}
+        for depth, width in SHAPES:
+            tree = build_tree(depth, width, asynchronous)
+            # Keep the work per shape roughly constant so small trees are not noise
+            number = max(200, 20_000 // size(depth, width))
+            results[f"depth {depth} width {width:<3} ({size(depth, width)} nodes)"] = await arate(
+                lambda: tree.run(e, ctx), number, repeat=3
+            )
+        report(f"Handler.run by tree shape, {kind}", results, "events/s")
+
+
+def factories() -> None:
+    def check(e, ctx):
+        return True
+
+    async def acheck(e, ctx):
+        return True
+
+    def action(e, ctx):
+        pass
+
+    async def aaction(e, ctx):
+        pass
+
+    base_filter, base_action = SyncFilter(check), SyncAction(action)
+    number = 100_000
+
+    report("FilterFactory.create", {
+        "sync callable": rate(lambda: FilterFactory.create(check), number, repeat=3),
+        "async callable": rate(lambda: FilterFactory.create(acheck), number, repeat=3),
+        "BaseFilter instance": rate(lambda: FilterFactory.create(base_filter), number, repeat=3),
+    }, "calls/s")
+    report("ActionFactory.create", {
+        "sync callable": rate(lambda: ActionFactory.create(action), number, repeat=3),
+        "async callable": rate(lambda: ActionFactory.create(aaction), number, repeat=3),
+        "BaseAction instance": rate(lambda: ActionFactory.create(base_action), number, repeat=3),
+    }, "calls/s")
+
+
+def main() -> None:
+    factories()
+    asyncio.run(handler_trees())
+
+
+if __name__ == "__main__":
+    main()
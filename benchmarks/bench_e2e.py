@@ -0,0 +1,155 @@
+from aiorise.api.client import HighriseWebApiClient
+from aiorise.bot.bot import Bot
+from aiorise.connection import HighriseWebApiConnection, Priority
+from aiorise.events.event_types import ChatEvent, UserMovedEvent
+from aiorise.handlers.handler import Handler
+
+from .harness import report
+from .server import FakeHighriseServer
+
+import asyncio
+import statistics
+import time
+import tracemalloc
+
+
+EVENTS = 50_000
+REQUESTS = 5_000
+MEMORY_SECONDS = 10
+MEMORY_RATE = 2_000
+
+
+def make_client(server: FakeHighriseServer, **options) -> HighriseWebApiClient:
+    # Outbound rate limits would measure the token buckets, not the stack
+    options.setdefault("rates", {Priority.REQUEST: None, Priority.CHAT: None})
+    return HighriseWebApiClient(HighriseWebApiConnection(server.uri, "token", "room", **options))
+
+
+def make_handler(on_event) -> Handler:
+    root = Handler()
+    root.set_action(on_event)
+
+    @root.on(ChatEvent, f=lambda e, ctx: e.message.startswith("!"))
+    def command(e, ctx):
+        pass
+
+    @root.on(UserMovedEvent)
+    def moved(e, ctx):
+        e.position
+
+    return root
+
+
+async def event_throughput(lazy: bool, events: int = EVENTS) -> float:
+    done = asyncio.Event()
+    received = 0
+
+    def on_event(e, ctx):
+        nonlocal received
+        received += 1
+        if received == events:
+            done.set()
+
+    async with FakeHighriseServer(event_rate=None, event_limit=events) as server:
+        client = make_client(server, reconnect=False)
+        bot = Bot(client, make_handler(on_event), lazy=lazy)
+
+        start = time.perf_counter()
+        task = asyncio.create_task(bot.start())
+        await done.wait()
+        elapsed = time.perf_counter() - start
+
+        task.cancel()
+        await client.close()
+
+    return events / elapsed
+
+
+async def drain(client: HighriseWebApiClient) -> None:
+    # Responses are only resolved while something is reading the socket
+    async for _ in client.listen():
+        pass
+
+
+async def request_latency(concurrency: int, requests: int = REQUESTS) -> dict[str, float]:
+    samples = []
+
+    async with FakeHighriseServer() as server:
+        client = make_client(server, reconnect=False)
+        await client.connect()
+        reader = asyncio.create_task(drain(client))
+
+        async def worker(count: int) -> None:
+            for _ in range(count):
+                start = time.perf_counter()
+                await client.get_room_users()
+                samples.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        async with asyncio.TaskGroup() as tg:
+            for _ in range(concurrency):
+                tg.create_task(worker(requests // concurrency))
+        elapsed = time.perf_counter() - start
+
+        reader.cancel()
+        await client.close()
+
+    quantiles = statistics.quantiles(samples, n=100)
+    return {
+        "p50": quantiles[49] * 1e6,
+        "p90": quantiles[89] * 1e6,
+        "p99": quantiles[98] * 1e6,
+        "throughput": len(samples) / elapsed,
+    }
+
+
+async def memory_growth(seconds: int = MEMORY_SECONDS, event_rate: int = MEMORY_RATE) -> list[float]:
+    tracemalloc.start()
+    usage = []
+
+    async with FakeHighriseServer(event_rate=event_rate) as server:
+        client = make_client(server, reconnect=False)
+        bot = Bot(client, make_handler(lambda e, ctx: None))
+        task = asyncio.create_task(bot.start())
+
+        for _ in range(seconds):
+            await asyncio.sleep(1)
+            # Requests interleaved with events exercise the pending table too
+            await asyncio.gather(*(client.get_room_users() for _ in range(50)))
+            usage.append(tracemalloc.get_traced_memory()[0] / 1024)
+
+        task.cancel()
+        await client.close()
+
+    tracemalloc.stop()
+    return usage
+
+
+async def amain() -> None:
+    report("End-to-end event throughput through Bot.start", {
+        "eager": await event_throughput(lazy=False),
+        "lazy": await event_throughput(lazy=True),
+    }, "events/s")
+
+    throughput = {}
+    for concurrency in (1, 16, 64):
+        latency = await request_latency(concurrency)
+        throughput[f"{concurrency} concurrent"] = latency.pop("throughput")
+        report(f"Request round trip, {concurrency} concurrent", latency, "us")
+    report("Request throughput", throughput, "requests/s")
+
+    usage = await memory_growth()
+    report(f"Traced memory over {len(usage)}s at {MEMORY_RATE} events/s", {
+        "first sample": usage[0],
+        "last sample": usage[-1],
+        "growth": usage[-1] - usage[0],
+        "growth after warmup": usage[-1] - usage[len(usage) // 2],
+    }, "KiB")
+
+
+def main() -> None:
+    asyncio.run(amain())
+
+
+if __name__ == "__main__":
+    main()
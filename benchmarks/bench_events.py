@@ -0,0 +1,67 @@
+from pydantic import BaseModel
+from typing import Union, get_args
+from aiorise.api.adapters import event_adapter
+from aiorise.events.event_types import AnyEvent
+from aiorise.events.event_wrapper import EventWrapper
+
+from .harness import rate, report
+
+import random
+
+
+def user(n: int) -> dict:
+    return {"id": f"{n:024x}", "username": f"user{n}"}
+
+
+def position(n: int) -> dict:
+    return {"x": n % 20 + 0.5, "y": 0.0, "z": n % 13 + 0.5, "facing": "FrontRight"}
+
+
+FRAMES = {
+    "UserMovedEvent": (70, lambda n: {"_type": "UserMovedEvent", "user": user(n), "position": position(n)}),
+    "ChatEvent": (15, lambda n: {"_type": "ChatEvent", "user": user(n), "message": "hello there", "whisper": False}),
+    "UserJoinedEvent": (4, lambda n: {"_type": "UserJoinedEvent", "user": user(n), "position": position(n)}),
+    "UserLeftEvent": (4, lambda n: {"_type": "UserLeftEvent", "user": user(n)}),
+    "EmoteEvent": (3, lambda n: {"_type": "EmoteEvent", "user": user(n), "emote_id": "emote-hello", "receiver": user(n + 1)}),
+    "ReactionEvent": (2, lambda n: {"_type": "ReactionEvent", "user": user(n), "reaction": "wave", "receiver": user(n + 1)}),
+    "TipReactionEvent": (1, lambda n: {
+        "_type": "TipReactionEvent", "sender": user(n), "receiver": user(n + 1),
+        "item": {"type": "gold", "amount": 5},
+    }),
+    "MessageEvent": (1, lambda n: {"_type": "MessageEvent", "user_id": user(n)["id"], "conversation_id": "c", "is_new_conversation": False}),
+}
+
+
+def realistic_mix(size: int, seed: int = 0) -> list[dict]:
+    rng = random.Random(seed)
+    builders = [builder for _, builder in FRAMES.values()]
+    weights = [weight for weight, _ in FRAMES.values()]
+    return [rng.choices(builders, weights)[0](n) for n in range(size)]
+
+
+class PlainEventWrapper(BaseModel):
+    # The event union as it was generated before it became discriminated
+    data: Union[get_args(AnyEvent)[0]]  # type: ignore
+
+
+def main() -> None:
+    frames = realistic_mix(10_000)
+    it = iter(frames * 10)
+
+    results = {
+        "plain union wrapper": rate(lambda: PlainEventWrapper.model_validate({"data": next(it)}), len(frames)),
+        "discriminated adapter": rate(lambda: event_adapter.validate_python(next(it)), len(frames)),
+    }
+    report("Event decoding, realistic mix", results, "events/s")
+
+    per_type = {}
+    for name, (_, builder) in FRAMES.items():
+        frame = builder(1)
+        per_type[f"{name:<16} plain"] = rate(lambda: PlainEventWrapper.model_validate({"data": frame}), 20_000)
+        per_type[f"{name:<16} discriminated"] = rate(lambda: event_adapter.validate_python(frame), 20_000)
+        per_type[f"{name:<16} EventWrapper"] = rate(lambda: EventWrapper.model_validate({"data": frame}), 20_000)
+    report("Event decoding, per type", per_type, "events/s")
+
+
+if __name__ == "__main__":
+    main()
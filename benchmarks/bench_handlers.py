@@ -0,0 +1,83 @@
+from aiorise.events.event_types import AnyEvent, ChatEvent, UserMovedEvent, User, Position
+from aiorise.events.event_context import EventContext
+from aiorise.handlers.handler import Handler
+
+from .harness import arate, report
+
+import asyncio
+import itertools
+
+
+BRANCHES = 10
+LEAVES = 9  # 1 root + 10 branches + 90 leaves = 101 handlers
+
+
+async def legacy_run(handler: Handler, e: AnyEvent, ctx: EventContext) -> None:
+    # Handler.run as it was before trees were compiled: every filter is a
+    # coroutine and every node opens a TaskGroup for its children.
+    if (await handler._filter.check(e, ctx) if handler._filter else True):
+        await handler._action.run(e, ctx) if handler._action else None
+
+        async with asyncio.TaskGroup() as tg:
+            for child in handler._children:
+                tg.create_task(legacy_run(child, e, ctx))
+
+
+def build_tree(filtered: bool, typed: bool, asynchronous: bool) -> Handler:
+    counter = itertools.count()
+
+    def action(e, ctx):
+        next(counter)
+
+    async def aaction(e, ctx):
+        next(counter)
+
+    root = Handler()
+    for branch in range(BRANCHES):
+        node = Handler()
+        if typed:
+            node.set_event_types(ChatEvent)
+        elif filtered:
+            node.set_filter(lambda e, ctx: isinstance(e, ChatEvent))
+        root.add_child(node)
+
+        for leaf in range(LEAVES):
+            node.child(lambda e, ctx, n=str(leaf): e.user.id == n)(
+                aaction if asynchronous else action
+            )
+
+    return root
+
+
+async def main() -> None:
+    user = User(id="3", username="user")
+    events = [
+        ChatEvent(_type="ChatEvent", user=user, message="hello 3", whisper=False),
+        UserMovedEvent(_type="UserMovedEvent", user=user, position=Position(x=1, y=0, z=2)),
+    ]
+    ctx = EventContext(client=None)  # type: ignore
+    number = 2_000
+
+    for asynchronous in (False, True):
+        results = {}
+        for label, filtered, typed in (
+            ("unfiltered", False, False),
+            ("filtered", True, False),
+            ("typed", False, True),
+        ):
+            tree = build_tree(filtered, typed, asynchronous)
+            for e in events:
+                name = type(e).__name__
+                results[f"{label:<10} {name:<14} before"] = await arate(
+                    lambda: legacy_run(tree, e, ctx), number
+                )
+                results[f"{label:<10} {name:<14} after"] = await arate(
+                    lambda: tree.run(e, ctx), number
+                )
+
+        kind = "async" if asynchronous else "sync"
+        report(f"Handler.run, 101-handler tree, {kind} actions", results, "events/s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
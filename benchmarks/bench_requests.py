@@ -0,0 +1,72 @@
+from aiorise.api import debug
+from aiorise.api.client_methods import HighriseWebApiMethods
+from aiorise.connection.scheduler import Priority
+from aiorise.connection.template import FrameTemplate
+
+from .harness import arate, report
+from .server import RESPONSES, sample
+
+import asyncio
+import inspect
+
+
+class EchoConnection:
+    """Answers from memory so only request building and response parsing are timed."""
+
+    async def send(self, payload: dict, wait_for_resp: bool = True, priority: Priority = Priority.REQUEST) -> dict | None:
+        if not wait_for_resp:
+            return None
+        name = payload.get("_type") or payload.get("type")
+        return RESPONSES[name.removesuffix("Request") + "Response"]
+
+    async def send_template(self, template: FrameTemplate, wait_for_resp: bool = True, priority: Priority = Priority.REQUEST) -> dict | None:
+        template.render("0")
+        return await self.send(template.payload, wait_for_resp, priority)
+
+
+class EchoClient(HighriseWebApiMethods):
+    def __init__(self):
+        self._connection = EchoConnection()
+
+
+def arguments(method) -> dict:
+    return {
+        name: sample(parameter.annotation)
+        for name, parameter in list(inspect.signature(method).parameters.items())[1:]
+        if parameter.default is inspect.Parameter.empty
+    }
+
+
+async def methods(validate: bool) -> dict[str, float]:
+    client = EchoClient()
+    results = {}
+    debug.validate_requests = validate
+
+    for name, method in inspect.getmembers(HighriseWebApiMethods, inspect.iscoroutinefunction):
+        kwargs = arguments(method)
+        bound = getattr(client, name)
+        try:
+            await bound(**kwargs)
+        except Exception as e:
+            print(f"{name} cannot be called with sample arguments, skipping: {e!r}")
+            continue
+        results[name] = await arate(lambda: bound(**kwargs), 10_000, repeat=3)
+
+    return results
+
+
+async def amain() -> None:
+    validate = debug.validate_requests
+    try:
+        report("Client method, request build + response model_validate", await methods(False), "calls/s")
+        report("Client method, debug.validate_requests", await methods(True), "calls/s")
+    finally:
+        debug.validate_requests = validate
+
+
+def main() -> None:
+    asyncio.run(amain())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+from .harness import report
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+
+RUNS = 15
+
+# Timed inside the child so interpreter start-up is reported separately
+PROBE = """
+import json, resource, sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"import": elapsed, "rss": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss}}))
+"""
+
+STATEMENTS = {
+    "import aiorise.bot": "import aiorise.bot",
+    "import aiorise.api.client": "import aiorise.api.client",
+    "first event decoded": (
+        "import aiorise.bot\n"
+        "from aiorise.api.adapters import event_adapter\n"
+        "event_adapter.validate_python({'_type': 'UserLeftEvent', 'user': {'id': '1', 'username': 'u'}})"
+    ),
+}
+
+
+def probe(statement: str, runs: int = RUNS) -> tuple[list[float], list[float]]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [os.getcwd(), env.get("PYTHONPATH")]))
+
+    times, rss = [], []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", PROBE.format(statement=statement)],
+            capture_output=True, text=True, check=True, env=env
+        ).stdout
+        result = json.loads(output.splitlines()[-1])
+        times.append(result["import"])
+        rss.append(result["rss"])
+    return times, rss
+
+
+def main() -> None:
+    times, memory = {}, {}
+    for name, statement in STATEMENTS.items():
+        # The first run compiles bytecode, the measured ones start warm
+        probe(statement, 1)
+        elapsed, rss = probe(statement)
+        times[name] = statistics.median(elapsed) * 1e3
+        memory[name] = statistics.median(rss) / 1024
+
+    report("Cold start, median of subprocess runs", times, "ms")
+    report("Cold start, peak RSS", memory, "MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+from aiorise.api.adapters import event_adapter
+
+from .bench_events import FRAMES, realistic_mix
+from .harness import rate, report
+
+import json
+import tracemalloc
+
+
+def memory_per_object(decode, frames: list[str]) -> float:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [decode(frame) for frame in frames]
+    size = (tracemalloc.get_traced_memory()[0] - before) / len(objects)
+    tracemalloc.stop()
+    return size
+
+
+def main() -> None:
+    try:
+        from aiorise.structs.adapters import event_decoder
+    except ImportError:
+        print("msgspec is not installed, skipping")
+        return
+
+    frames = [json.dumps(frame) for frame in realistic_mix(10_000)]
+    number = len(frames)
+
+    it = iter(frames)
+    mix = {"pydantic validate_json": rate(lambda: event_adapter.validate_json(next(it)), number)}
+    it = iter(frames)
+    mix["msgspec Decoder.decode"] = rate(lambda: event_decoder.decode(next(it)), number)
+    report("Event decoding into models, realistic mix", mix, "events/s")
+
+    per_type, memory = {}, {}
+    for name, (_, builder) in FRAMES.items():
+        frame = json.dumps(builder(1))
+        per_type[f"{name:<16} pydantic"] = rate(lambda: event_adapter.validate_json(frame), 20_000, repeat=3)
+        per_type[f"{name:<16} msgspec"] = rate(lambda: event_decoder.decode(frame), 20_000, repeat=3)
+
+        sample = [json.dumps(builder(n)) for n in range(2_000)]
+        memory[f"{name:<16} pydantic"] = memory_per_object(event_adapter.validate_json, sample)
+        memory[f"{name:<16} msgspec"] = memory_per_object(event_decoder.decode, sample)
+
+    report("Event decoding into models, per type", per_type, "events/s")
+    report("Memory per decoded event, including nested objects", memory, "bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+from .harness import lower_is_better
+from typing import Any
+
+import argparse
+import json
+import sys
+
+
+def compare(baseline: dict[str, Any], current: dict[str, Any], tolerance: float) -> list[str]:
+    """Print every metric present in both runs, return the regressed ones."""
+    regressions = []
+
+    for title, section in current["benchmarks"].items():
+        base = baseline["benchmarks"].get(title)
+        if base is None:
+            continue
+
+        unit = section["unit"]
+        # Runs saved before the direction was recorded fall back to the unit
+        lower = section.get("lower_is_better", lower_is_better(unit))
+        print(title)
+        for name, value in section["results"].items():
+            if (old := base["results"].get(name)) is None or old == 0:
+                continue
+
+            change = (value - old) / old
+            worse = change > tolerance if lower else change < -tolerance
+            marker = "  REGRESSION" if worse else ""
+            print(f"  {name:<40} {old:>14,.0f} -> {value:>14,.0f} {unit}  {change:+7.1%}{marker}")
+
+            if worse:
+                regressions.append(f"{title}: {name}")
+
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Diff two benchmark JSON files")
+    parser.add_argument("baseline")
+    parser.add_argument("current")
+    parser.add_argument("--tolerance", type=float, default=0.1)
+    args = parser.parse_args()
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.current) as f:
+        current = json.load(f)
+
+    regressions = compare(baseline, current, args.tolerance)
+    if regressions:
+        print(f"{len(regressions)} regressions beyond {args.tolerance:.0%}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+from typing import Any, Awaitable, Callable
+
+import time
+
+
+# Every report() lands here so a runner can save the whole session as JSON
+RESULTS: dict[str, dict[str, Any]] = {}
+
+
+def rate(func: Callable[[], object], number: int, repeat: int = 1) -> float:
+    # Best of `repeat` runs, the least disturbed one is the most repeatable
+    best = 0.0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = max(best, number / (time.perf_counter() - start))
+    return best
+
+
+async def arate(afunc: Callable[[], Awaitable[object]], number: int, repeat: int = 1) -> float:
+    best = 0.0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            await afunc()
+        best = max(best, number / (time.perf_counter() - start))
+    return best
+
+
+def lower_is_better(unit: str) -> bool:
+    # Rates are better higher; times, sizes and counts are better lower
+    return not unit.endswith("/s")
+
+
+def report(
+    title: str,
+    results: dict[str, float],
+    unit: str = "ops/s",
+    lower: bool | None = None
+) -> None:
+    print(title)
+    width = max(map(len, results))
+    for name, value in results.items():
+        print(f"  {name:<{width}}  {value:>14,.0f} {unit}")
+
+    # Saved with the results so a comparison never has to guess the direction
+    RESULTS[title] = {
+        "unit": unit,
+        "lower_is_better": lower_is_better(unit) if lower is None else lower,
+        "results": dict(results)
+    }
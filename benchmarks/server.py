@@ -0,0 +1,226 @@
+from pydantic import BaseModel
+from collections import Counter
+from typing import Any, Literal, Union, get_args, get_origin
+from types import NoneType, UnionType
+from aiorise.api import response_types
+
+from .bench_events import FRAMES
+
+import asyncio
+import http
+import itertools
+import json
+import random
+import time
+
+import websockets.server
+
+
+def sample(annotation: Any) -> Any:
+    """Build the smallest value that validates against `annotation`."""
+    origin, args = get_origin(annotation), get_args(annotation)
+
+    if origin is Literal:
+        return args[0]
+    if origin in (Union, UnionType):
+        return None if NoneType in args else sample(args[0])
+    if origin is list:
+        return []
+    if origin is dict:
+        return {}
+    if origin is tuple:
+        return [sample(arg) for arg in args]
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return {
+            field.alias or name: sample(field.annotation)
+            for name, field in annotation.model_fields.items()
+            if field.is_required()
+        }
+    return {str: "", int: 0, float: 0.0, bool: False}.get(annotation)
+
+
+RESPONSES = {
+    name: sample(model)
+    for name, model in vars(response_types).items()
+    if name.endswith("Response") and isinstance(model, type) and issubclass(model, BaseModel)
+}
+
+
+class FakeHighriseServer:
+    """Local stand-in for the Highrise WebAPI.
+
+    Sends session metadata on connect, answers every `*Request` carrying a
+    `rid` with its `*Response` and streams events drawn from `mix` at
+    `event_rate` events/s per connection (`None` means as fast as possible)
+    until `event_limit` events have been sent.
+    """
+
+    host: str
+    port: int
+    event_rate: float | None
+    event_limit: int | None
+    mix: dict[str, tuple[int, Any]]
+    responses: dict[str, dict[str, Any]]
+    latency: float
+    reject_status: int | None
+    _seed: int
+
+    connections: int
+    requests: int
+    received: Counter[str]
+    events: int
+
+    _server: websockets.server.WebSocketServer | None
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        event_rate: float | None = 0,
+        event_limit: int | None = None,
+        mix: dict[str, tuple[int, Any]] | None = None,
+        responses: dict[str, dict[str, Any]] | None = None,
+        latency: float = 0,
+        seed: int = 0
+    ):
+        self.host = host
+        self.port = port
+        self.event_rate = event_rate
+        self.event_limit = event_limit
+        self.mix = mix if mix is not None else FRAMES
+        self.responses = RESPONSES | (responses or {})
+        self.latency = latency
+        # Handshakes are refused with this HTTP status while it is set
+        self.reject_status = None
+        self._seed = seed
+
+        self.connections = 0
+        self.requests = 0
+        self.received = Counter()
+        self.events = 0
+
+        self._server = None
+
+
+    @property
+    def uri(self) -> str:
+        return f"ws://{self.host}:{self.port}"
+
+
+    async def start(self) -> None:
+        self._server = await websockets.server.serve(
+            self._serve, self.host, self.port, process_request=self._process_request
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+
+    async def disconnect(self) -> None:
+        """Drop every open connection, the server keeps accepting new ones."""
+        if self._server is not None:
+            await asyncio.gather(*(websocket.close() for websocket in self._server.websockets))
+
+
+    async def push(self, frame: dict[str, Any]) -> None:
+        """Send `frame` to every open connection, outside the event stream."""
+        if self._server is not None:
+            message = json.dumps(frame)
+            await asyncio.gather(*(websocket.send(message) for websocket in self._server.websockets))
+
+
+    async def __aenter__(self) -> "FakeHighriseServer":
+        await self.start()
+        return self
+
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+
+    async def _process_request(self, path: str, headers: Any) -> tuple | None:
+        if self.reject_status is not None:
+            return http.HTTPStatus(self.reject_status), [], b""
+        return None
+
+
+    async def _serve(self, websocket: websockets.server.WebSocketServerProtocol) -> None:
+        self.connections += 1
+        await websocket.send(json.dumps({
+            "user_id": "0" * 24,
+            "room_info": {"owner_id": "1" * 24, "room_name": "bench"},
+            "rate_limits": {"client": [1000, 1], "socials": [1000, 1]},
+            "connection_id": websocket.id.hex,
+            "sdk_version": None
+        }))
+
+        async with asyncio.TaskGroup() as tg:
+            if self.event_rate != 0:
+                events = tg.create_task(self._stream(websocket))
+            else:
+                events = None
+
+            try:
+                async for message in websocket:
+                    request = json.loads(message)
+                    if "rid" not in request:
+                        continue
+
+                    self.requests += 1
+                    self.received[request["rid"]] += 1
+                    if self.latency:
+                        tg.create_task(self._respond(websocket, request))
+                    else:
+                        await self._respond(websocket, request)
+
+            except websockets.ConnectionClosed:
+                pass
+
+            finally:
+                if events is not None:
+                    events.cancel()
+
+
+    async def _respond(self, websocket: websockets.server.WebSocketServerProtocol, request: dict) -> None:
+        # Every request is tagged with `_type`; a plain `type` is a request
+        # field of its own (SendMessageRequest)
+        name = request["_type"]
+        response = self.responses.get(name.removesuffix("Request") + "Response")
+        if response is None:
+            response = {"_type": "Error", "message": f"Unknown request {name}"}
+
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        try:
+            await websocket.send(json.dumps(response | {"rid": request["rid"]}))
+        except websockets.ConnectionClosed:
+            pass
+
+
+    async def _stream(self, websocket: websockets.server.WebSocketServerProtocol) -> None:
+        rng = random.Random(self._seed)
+        builders = [builder for _, builder in self.mix.values()]
+        weights = [weight for weight, _ in self.mix.values()]
+        counter = range(self.event_limit) if self.event_limit is not None else itertools.count()
+
+        start = time.perf_counter()
+        for n in counter:
+            if self.event_rate is not None:
+                # Paced against the start time so a slow tick catches up
+                delay = start + n / self.event_rate - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            elif n % 256 == 0:
+                await asyncio.sleep(0)
+
+            try:
+                await websocket.send(json.dumps(rng.choices(builders, weights)[0](n)))
+            except websockets.ConnectionClosed:
+                return
+            self.events += 1
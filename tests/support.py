@@ -0,0 +1,47 @@
+from aiorise.api.cache import ResponseCache
+from aiorise.api.client import HighriseWebApiClient
+from aiorise.connection import HighriseWebApiConnection, Priority
+from benchmarks.server import FakeHighriseServer
+
+from typing import AsyncIterator
+
+import asyncio
+import contextlib
+
+
+def make_connection(uri: str, **options) -> HighriseWebApiConnection:
+    # Rate buckets would only slow the tests down
+    options.setdefault("reconnect", False)
+    options.setdefault("rates", {Priority.REQUEST: None, Priority.CHAT: None})
+    return HighriseWebApiConnection(uri, "token", "room", **options)
+
+
+def make_client(
+    uri: str,
+    cache: ResponseCache | None = None,
+    single_flight: bool = False,
+    **options
+) -> HighriseWebApiClient:
+    return HighriseWebApiClient(make_connection(uri, **options), cache=cache, single_flight=single_flight)
+
+
+async def drain(client: HighriseWebApiClient) -> None:
+    # Responses are resolved by whoever reads the socket
+    async for _ in client.listen():
+        pass
+
+
+@contextlib.asynccontextmanager
+async def connected(
+    server: FakeHighriseServer,
+    **options
+) -> AsyncIterator[tuple[HighriseWebApiClient, asyncio.Task]]:
+    """Yields a client connected to `server` and the task reading its socket."""
+    client = make_client(server.uri, **options)
+    await client.connect()
+    reader = asyncio.create_task(drain(client))
+    try:
+        yield client, reader
+    finally:
+        reader.cancel()
+        await client.close()
@@ -0,0 +1,96 @@
+from aiorise.api.cache import ResponseCache
+from benchmarks.bench_events import FRAMES
+from benchmarks.server import FakeHighriseServer
+from .support import connected
+
+import asyncio
+
+
+TIP = FRAMES["TipReactionEvent"][1](0)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+async def invalidated(cache: ResponseCache, method: str, generation: int) -> None:
+    # Events are observed by the reader, give it a moment
+    while cache.generations[method] < generation:
+        await asyncio.sleep(0.01)
+
+
+def test_entries_expire_after_their_ttl():
+    async def scenario():
+        clock = Clock()
+        cache = ResponseCache({"get_wallet": (30, 1)}, clock=clock)
+        async with FakeHighriseServer() as server, connected(server, cache=cache) as (client, _):
+            first = await client.get_wallet()
+            clock.now = 29
+            assert await client.get_wallet() is first
+            assert server.requests == 1
+
+            clock.now = 31
+            assert await client.get_wallet() is not first
+            return server.requests, cache.stats()["get_wallet"]
+
+    requests, stats = asyncio.run(scenario())
+
+    assert requests == 2
+    assert stats == {"hits": 1, "misses": 2, "invalidations": 0, "size": 1}
+
+
+def test_events_invalidate_the_reads_they_make_stale():
+    async def scenario():
+        cache = ResponseCache()
+        async with FakeHighriseServer() as server, connected(server, cache=cache) as (client, _):
+            await client.get_wallet()
+            await client.get_inventory()
+
+            await server.push(TIP)
+            await asyncio.wait_for(invalidated(cache, "get_wallet", 1), 1)
+
+            await client.get_wallet()
+            await client.get_inventory()
+            return server.requests, cache.invalidations
+
+    requests, invalidations = asyncio.run(scenario())
+
+    # The wallet is fetched again, the inventory is untouched by a tip
+    assert requests == 3
+    assert invalidations == {"get_wallet": 1}
+
+
+def test_response_in_flight_during_an_invalidation_is_not_cached():
+    async def scenario():
+        cache = ResponseCache()
+        async with FakeHighriseServer(latency=0.1) as server, connected(server, cache=cache) as (client, _):
+            request = asyncio.create_task(client.get_wallet())
+            await asyncio.sleep(0.02)
+
+            # Answered after the tip, but read before it
+            await server.push(TIP)
+            await asyncio.wait_for(invalidated(cache, "get_wallet", 1), 1)
+            await request
+            size = cache.stats()["get_wallet"]["size"]
+
+            await client.get_wallet()
+            return size, server.requests
+
+    assert asyncio.run(scenario()) == (0, 2)
+
+
+def test_writes_invalidate_the_reads_they_change():
+    async def scenario():
+        cache = ResponseCache()
+        async with FakeHighriseServer() as server, connected(server, cache=cache) as (client, _):
+            await client.get_wallet()
+            await client.buy_item("item")
+            await client.get_wallet()
+            return server.requests
+
+    # Read, write, read again
+    assert asyncio.run(scenario()) == 3
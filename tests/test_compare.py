@@ -0,0 +1,29 @@
+from benchmarks.compare import compare
+from benchmarks.harness import RESULTS, report
+
+import pytest
+
+
+def run(title: str, value: float, unit: str) -> dict:
+    RESULTS.clear()
+    report(title, {"value": value}, unit)
+    return {"benchmarks": dict(RESULTS)}
+
+
+@pytest.mark.parametrize("unit, better, worse", [
+    ("events/s", 110, 80),
+    ("MiB", 90, 120),
+    ("us", 90, 120),
+])
+def test_regressions_follow_the_recorded_direction(unit, better, worse):
+    baseline = run("bench", 100, unit)
+
+    assert compare(baseline, run("bench", better, unit), tolerance=0.1) == []
+    assert compare(baseline, run("bench", worse, unit), tolerance=0.1) == ["bench: value"]
+
+
+def test_runs_without_a_recorded_direction_fall_back_to_the_unit():
+    baseline = {"benchmarks": {"bench": {"unit": "MiB", "results": {"value": 100}}}}
+    current = {"benchmarks": {"bench": {"unit": "MiB", "results": {"value": 120}}}}
+
+    assert compare(baseline, current, tolerance=0.1) == ["bench: value"]
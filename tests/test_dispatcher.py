@@ -0,0 +1,95 @@
+from aiorise.dispatchers.dispatcher import LaneDispatcher, PoolDispatcher
+from aiorise.handlers.handler import Handler
+
+import asyncio
+import logging
+
+
+async def burst(dispatcher: PoolDispatcher, events: int) -> list:
+    handled = []
+    handler = Handler()
+
+    async def slow(e, ctx):
+        await asyncio.sleep(0.001)
+        handled.append(e)
+
+    handler.set_action(slow)
+
+    async with asyncio.TaskGroup() as tg:
+        tg.create_task(dispatcher.run(handler))
+        for n in range(events):
+            await dispatcher.dispatch(n, None)
+        dispatcher.close()
+
+    return handled
+
+
+def test_full_queue_holds_the_reader_back():
+    dispatcher = PoolDispatcher(queue_size=4)
+    handled = asyncio.run(burst(dispatcher, 20))
+
+    assert handled == list(range(20))
+    assert dispatcher.dropped == 0
+
+
+def test_shedding_is_opt_in_and_logged(caplog):
+    dispatcher = PoolDispatcher(queue_size=4, shed_oldest=True)
+    with caplog.at_level(logging.WARNING, "aiorise.dispatchers.dispatcher"):
+        handled = asyncio.run(burst(dispatcher, 20))
+
+    assert dispatcher.dropped == 20 - len(handled) > 0
+    assert handled[-4:] == list(range(16, 20))
+    assert len(caplog.records) == 1
+
+
+class Event:
+    def __init__(self, n: int, user_id: str | None = None):
+        self.n = n
+        self.user_id = user_id if user_id is not None else str(n)
+
+
+def test_lane_backlog_is_capped_under_key_churn():
+    dispatcher = LaneDispatcher(max_lanes=1, max_pending=100)
+
+    async def churn():
+        # Not running yet, so every event waits for a lane
+        for n in range(10_000):
+            await dispatcher.dispatch(Event(n), None)
+
+    asyncio.run(churn())
+
+    assert dispatcher.pending == 100
+    assert dispatcher.dropped == 10_000 - 100
+
+
+def test_full_lane_drops_oldest_and_logs_once(caplog):
+    handled = []
+    dispatcher = LaneDispatcher(queue_size=4)
+
+    async def scenario():
+        release = asyncio.Event()
+        handler = Handler()
+
+        async def blocked(e, ctx):
+            await release.wait()
+            handled.append(e.n)
+
+        handler.set_action(blocked)
+
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(dispatcher.run(handler))
+            await asyncio.sleep(0)
+            for n in range(20):
+                await dispatcher.dispatch(Event(n, "same"), None)
+                # Let the lane pick up the first one
+                await asyncio.sleep(0)
+            release.set()
+            dispatcher.close()
+
+    with caplog.at_level(logging.WARNING, "aiorise.dispatchers.dispatcher"):
+        asyncio.run(scenario())
+
+    # One in the handler, the four newest in the lane
+    assert handled == [0, 16, 17, 18, 19]
+    assert dispatcher.dropped == 15
+    assert len(caplog.records) == 1
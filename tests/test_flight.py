@@ -0,0 +1,36 @@
+from aiorise.api.client import HighriseWebApiClient
+from benchmarks.server import FakeHighriseServer
+from .support import connected
+
+import asyncio
+
+
+async def concurrently(call, count: int) -> tuple[list, FakeHighriseServer, HighriseWebApiClient]:
+    async with FakeHighriseServer(latency=0.05) as server, connected(server, single_flight=True) as (client, _):
+        results = await asyncio.gather(*[call(client) for _ in range(count)])
+    return results, server, client
+
+
+def test_identical_reads_share_one_request():
+    results, server, client = asyncio.run(concurrently(lambda client: client.get_wallet(), 2))
+
+    assert server.requests == 1
+    assert results[0] is results[1]
+    assert client.flight.stats()["get_wallet"] == {"calls": 1, "collapsed": 1}
+
+
+def test_different_arguments_are_not_collapsed():
+    async def privilege(client, users=iter(["a", "b"])):
+        return await client.get_room_privilege(next(users))
+
+    _, server, client = asyncio.run(concurrently(privilege, 2))
+
+    assert server.requests == 2
+    assert client.flight.collapsed["get_room_privilege"] == 0
+
+
+def test_fire_and_forget_requests_are_always_sent():
+    _, server, client = asyncio.run(concurrently(lambda client: client.get_backpack("a"), 2))
+
+    assert server.requests == 2
+    assert not client.flight.calls
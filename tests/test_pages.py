@@ -0,0 +1,97 @@
+from aiorise.api.pages import paginate
+
+import asyncio
+
+import pytest
+
+
+class Endpoint:
+    """Serves items 0..size-1 in pages, keyed by the last item seen."""
+
+    def __init__(self, size: int, page_size: int = 20, stall: bool = False):
+        self.size = size
+        self.page_size = page_size
+        self.cursors = []
+        self.cancelled = 0
+        self._stall = stall
+
+    async def fetch(self, last: str | None) -> list[int]:
+        self.cursors.append(last)
+        try:
+            await asyncio.sleep(3600 if self._stall and len(self.cursors) > 1 else 0.001)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        start = 0 if last is None else int(last) + 1
+        return list(range(start, min(start + self.page_size, self.size)))
+
+    def pages(self, lookahead: int = 1):
+        return paginate(self.fetch, str, lookahead, self.page_size)
+
+
+async def collect(pages) -> list:
+    return [item async for item in pages]
+
+
+@pytest.mark.parametrize("size, cursors", [
+    (45, [None, "19", "39"]),
+    # A full last page needs one more request to find out it was the last
+    (40, [None, "19", "39"]),
+    (0, [None]),
+])
+def test_every_item_is_yielded_following_the_cursor(size, cursors):
+    endpoint = Endpoint(size)
+
+    assert asyncio.run(collect(endpoint.pages())) == list(range(size))
+    assert endpoint.cursors == cursors
+
+
+@pytest.mark.parametrize("lookahead", [1, 3])
+def test_fetches_run_at_most_lookahead_pages_ahead(lookahead):
+    endpoint = Endpoint(1000)
+
+    async def scenario():
+        pages = endpoint.pages(lookahead)
+        await anext(pages)
+        # The consumer sits on the first page while the crawl runs ahead
+        await asyncio.sleep(0.05)
+        fetched = len(endpoint.cursors)
+        await pages.aclose()
+        return fetched
+
+    assert asyncio.run(scenario()) == 1 + lookahead
+
+
+def test_breaking_out_cancels_the_fetch_in_flight():
+    endpoint = Endpoint(1000, stall=True)
+
+    async def scenario():
+        async for _ in endpoint.pages():
+            break
+        await asyncio.sleep(0.01)
+        # Checked before asyncio.run() cancels whatever is left over
+        return endpoint.cancelled
+
+    assert asyncio.run(scenario()) == 1
+    assert endpoint.cursors == [None, "19"]
+
+
+def test_fetch_errors_reach_the_consumer_after_earlier_pages():
+    async def fetch(last: str | None) -> list[int]:
+        if last is not None:
+            raise ConnectionError("lost")
+        return list(range(20))
+
+    async def scenario():
+        seen = []
+        with pytest.raises(ConnectionError):
+            async for item in paginate(fetch, str):
+                seen.append(item)
+        return seen
+
+    assert asyncio.run(scenario()) == list(range(20))
+
+
+def test_lookahead_must_be_positive():
+    with pytest.raises(ValueError):
+        asyncio.run(collect(paginate(Endpoint(1).fetch, str, lookahead=0)))
@@ -0,0 +1,33 @@
+from aiorise.connection.connection import peek
+
+import json
+
+import pytest
+
+
+def decode(frame: str) -> dict:
+    return json.loads(frame)
+
+
+@pytest.mark.parametrize("frame, event_type, response", [
+    ({"_type": "ChatEvent", "user": {"id": "1", "username": "u"}, "message": "hi", "whisper": False}, "ChatEvent", False),
+    ({"rid": "1", "_type": "GetWalletResponse", "content": []}, None, True),
+    # Nested keys coming first in the text must not be mistaken for top-level ones
+    ({"item": {"_type": "Item", "rid": "x"}, "_type": "ChannelEvent"}, "ChannelEvent", False),
+    ({"content": {"_type": "Item"}, "_type": "GetInventoryResponse", "rid": "2"}, None, True),
+    ({"message": 'say "rid": "_type"', "_type": "ChatEvent"}, "ChatEvent", False),
+])
+def test_peek_reads_only_top_level_keys(frame, event_type, response):
+    peeked_type, peeked_response, _ = peek(json.dumps(frame), decode)
+
+    assert peeked_response == response
+    # Responses are routed by rid, their type is not needed
+    assert response or peeked_type == event_type
+
+
+def test_peek_skips_decoding_when_keys_come_first():
+    def refuse(frame: str) -> dict:
+        raise AssertionError("decoded")
+
+    assert peek('{"_type": "UserLeftEvent", "user": {"id": "1"}}', refuse) == ("UserLeftEvent", False, None)
+    assert peek('{"rid": "1", "_type": "Error"}', refuse) == (None, True, None)
@@ -0,0 +1,70 @@
+from aiorise.connection.pending import RequestLimitExceeded
+from benchmarks.server import FakeHighriseServer
+from .support import connected
+
+import asyncio
+
+import pytest
+
+
+async def with_client(scenario, latency: float = 0, **options):
+    async with FakeHighriseServer(latency=latency) as server, connected(server, **options) as (client, _):
+        return await scenario(client)
+
+
+def test_unanswered_request_times_out_and_late_reply_is_orphaned():
+    async def scenario(client):
+        requests = client._connection.requests
+        with pytest.raises(TimeoutError):
+            await client.get_wallet()
+
+        assert len(requests) == 0
+        await asyncio.sleep(0.2)
+        return requests.timeouts, requests.orphans
+
+    assert asyncio.run(with_client(scenario, latency=0.1, request_timeout=0.02)) == (1, 1)
+
+
+def test_awaited_requests_are_bounded():
+    async def scenario(client):
+        first = [asyncio.create_task(client.get_wallet()) for _ in range(2)]
+        await asyncio.sleep(0.01)
+
+        with pytest.raises(RequestLimitExceeded):
+            await client.get_wallet()
+
+        # Answered ones free their slot
+        await asyncio.gather(*first)
+        await client.get_wallet()
+
+    asyncio.run(with_client(scenario, latency=0.05, max_pending=2))
+
+
+def test_cancelled_caller_drops_its_entry():
+    async def scenario(client):
+        requests = client._connection.requests
+        task = asyncio.create_task(client.get_wallet())
+        await asyncio.sleep(0.01)
+        assert len(requests) == 1
+
+        task.cancel()
+        await asyncio.sleep(0)
+        assert len(requests) == 0
+
+        await asyncio.sleep(0.1)
+        return requests.orphans
+
+    assert asyncio.run(with_client(scenario, latency=0.05)) == 1
+
+
+def test_close_fails_waiting_requests():
+    async def scenario(client):
+        task = asyncio.create_task(client.get_wallet())
+        await asyncio.sleep(0.01)
+        await client.close()
+
+        with pytest.raises(ConnectionError):
+            await task
+        return client._connection.requests.failed
+
+    assert asyncio.run(with_client(scenario, latency=0.5)) == 1
@@ -0,0 +1,136 @@
+from aiorise.api import adapters
+from aiorise.events.event_types import ChatEvent, TipReactionEvent, UserJoinedEvent, UserLeftEvent
+from aiorise.events.lazy_event import LazyEvent
+from aiorise.handlers.handler import Handler
+from benchmarks.bench_events import FRAMES
+
+import asyncio
+import random
+
+import pytest
+
+
+EVENT_CLASSES = [ChatEvent, UserJoinedEvent, UserLeftEvent, TipReactionEvent]
+
+
+async def walk(handler: Handler, e, ctx) -> None:
+    """The handler walk as it was before plans, plus the event type check."""
+    if handler._event_types is not None and not isinstance(e, handler._event_types):
+        return
+
+    if handler._filter is None or await handler._filter.check(e, ctx):
+        if handler._action is not None:
+            await handler._action.run(e, ctx)
+
+        async with asyncio.TaskGroup() as tg:
+            for child in handler._children:
+                tg.create_task(walk(child, e, ctx))
+
+
+def random_tree(rng: random.Random, log: list, depth: int = 0, name: str = "root") -> Handler:
+    handler = Handler()
+
+    if rng.random() < 0.3:
+        handler.set_event_types(*rng.sample(EVENT_CLASSES, rng.randint(1, 3)))
+
+    modulus, remainder = rng.randint(2, 3), rng.randrange(2)
+    match rng.choices(["none", "sync", "async"], [2, 2, 1])[0]:
+        case "sync":
+            handler.set_filter(lambda e, ctx: ctx % modulus != remainder)
+        case "async":
+            async def check(e, ctx):
+                await asyncio.sleep(0)
+                return ctx % modulus != remainder
+            handler.set_filter(check)
+
+    match rng.choices(["none", "sync", "async"], [1, 2, 1])[0]:
+        case "sync":
+            handler.set_action(lambda e, ctx: log.append((name, e.__class__.__name__, ctx)))
+        case "async":
+            async def act(e, ctx):
+                await asyncio.sleep(0)
+                log.append((name, e.__class__.__name__, ctx))
+            handler.set_action(act)
+
+    if depth < 3:
+        for n in range(rng.randint(0, 3)):
+            handler.add_child(random_tree(rng, log, depth + 1, f"{name}.{n}"))
+    return handler
+
+
+def events() -> list:
+    return [
+        adapters.event_adapter.validate_python(FRAMES[cls.__name__][1](0))
+        for cls in EVENT_CLASSES
+    ]
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_compiled_plan_runs_the_same_actions_as_the_tree_walk(seed):
+    log = []
+    handler = random_tree(random.Random(seed), log)
+
+    async def scenario(run) -> list:
+        log.clear()
+        for e in events():
+            for ctx in range(6):
+                await run(e, ctx)
+        # Sibling branches run concurrently, only what ran is compared
+        return sorted(log)
+
+    assert asyncio.run(scenario(handler.run)) == asyncio.run(scenario(lambda e, ctx: walk(handler, e, ctx)))
+
+
+def test_events_are_routed_by_subscribed_type():
+    seen = []
+    handler = Handler()
+    handler.on(ChatEvent)(lambda e, ctx: seen.append("chat"))
+    handler.on(UserJoinedEvent, UserLeftEvent)(lambda e, ctx: seen.append("presence"))
+
+    async def scenario():
+        for e in events():
+            await handler.run(e, None)
+
+    asyncio.run(scenario())
+
+    assert seen == ["chat", "presence", "presence"]
+    assert handler.compile().subscriptions == {ChatEvent, UserJoinedEvent, UserLeftEvent}
+    assert handler.accepts(TipReactionEvent)
+    # Nothing under the root wants a tip
+    assert handler.compile()._route(TipReactionEvent) == ((), ())
+
+
+def test_subscriptions_narrow_to_what_reaches_an_action():
+    handler = Handler()
+    presence = Handler()
+    presence.set_event_types(UserJoinedEvent, UserLeftEvent)
+    presence.on(UserJoinedEvent, ChatEvent)(lambda e, ctx: None)
+    handler.add_child(presence)
+
+    assert handler.compile().subscriptions == {UserJoinedEvent}
+
+    # An action at the root takes every event
+    handler.set_action(lambda e, ctx: None)
+    assert handler.compile().subscriptions is None
+
+
+def test_lazy_events_are_routed_without_being_validated():
+    seen = []
+    handler = Handler()
+    handler.on(ChatEvent)(lambda e, ctx: seen.append(e.message))
+    handler.on(UserJoinedEvent)(lambda e, ctx: seen.append(type(e).__name__))
+
+    chat = LazyEvent("ChatEvent", FRAMES["ChatEvent"][1](0))
+    joined = LazyEvent("UserJoinedEvent", FRAMES["UserJoinedEvent"][1](0))
+    left = LazyEvent("UserLeftEvent", FRAMES["UserLeftEvent"][1](0))
+
+    async def scenario():
+        for e in (chat, joined, left):
+            await handler.run(e, None)
+
+    asyncio.run(scenario())
+
+    assert seen == ["hello there", "LazyEvent"]
+    # Only the handler that read a field paid for validation
+    assert chat._event is not None
+    assert joined._event is None and left._event is None
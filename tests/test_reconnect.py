@@ -0,0 +1,129 @@
+from aiorise.connection.backoff import Backoff
+from benchmarks.server import FakeHighriseServer
+from .support import connected
+
+import asyncio
+import itertools
+
+import pytest
+import websockets.exceptions
+
+
+FAST = Backoff(initial=0.01, maximum=0.01)
+
+
+def test_backoff_delays_are_capped_jittered_and_bounded():
+    delays = list(Backoff(initial=0.5, maximum=4, factor=2, attempts=8).delays())
+
+    assert len(delays) == 8
+    assert all(0 <= delay <= min(4, 0.5 * 2 ** n) for n, delay in enumerate(delays))
+    assert len(set(delays)) > 1
+    assert len(list(itertools.islice(Backoff().delays(), 100))) == 100
+
+
+async def drop(server: FakeHighriseServer, client, reject: int | None = None) -> None:
+    await client.get_wallet()
+    server.reject_status = reject
+    await server.disconnect()
+
+
+def test_dropped_socket_is_reopened():
+    async def scenario():
+        async with FakeHighriseServer() as server, connected(server, reconnect=True, backoff=FAST) as (client, _):
+            await drop(server, client)
+
+            # Answered over the new socket
+            await asyncio.wait_for(client.get_wallet(), 5)
+            assert server.connections == 2
+            assert client._connection.reconnects == 1
+
+    asyncio.run(scenario())
+
+
+def test_server_errors_are_retried():
+    async def scenario():
+        async with FakeHighriseServer() as server, connected(server, reconnect=True, backoff=FAST) as (client, reader):
+            await drop(server, client, reject=503)
+
+            await asyncio.sleep(0.1)
+            assert not reader.done()
+            server.reject_status = None
+
+            await asyncio.wait_for(client.get_wallet(), 5)
+            assert client._connection.reconnects == 1
+
+    asyncio.run(scenario())
+
+
+def test_rejected_handshake_is_fatal():
+    async def scenario():
+        async with FakeHighriseServer() as server, connected(server, reconnect=True, backoff=FAST) as (client, reader):
+            await drop(server, client, reject=401)
+
+            with pytest.raises(websockets.exceptions.InvalidStatusCode) as error:
+                await asyncio.wait_for(reader, 5)
+            assert error.value.status_code == 401
+            assert client._connection.reconnects == 0
+
+    asyncio.run(scenario())
+
+
+def test_giving_up_raises_connection_error():
+    async def scenario():
+        backoff = Backoff(0.01, 0.01, attempts=3)
+        async with FakeHighriseServer() as server, connected(server, reconnect=True, backoff=backoff) as (client, reader):
+            await drop(server, client, reject=503)
+            waiting = asyncio.create_task(client.get_wallet())
+
+            with pytest.raises(ConnectionError):
+                await asyncio.wait_for(reader, 5)
+            # Queued for a socket that will never come back
+            with pytest.raises(ConnectionError):
+                await asyncio.wait_for(waiting, 1)
+
+    asyncio.run(scenario())
+
+
+def test_requests_do_not_outwait_their_deadline_while_reconnecting():
+    async def scenario():
+        options = dict(reconnect=True, backoff=FAST, request_timeout=0.2)
+        async with FakeHighriseServer() as server, connected(server, **options) as (client, _):
+            await drop(server, client, reject=503)
+
+            request = asyncio.create_task(client.get_wallet())
+            done, _ = await asyncio.wait([request], timeout=1)
+            assert done
+            with pytest.raises(TimeoutError):
+                await request
+            # Never written, so the server is not blamed for it
+            return client._connection.window.limit
+
+    assert asyncio.run(scenario()) >= 8
+
+
+@pytest.mark.parametrize("policy, resent", [("fail", 0), ("resend", 3)])
+def test_only_written_requests_are_resent(policy, resent):
+    async def scenario():
+        options = dict(reconnect=True, backoff=FAST, pending_policy=policy)
+        async with FakeHighriseServer(latency=0.1) as server, connected(server, **options) as (client, _):
+            # Written to the socket that is about to drop, never answered
+            written = [asyncio.create_task(client.get_wallet()) for _ in range(3)]
+            await asyncio.sleep(0.02)
+            server.reject_status = 503
+            await server.disconnect()
+
+            # Issued while reconnecting, still queued when the socket comes back
+            await asyncio.sleep(0.05)
+            queued = [asyncio.create_task(client.get_wallet()) for _ in range(3)]
+            await asyncio.sleep(0.05)
+            server.reject_status = None
+
+            results = await asyncio.wait_for(asyncio.gather(*written, *queued, return_exceptions=True), 5)
+            return results, server.received
+
+    results, received = asyncio.run(scenario())
+
+    assert sum(isinstance(result, ConnectionError) for result in results) == 3 - resent
+    assert not any(isinstance(result, Exception) for result in results[3:])
+    # The resent ones arrive on both sockets, everything else exactly once
+    assert sorted(received.values()) == [1] * (6 - resent) + [2] * resent
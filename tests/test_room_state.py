@@ -0,0 +1,47 @@
+from aiorise.bot.bot import Bot
+from aiorise.handlers.handler import Handler
+from aiorise.state import RoomState
+from benchmarks.bench_events import FRAMES, position, user
+from benchmarks.server import FakeHighriseServer
+from .support import make_client
+
+import asyncio
+
+
+JOINS = {"UserJoinedEvent": FRAMES["UserJoinedEvent"]}
+
+
+async def run_until_closed(responses: dict) -> tuple[RoomState, list]:
+    seen = []
+    room = RoomState(resync_interval=0.05)
+    room._retry_delay = 0.01
+    handler = Handler()
+    handler.set_action(lambda e, ctx: seen.append(ctx.room))
+
+    async with FakeHighriseServer(event_rate=200, event_limit=10, mix=JOINS, responses=responses) as server:
+        bot = Bot(make_client(server.uri), handler, room=room)
+        task = asyncio.create_task(bot.start())
+        await asyncio.sleep(0.2)
+        await server.close()
+        await asyncio.wait_for(task, 2)
+
+    return room, seen
+
+
+def test_mirror_is_seeded_and_follows_events():
+    snapshot = {"_type": "GetRoomUsersResponse", "content": [[user(n), position(n)] for n in range(100, 103)]}
+    room, seen = asyncio.run(run_until_closed({"GetRoomUsersResponse": snapshot}))
+
+    assert len(seen) == 10 and all(ctx_room is room for ctx_room in seen)
+    assert room.resyncs > 0
+    assert {f"{n:024x}" for n in range(100, 103)} <= room.users.keys()
+
+
+def test_failed_sync_does_not_crash_the_bot():
+    error = {"_type": "Error", "message": "nope"}
+    room, seen = asyncio.run(run_until_closed({"GetRoomUsersResponse": error}))
+
+    # Every event still reached the handlers and the mirror
+    assert len(seen) == 10
+    assert room.resyncs == 0
+    assert len(room) == 10
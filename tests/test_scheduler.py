@@ -0,0 +1,111 @@
+from aiorise.connection.scheduler import OutboundScheduler, Priority, TokenBucket
+
+import asyncio
+
+import pytest
+
+
+UNLIMITED = {priority: None for priority in Priority}
+
+
+class Socket:
+    """Records written frames, optionally stalled until released."""
+
+    def __init__(self, stalled: bool = False):
+        self.frames = []
+        self.open = asyncio.Event()
+        if not stalled:
+            self.open.set()
+
+    async def write(self, frame: str) -> None:
+        await self.open.wait()
+        self.frames.append(frame)
+
+
+@pytest.mark.parametrize("rate, burst", [(0, 1), (-1, 1), (1, 0)])
+def test_bucket_rejects_rates_that_never_refill(rate, burst):
+    with pytest.raises(ValueError):
+        TokenBucket(rate, burst)
+
+
+def test_higher_priority_is_written_first():
+    async def scenario():
+        socket = Socket(stalled=True)
+        scheduler = OutboundScheduler(socket.write, UNLIMITED)
+
+        futures = [
+            scheduler.submit(f"{priority.name}-{n}", priority)
+            for n in range(2) for priority in reversed(Priority)
+        ]
+        await asyncio.sleep(0)
+        socket.open.set()
+        await asyncio.gather(*futures)
+        scheduler.close()
+        return socket.frames
+
+    frames = asyncio.run(scenario())
+
+    assert frames == [
+        f"{priority.name}-{n}" for priority in Priority for n in range(2)
+    ]
+
+
+def test_rate_limited_class_does_not_block_others():
+    async def scenario():
+        socket = Socket()
+        scheduler = OutboundScheduler(socket.write, UNLIMITED | {Priority.CHAT: (20, 1)})
+
+        chats = [scheduler.submit(f"chat-{n}", Priority.CHAT) for n in range(5)]
+        await asyncio.gather(*(scheduler.send(f"request-{n}") for n in range(50)))
+        throttled = sum(not chat.done() for chat in chats)
+
+        await asyncio.gather(*chats)
+        scheduler.close()
+        return throttled, socket.frames
+
+    throttled, frames = asyncio.run(scenario())
+
+    # One burst token, the other chats wait for a refill while requests flow
+    assert throttled == 4
+    assert frames.index("request-49") < frames.index("chat-1")
+    assert [frame for frame in frames if frame.startswith("chat")] == [f"chat-{n}" for n in range(5)]
+
+
+def test_full_queue_applies_backpressure():
+    async def scenario():
+        socket = Socket(stalled=True)
+        scheduler = OutboundScheduler(socket.write, UNLIMITED, max_queued=4)
+
+        senders = [asyncio.create_task(scheduler.send(f"frame-{n}")) for n in range(10)]
+        await asyncio.sleep(0.05)
+        # One frame is being written, four queued, the rest wait
+        queued = scheduler.queued(Priority.REQUEST)
+        waiting = sum(not sender.done() for sender in senders)
+
+        socket.open.set()
+        await asyncio.gather(*senders)
+        scheduler.close()
+        return queued, waiting, socket.frames
+
+    queued, waiting, frames = asyncio.run(scenario())
+
+    assert queued == 4
+    assert waiting == 10
+    assert sorted(frames) == sorted(f"frame-{n}" for n in range(10))
+
+
+def test_close_fails_the_frame_being_written():
+    async def scenario():
+        socket = Socket(stalled=True)
+        scheduler = OutboundScheduler(socket.write, UNLIMITED)
+
+        sender = asyncio.create_task(scheduler.send("frame"))
+        await asyncio.sleep(0.01)
+        # Already taken off the queue, stuck on the socket
+        assert scheduler.queued(Priority.REQUEST) == 0
+
+        scheduler.close()
+        with pytest.raises(ConnectionError):
+            await asyncio.wait_for(sender, 1)
+
+    asyncio.run(scenario())
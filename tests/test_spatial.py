@@ -0,0 +1,78 @@
+from aiorise.objects.object_types import AnchorPosition, Position
+from aiorise.state import SpatialIndex
+
+import math
+import random
+
+import pytest
+
+
+class Linear:
+    """Reference model: every query is a scan over every user."""
+
+    def __init__(self):
+        self.points = {}
+        self.anchors = {}
+
+    def update(self, user_id, position):
+        self.remove(user_id)
+        if isinstance(position, AnchorPosition):
+            anchor = (position.entity_id, position.anchor_ix)
+            self.anchors.pop(anchor, None)
+            self.anchors[anchor] = user_id
+        else:
+            self.points[user_id] = (position.x, position.z)
+
+    def remove(self, user_id):
+        self.points.pop(user_id, None)
+        self.anchors = {anchor: occupant for anchor, occupant in self.anchors.items() if occupant != user_id}
+
+    def distances(self, x, z):
+        return sorted(math.hypot(ux - x, uz - z) for ux, uz in self.points.values())
+
+    def within(self, x, z, radius):
+        return {user_id for user_id, (ux, uz) in self.points.items() if math.hypot(ux - x, uz - z) <= radius}
+
+
+@pytest.mark.parametrize("seed, cell_size", [(0, 2.0), (1, 0.5), (2, 7.0)])
+def test_queries_match_a_linear_scan(seed, cell_size):
+    rng = random.Random(seed)
+    index, model = SpatialIndex(cell_size), Linear()
+    users = [f"user-{n}" for n in range(60)]
+
+    for step in range(2000):
+        user_id = rng.choice(users)
+        roll = rng.random()
+        if roll < 0.1:
+            index.remove(user_id)
+            model.remove(user_id)
+        else:
+            if roll < 0.2:
+                position = AnchorPosition(entity_id=f"seat-{rng.randrange(3)}", anchor_ix=rng.randrange(3))
+            else:
+                # Mostly small moves, sometimes across the whole room
+                x, z = model.points.get(user_id, (0, 0))
+                spread = 30 if roll > 0.9 else 1.5
+                position = Position(x=x + rng.uniform(-spread, spread), y=0, z=z + rng.uniform(-spread, spread))
+            index.update(user_id, position)
+            model.update(user_id, position)
+
+        if step % 20:
+            continue
+
+        x, z = rng.uniform(-40, 40), rng.uniform(-40, 40)
+        radius = rng.choice([0.5, 3, 10, 100])
+        k = rng.choice([1, 3, 10, 100])
+
+        found = index.within(x, z, radius)
+        assert {user_id for user_id, _ in found} == model.within(x, z, radius)
+        assert [distance for _, distance in found] == sorted(distance for _, distance in found)
+
+        nearest = index.nearest(x, z, k)
+        assert [distance for _, distance in nearest] == pytest.approx(model.distances(x, z)[:k])
+        assert all(user_id in model.points for user_id, _ in nearest)
+
+        assert dict(index.anchors) == model.anchors
+        assert all(index.occupant(*anchor) == user_id for anchor, user_id in model.anchors.items())
+        assert len(index) == len(model.points) + len(model.anchors)
+        assert all(user_id in index for user_id in list(model.points) + list(model.anchors.values()))
@@ -0,0 +1,54 @@
+from aiorise.api.client import HighriseWebApiClient
+from aiorise.events.event_types import ChatEvent, UserMovedEvent
+from aiorise.handlers.handler import Handler
+from aiorise.structs import event_types as structs
+from benchmarks.bench_events import FRAMES
+from benchmarks.server import FakeHighriseServer
+from .support import make_connection
+
+import asyncio
+
+
+def routed(events: list) -> tuple[list, list]:
+    chats, moves = [], []
+    root = Handler()
+    root.on(ChatEvent)(lambda e, ctx: chats.append(e))
+    root.on(structs.UserMovedEvent)(lambda e, ctx: moves.append(e))
+
+    async def run():
+        for e in events:
+            await root.run(e, None)
+
+    asyncio.run(run())
+    return chats, moves
+
+
+def test_structs_reach_handlers_declared_with_models():
+    async def receive() -> list:
+        mix = {name: FRAMES[name] for name in ("ChatEvent", "UserMovedEvent")}
+        async with FakeHighriseServer(event_rate=None, event_limit=50, mix=mix) as server:
+            client = HighriseWebApiClient(make_connection(server.uri), models="msgspec")
+            await client.connect()
+
+            events = []
+            async for e in client.listen():
+                events.append(e)
+                if len(events) == 50:
+                    break
+
+            await client.close()
+            return events
+
+    events = asyncio.run(receive())
+    chats, moves = routed(events)
+
+    assert all(isinstance(e, (structs.ChatEvent, structs.UserMovedEvent)) for e in events)
+    assert len(chats) + len(moves) == len(events) == 50
+    assert all(isinstance(e, structs.ChatEvent) for e in chats)
+
+
+def test_models_reach_handlers_declared_with_structs():
+    move = UserMovedEvent.model_validate(FRAMES["UserMovedEvent"][1](1))
+    chats, moves = routed([move])
+
+    assert moves == [move] and not chats
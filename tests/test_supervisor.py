@@ -0,0 +1,114 @@
+from aiorise.bot.pool import BotPool
+from aiorise.bot.supervisor import HashRing, Supervisor
+from aiorise.connection.backoff import Backoff
+from aiorise.handlers.handler import Handler
+from benchmarks.server import FakeHighriseServer
+from .support import make_client
+
+import asyncio
+import functools
+import multiprocessing
+import time
+
+
+ROOMS = [f"room-{n}" for n in range(6)]
+
+
+# Workers are spawned, so everything they run has to be importable
+def pool_factory() -> BotPool:
+    return BotPool(Handler())
+
+
+def crashing_pool_factory() -> BotPool:
+    raise RuntimeError("worker failed at start-up")
+
+
+def second_worker_crashing_pool_factory() -> BotPool:
+    if multiprocessing.current_process().name == "aiorise-worker-1":
+        raise RuntimeError("worker failed at start-up")
+    return BotPool(Handler())
+
+
+def client_factory(uri: str, room_id: str):
+    return make_client(uri)
+
+
+async def wait_for(condition, timeout: float = 30) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met in time"
+        await asyncio.sleep(0.05)
+
+
+def test_hash_ring_moves_only_the_removed_nodes_keys():
+    ring = HashRing(["0", "1", "2"])
+    before = {key: ring.node_for(key) for key in map(str, range(1000))}
+
+    ring.remove("2")
+    after = {key: ring.node_for(key) for key in before}
+
+    assert all(after[key] == node for key, node in before.items() if node != "2")
+    assert set(after.values()) == {"0", "1"}
+
+
+def test_workers_serve_every_room_and_rebalance():
+    async def scenario():
+        async with FakeHighriseServer() as server:
+            supervisor = Supervisor(
+                pool_factory, functools.partial(client_factory, server.uri), ROOMS,
+                workers=2, stats_interval=0.1, poll_interval=0.05
+            )
+            runner = asyncio.create_task(supervisor.run())
+
+            await wait_for(lambda: server.connections == len(ROOMS))
+            await wait_for(lambda: len(supervisor.stats) == 2)
+
+            moved = supervisor.assignments[1]
+            assert moved
+            await supervisor.remove_worker(1)
+            assert supervisor.assignments == {0: ROOMS}
+            # Only the removed worker's rooms reconnect, from the survivor
+            await wait_for(lambda: server.connections == len(ROOMS) + len(moved))
+
+            await supervisor.stop()
+            await asyncio.wait_for(runner, 5)
+            assert not supervisor.restarts
+
+    asyncio.run(scenario())
+
+
+def test_crash_looping_worker_backs_off_and_gives_up():
+    async def scenario():
+        supervisor = Supervisor(
+            crashing_pool_factory, functools.partial(client_factory, "ws://127.0.0.1:1"), ROOMS,
+            workers=1, poll_interval=0.05, backoff=Backoff(initial=0.1, maximum=0.1, attempts=2)
+        )
+        runner = asyncio.create_task(supervisor.run())
+
+        await wait_for(lambda: supervisor.failed == {0})
+        assert supervisor.restarts[0] == 2
+
+        await supervisor.stop()
+        await asyncio.wait_for(runner, 5)
+
+    asyncio.run(scenario())
+
+
+def test_given_up_workers_rooms_move_to_live_workers():
+    async def scenario():
+        async with FakeHighriseServer() as server:
+            supervisor = Supervisor(
+                second_worker_crashing_pool_factory, functools.partial(client_factory, server.uri), ROOMS,
+                workers=2, poll_interval=0.05, backoff=Backoff(initial=0.1, maximum=0.1, attempts=1)
+            )
+            runner = asyncio.create_task(supervisor.run())
+
+            await wait_for(lambda: supervisor.failed == {1})
+            assert supervisor.assignments == {0: ROOMS, 1: []}
+            await wait_for(lambda: server.connections == len(ROOMS))
+
+            await supervisor.stop()
+            await asyncio.wait_for(runner, 5)
+            assert not supervisor.restarts[0]
+
+    asyncio.run(scenario())
@@ -0,0 +1,108 @@
+from aiorise.connection.scheduler import Priority
+from aiorise.connection.window import RequestWindow
+from benchmarks.server import FakeHighriseServer
+from .support import connected
+
+import asyncio
+
+
+def test_fast_responses_grow_the_window_additively():
+    async def scenario():
+        window = RequestWindow(initial=4, max_limit=8)
+        limits = []
+        for _ in range(5):
+            await window.acquire()
+            window.release(0.01)
+            limits.append(window.limit)
+        return limits
+
+    # About one slot per window's worth of fast responses
+    assert asyncio.run(scenario()) == [4, 4, 4, 4, 5]
+
+
+def test_growth_is_capped():
+    async def scenario():
+        window = RequestWindow(initial=4, max_limit=6)
+        for _ in range(200):
+            await window.acquire()
+            window.release(0.01)
+        return window.limit
+
+    assert asyncio.run(scenario()) == 6
+
+
+def test_slow_responses_halve_the_window_once_per_round_trip():
+    async def scenario():
+        window = RequestWindow(initial=16, tolerance=2.0)
+        await window.acquire()
+        window.release(0.01)
+
+        # A burst of slow replies to the same window only counts once
+        for _ in range(5):
+            await window.acquire()
+            window.release(0.1)
+        return window.limit
+
+    assert asyncio.run(scenario()) == 8
+
+
+def test_window_never_shrinks_below_its_minimum():
+    window = RequestWindow(initial=4, min_limit=2)
+    for _ in range(10):
+        window._last_decrease = 0
+        window.backoff()
+
+    assert window.limit == 2
+
+
+def test_cancelled_waiter_gives_up_its_place():
+    async def scenario():
+        window = RequestWindow(initial=1, min_limit=1)
+        await window.acquire()
+        waiter = asyncio.create_task(window.acquire())
+        await asyncio.sleep(0)
+        assert window.waiting == 1
+
+        waiter.cancel()
+        await asyncio.sleep(0)
+        window.release()
+        return window.waiting, window.in_flight
+
+    assert asyncio.run(scenario()) == (0, 0)
+
+
+def test_window_limits_requests_in_flight():
+    async def scenario():
+        window = RequestWindow(initial=2, min_limit=1, max_limit=2)
+        async with FakeHighriseServer(latency=0.05) as server, connected(server, window=window) as (client, _):
+            peak = 0
+
+            async def request():
+                nonlocal peak
+                await client.get_wallet()
+                peak = max(peak, window.in_flight)
+
+            requests = [asyncio.create_task(request()) for _ in range(10)]
+            await asyncio.sleep(0.01)
+            held = window.waiting
+            await asyncio.gather(*requests)
+            return peak, held, server.requests
+
+    peak, held, sent = asyncio.run(scenario())
+
+    assert peak <= 2
+    # Two go out, the rest wait for a slot instead of failing
+    assert held == 8
+    assert sent == 10
+
+
+def test_local_rate_limits_do_not_shrink_the_window():
+    async def scenario():
+        window = RequestWindow(initial=8)
+        # Replies take a steady 20ms, only the wait for a chat token varies
+        rates = {Priority.REQUEST: None, Priority.CHAT: (50, 5)}
+        async with FakeHighriseServer(latency=0.02) as server, connected(server, window=window, rates=rates) as (client, _):
+            await asyncio.gather(*(client.emote("emote-hello") for _ in range(30)))
+            return window.limit
+
+    assert asyncio.run(scenario()) >= 8